@@ -901,6 +901,9 @@ class StreamUnaryMultiCallable(abc.ABC):
 
         Args:
           request_iterator: An iterator that yields request values for the RPC.
+            EXPERIMENTAL: If None, the returned object also has write(request)
+            and done_writing() methods with which the application sends the
+            requests itself, and no thread is started to consume them.
           timeout: An optional duration of time in seconds to allow for
             the RPC. If None, the timeout is considered infinite.
           metadata: Optional :term:`metadata` to be transmitted to the
@@ -938,6 +941,9 @@ class StreamStreamMultiCallable(abc.ABC):
 
         Args:
           request_iterator: An iterator that yields request values for the RPC.
+            EXPERIMENTAL: If None, the returned object also has write(request)
+            and done_writing() methods with which the application sends the
+            requests itself, and no thread is started to consume them.
           timeout: An optional duration of time in seconds to allow for
             the RPC. If not specified, the timeout is considered infinite.
           metadata: Optional :term:`metadata` to be transmitted to the
@@ -13,10 +13,12 @@
 # limitations under the License.
 """Invocation-side implementation of gRPC Python."""
 
+import collections
 import copy
 import functools
 import logging
 import os
+import queue
 import sys
 import threading
 import time
@@ -24,6 +26,7 @@ import types
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterator,
     List,
@@ -46,6 +49,7 @@ from grpc._typing import IntegratedCallFactory
 from grpc._typing import MetadataType
 from grpc._typing import NullaryCallbackType
 from grpc._typing import ResponseType
+from grpc._typing import SerializedMessageType
 from grpc._typing import SerializingFunction
 from grpc._typing import UserTag
 import grpc.experimental  # pytype: disable=pyi-error
@@ -62,6 +66,16 @@ _DEFAULT_SINGLE_THREADED_UNARY_STREAM = (
     os.getenv("GRPC_SINGLE_THREADED_UNARY_STREAM") is not None
 )
 
+# Zero means each channel spins up its own thread while it has calls.
+_DEFAULT_SHARED_SPIN_THREADS = 0
+
+_DEFAULT_REQUEST_SEND_WINDOW = 1
+
+_CONNECTIVITY_DELIVERY_WORKERS = 4
+# Bounds how long a watch outlives the subscriptions of a channel that is
+# neither closed nor changes state.
+_CONNECTIVITY_WATCH_TIMEOUT_S = 60.0
+
 _UNARY_UNARY_INITIAL_DUE = (
     cygrpc.OperationType.send_initial_metadata,
     cygrpc.OperationType.send_message,
@@ -134,6 +148,8 @@ class _RPCState(object):
     rpc_end_time: Optional[float]  # In relative seconds
     method: Optional[str]
     target: Optional[str]
+    pending_requests: Deque[SerializedMessageType]
+    request_sender: Optional[Callable[[SerializedMessageType], bool]]
 
     def __init__(
         self,
@@ -175,6 +191,12 @@ class _RPCState(object):
         self.callbacks = []
         self.fork_epoch = cygrpc.get_fork_epoch()
 
+        # Serialized requests waiting for the send of the request before them
+        # to complete, and the behavior with which to send them. Core only
+        # allows one SendMessage operation per call at a time.
+        self.pending_requests = collections.deque()
+        self.request_sender = None
+
     def reset_postfork_child(self):
         self.condition = threading.Condition()
 
@@ -188,6 +210,13 @@ def _abort(state: _RPCState, code: grpc.StatusCode, details: str) -> None:
         state.trailing_metadata = ()
 
 
+def _requests_in_flight(state: _RPCState) -> int:
+    if cygrpc.OperationType.send_message in state.due:
+        return len(state.pending_requests) + 1
+    else:
+        return len(state.pending_requests)
+
+
 def _handle_event(
     event: cygrpc.BaseEvent,
     state: _RPCState,
@@ -199,8 +228,14 @@ def _handle_event(
         state.due.remove(operation_type)
         if operation_type == cygrpc.OperationType.receive_initial_metadata:
             state.initial_metadata = batch_operation.initial_metadata()
+        elif operation_type == cygrpc.OperationType.send_message:
+            if state.pending_requests and state.code is None:
+                if not state.request_sender(state.pending_requests.popleft()):
+                    state.pending_requests.clear()
         elif operation_type == cygrpc.OperationType.receive_message:
-            serialized_response = batch_operation.message()
+            serialized_response = _common.received_message(
+                batch_operation, response_deserializer
+            )
             if serialized_response is not None:
                 response = _common.deserialize(
                     serialized_response, response_deserializer
@@ -256,14 +291,86 @@ def _event_handler(
 
 # TODO(xuanwn): Create a base class for IntegratedCall and SegregatedCall.
 # pylint: disable=too-many-statements
+def _send_request(
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    event_handler: Optional[UserTag],
+    serialized_request: SerializedMessageType,
+) -> bool:
+    # Must be called with state.condition held.
+    state.due.add(cygrpc.OperationType.send_message)
+    operations = (
+        cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+    )
+    operating = call.operate(operations, event_handler)
+    if not operating:
+        state.due.remove(cygrpc.OperationType.send_message)
+    return operating
+
+
+def _queue_or_send_request(
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    event_handler: Optional[UserTag],
+    serialized_request: SerializedMessageType,
+    send_window: int,
+) -> bool:
+    """Hands a request to the RPC and waits until its send window has room.
+
+    Up to send_window serialized requests may be in flight at a time: one is
+    being sent by Core and the others are sent, in order, as the send before
+    each of them completes.
+
+    Must be called with state.condition held. Returns False if the request
+    could not be sent.
+    """
+    if _requests_in_flight(state):
+        state.pending_requests.append(serialized_request)
+    elif not _send_request(state, call, event_handler, serialized_request):
+        return False
+    _wait_for_requests_in_flight(state, send_window)
+    return True
+
+
+def _wait_for_requests_in_flight(state: _RPCState, limit: int) -> None:
+    def _done():
+        return state.code is not None or _requests_in_flight(state) < limit
+
+    _common.wait(
+        state.condition.wait,
+        _done,
+        spin_cb=functools.partial(cygrpc.block_if_fork_in_progress, state),
+    )
+
+
+def _send_close_from_client(
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    event_handler: Optional[UserTag],
+) -> None:
+    # Must be called with state.condition held. Half-closes only once every
+    # request has been handed to Core.
+    _wait_for_requests_in_flight(state, 1)
+    if state.code is None:
+        state.due.add(cygrpc.OperationType.send_close_from_client)
+        operations = (cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),)
+        operating = call.operate(operations, event_handler)
+        if not operating:
+            state.due.remove(cygrpc.OperationType.send_close_from_client)
+
+
 def _consume_request_iterator(
     request_iterator: Iterator,
     state: _RPCState,
     call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
     request_serializer: SerializingFunction,
     event_handler: Optional[UserTag],
+    send_window: int = _DEFAULT_REQUEST_SEND_WINDOW,
 ) -> None:
-    """Consume a request supplied by the user."""
+    """Consume a request supplied by the user.
+
+    The iterator is only blocked on once send_window requests are in flight.
+    """
 
     def consume_request_iterator():  # pylint: disable=too-many-branches
         # Iterate over the request iterator until it is exhausted or an error
@@ -302,48 +409,25 @@ def _consume_request_iterator(
                         )
                         _abort(state, code, details)
                         return
-                    else:
-                        state.due.add(cygrpc.OperationType.send_message)
-                        operations = (
-                            cygrpc.SendMessageOperation(
-                                serialized_request, _EMPTY_FLAGS
-                            ),
-                        )
-                        operating = call.operate(operations, event_handler)
-                        if not operating:
-                            state.due.remove(cygrpc.OperationType.send_message)
-                            return
-
-                        def _done():
-                            return (
-                                state.code is not None
-                                or cygrpc.OperationType.send_message
-                                not in state.due
-                            )
-
-                        _common.wait(
-                            state.condition.wait,
-                            _done,
-                            spin_cb=functools.partial(
-                                cygrpc.block_if_fork_in_progress, state
-                            ),
-                        )
-                        if state.code is not None:
-                            return
+                    elif not _queue_or_send_request(
+                        state,
+                        call,
+                        event_handler,
+                        serialized_request,
+                        send_window,
+                    ):
+                        return
+                    if state.code is not None:
+                        return
                 else:
                     return
         with state.condition:
-            if state.code is None:
-                state.due.add(cygrpc.OperationType.send_close_from_client)
-                operations = (
-                    cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
-                )
-                operating = call.operate(operations, event_handler)
-                if not operating:
-                    state.due.remove(
-                        cygrpc.OperationType.send_close_from_client
-                    )
+            _send_close_from_client(state, call, event_handler)
 
+    with state.condition:
+        state.request_sender = functools.partial(
+            _send_request, state, call, event_handler
+        )
     consumption_thread = cygrpc.ForkManagedThread(
         target=consume_request_iterator
     )
@@ -969,6 +1053,91 @@ class _MultiThreadedRendezvous(
                     raise self
 
 
+class _RequestWritingRendezvous(
+    _MultiThreadedRendezvous
+):  # pylint: disable=too-many-ancestors
+    """An RPC whose requests are written by the application.
+
+    Returned by the stream-unary future and stream-stream invocations when no
+    request iterator is given, so that no thread is needed to consume one.
+    Requests are sent from the thread calling write.
+    """
+
+    _request_serializer: Optional[SerializingFunction]
+    _event_handler: UserTag
+    _send_window: int
+    _writing_done: bool
+
+    def __init__(
+        self,
+        state: _RPCState,
+        call: cygrpc.IntegratedCall,
+        response_deserializer: Optional[DeserializingFunction],
+        deadline: Optional[float],
+        request_serializer: Optional[SerializingFunction],
+        event_handler: UserTag,
+        send_window: int,
+    ):
+        super(_RequestWritingRendezvous, self).__init__(
+            state, call, response_deserializer, deadline
+        )
+        self._request_serializer = request_serializer
+        self._event_handler = event_handler
+        self._send_window = send_window
+        self._writing_done = False
+        with state.condition:
+            state.request_sender = functools.partial(
+                _send_request, state, call, event_handler
+            )
+
+    def write(self, request: Any) -> None:
+        """Sends a request to the server.
+
+        Blocks only while the send window of the channel is full.
+
+        Raises:
+          ValueError: If done_writing has been called or the RPC has already
+            completed successfully.
+          grpc.RpcError: If the RPC has failed.
+        """
+        serialized_request = _common.serialize(
+            request, self._request_serializer
+        )
+        with self._state.condition:
+            if self._writing_done:
+                raise ValueError("write() called after done_writing()!")
+            if self._state.code is None:
+                if serialized_request is None:
+                    code = grpc.StatusCode.INTERNAL
+                    details = "Exception serializing request!"
+                    self._call.cancel(
+                        _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code],
+                        details,
+                    )
+                    _abort(self._state, code, details)
+                else:
+                    _queue_or_send_request(
+                        self._state,
+                        self._call,
+                        self._event_handler,
+                        serialized_request,
+                        self._send_window,
+                    )
+            if self._state.code is grpc.StatusCode.OK:
+                raise ValueError("The RPC has already completed!")
+            elif self._state.code is not None:
+                raise self
+
+    def done_writing(self) -> None:
+        """Tells the server that no more requests will be written."""
+        with self._state.condition:
+            if not self._writing_done:
+                self._writing_done = True
+                _send_close_from_client(
+                    self._state, self._call, self._event_handler
+                )
+
+
 def _start_unary_request(
     request: Any,
     timeout: Optional[float],
@@ -1437,6 +1606,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _request_send_window: int
 
     __slots__ = [
         "_channel",
@@ -1446,6 +1616,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         "_request_serializer",
         "_response_deserializer",
         "_context",
+        "_request_send_window",
     ]
 
     # pylint: disable=too-many-arguments
@@ -1458,6 +1629,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         request_serializer: Optional[SerializingFunction],
         response_deserializer: Optional[DeserializingFunction],
         _registered_call_handle: Optional[int],
+        request_send_window: int = _DEFAULT_REQUEST_SEND_WINDOW,
     ):
         self._channel = channel
         self._managed_call = managed_call
@@ -1467,6 +1639,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._request_send_window = request_send_window
 
     def _blocking(
         self,
@@ -1502,7 +1675,12 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             self._registered_call_handle,
         )
         _consume_request_iterator(
-            request_iterator, state, call, self._request_serializer, None
+            request_iterator,
+            state,
+            call,
+            self._request_serializer,
+            None,
+            self._request_send_window,
         )
         while True:
             event = call.next_event()
@@ -1559,7 +1737,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
 
     def future(
         self,
-        request_iterator: Iterator,
+        request_iterator: Optional[Iterator] = None,
         timeout: Optional[float] = None,
         metadata: Optional[MetadataType] = None,
         credentials: Optional[grpc.CallCredentials] = None,
@@ -1592,12 +1770,23 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             self._context,
             self._registered_call_handle,
         )
+        if request_iterator is None:
+            return _RequestWritingRendezvous(
+                state,
+                call,
+                self._response_deserializer,
+                deadline,
+                self._request_serializer,
+                event_handler,
+                self._request_send_window,
+            )
         _consume_request_iterator(
             request_iterator,
             state,
             call,
             self._request_serializer,
             event_handler,
+            self._request_send_window,
         )
         return _MultiThreadedRendezvous(
             state, call, self._response_deserializer, deadline
@@ -1613,6 +1802,7 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
     _response_deserializer: Optional[DeserializingFunction]
     _context: Any
     _registered_call_handle: Optional[int]
+    _request_send_window: int
 
     __slots__ = [
         "_channel",
@@ -1622,6 +1812,7 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         "_request_serializer",
         "_response_deserializer",
         "_context",
+        "_request_send_window",
     ]
 
     # pylint: disable=too-many-arguments
@@ -1634,6 +1825,7 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         request_serializer: Optional[SerializingFunction],
         response_deserializer: Optional[DeserializingFunction],
         _registered_call_handle: Optional[int],
+        request_send_window: int = _DEFAULT_REQUEST_SEND_WINDOW,
     ):
         self._channel = channel
         self._managed_call = managed_call
@@ -1643,10 +1835,11 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
         self._response_deserializer = response_deserializer
         self._context = cygrpc.build_census_context()
         self._registered_call_handle = _registered_call_handle
+        self._request_send_window = request_send_window
 
     def __call__(
         self,
-        request_iterator: Iterator,
+        request_iterator: Optional[Iterator] = None,
         timeout: Optional[float] = None,
         metadata: Optional[MetadataType] = None,
         credentials: Optional[grpc.CallCredentials] = None,
@@ -1686,12 +1879,23 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
             self._context,
             self._registered_call_handle,
         )
+        if request_iterator is None:
+            return _RequestWritingRendezvous(
+                state,
+                call,
+                self._response_deserializer,
+                deadline,
+                self._request_serializer,
+                event_handler,
+                self._request_send_window,
+            )
         _consume_request_iterator(
             request_iterator,
             state,
             call,
             self._request_serializer,
             event_handler,
+            self._request_send_window,
         )
         return _MultiThreadedRendezvous(
             state, call, self._response_deserializer, deadline
@@ -1725,12 +1929,16 @@ class _ChannelCallState(object):
     channel: cygrpc.Channel
     managed_calls: int
     threading: bool
+    shared_spin_threads: bool
 
-    def __init__(self, channel: cygrpc.Channel):
+    def __init__(
+        self, channel: cygrpc.Channel, shared_spin_threads: bool = False
+    ):
         self.lock = threading.Lock()
         self.channel = channel
         self.managed_calls = 0
         self.threading = False
+        self.shared_spin_threads = shared_spin_threads
 
     def reset_postfork_child(self) -> None:
         self.managed_calls = 0
@@ -1763,6 +1971,69 @@ def _run_channel_spin_thread(state: _ChannelCallState) -> None:
     channel_spin_thread.start()
 
 
+def _spin_shared_completion_queue(
+    completion_queue: cygrpc.CompletionQueue,
+) -> None:
+    while True:
+        event = cygrpc.next_integrated_call_event(completion_queue)
+        if event.completion_type == cygrpc.CompletionType.queue_timeout:
+            continue
+        try:
+            event.tag(event)
+        except Exception:  # pylint: disable=broad-except
+            # The thread serves the calls of other channels too.
+            _LOGGER.exception("Exception in a shared channel spin thread!")
+
+
+class _SpinThreadPool(object):
+    """Threads spinning completion queues shared by many channels.
+
+    The threads are started as channels get assigned to the pool and keep
+    running for the lifetime of the process.
+    """
+
+    _lock: threading.Lock
+    _size: int
+    _completion_queues: List[cygrpc.CompletionQueue]
+    _next_index: int
+
+    def __init__(self, size: int):
+        self._lock = threading.Lock()
+        self._size = size
+        self._completion_queues = []
+        self._next_index = 0
+
+    def completion_queue(self) -> cygrpc.CompletionQueue:
+        """Assigns the completion queue for the integrated calls of a channel."""
+        with self._lock:
+            if len(self._completion_queues) < self._size:
+                completion_queue = cygrpc.CompletionQueue()
+                spin_thread = cygrpc.ForkManagedThread(
+                    target=_spin_shared_completion_queue,
+                    args=(completion_queue,),
+                )
+                spin_thread.setDaemon(True)
+                spin_thread.start()
+                self._completion_queues.append(completion_queue)
+                return completion_queue
+            completion_queue = self._completion_queues[self._next_index]
+            self._next_index = (self._next_index + 1) % self._size
+            return completion_queue
+
+
+_SPIN_THREAD_POOLS_LOCK = threading.Lock()
+_SPIN_THREAD_POOLS: Dict[int, _SpinThreadPool] = {}
+
+
+def _spin_thread_pool(size: int) -> _SpinThreadPool:
+    with _SPIN_THREAD_POOLS_LOCK:
+        pool = _SPIN_THREAD_POOLS.get(size)
+        if pool is None:
+            pool = _SpinThreadPool(size)
+            _SPIN_THREAD_POOLS[size] = pool
+        return pool
+
+
 def _channel_managed_call_management(state: _ChannelCallState):
     # pylint: disable=too-many-arguments
     def create(
@@ -1816,6 +2087,8 @@ def _channel_managed_call_management(state: _ChannelCallState):
                 context,
                 _registered_call_handle,
             )
+            if state.shared_spin_threads:
+                return call
             if state.managed_calls == 0:
                 state.managed_calls = 1
                 _run_channel_spin_thread(state)
@@ -1829,6 +2102,7 @@ def _channel_managed_call_management(state: _ChannelCallState):
 class _ChannelConnectivityState(object):
     lock: threading.RLock
     channel: grpc.Channel
+    watcher: Optional["_ConnectivityWatcher"]
     polling: bool
     connectivity: grpc.ChannelConnectivity
     try_to_connect: bool
@@ -1846,6 +2120,7 @@ class _ChannelConnectivityState(object):
     def __init__(self, channel: grpc.Channel):
         self.lock = threading.RLock()
         self.channel = channel
+        self.watcher = None
         self.polling = False
         self.connectivity = None
         self.try_to_connect = False
@@ -1904,16 +2179,19 @@ def _spawn_delivery(
     state: _ChannelConnectivityState,
     callbacks: Sequence[Callable[[grpc.ChannelConnectivity], None]],
 ) -> None:
-    delivering_thread = cygrpc.ForkManagedThread(
-        target=_deliver,
-        args=(
-            state,
-            state.connectivity,
-            callbacks,
-        ),
-    )
-    delivering_thread.setDaemon(True)
-    delivering_thread.start()
+    if state.watcher is not None:
+        state.watcher.deliver(_deliver, state, state.connectivity, callbacks)
+    else:
+        delivering_thread = cygrpc.ForkManagedThread(
+            target=_deliver,
+            args=(
+                state,
+                state.connectivity,
+                callbacks,
+            ),
+        )
+        delivering_thread.setDaemon(True)
+        delivering_thread.start()
     state.delivering = True
 
 
@@ -1967,13 +2245,138 @@ def _poll_connectivity(
                         _spawn_delivery(state, callbacks)
 
 
+def _watch_connectivity(
+    state: _ChannelConnectivityState, try_to_connect: bool
+) -> None:
+    """Records the connectivity of a channel and watches for its change.
+
+    Called with the lock of state held.
+    """
+    try:
+        connectivity = state.channel.check_connectivity_state(try_to_connect)
+        state.watcher.watch(state, connectivity)
+    except ValueError:
+        # The channel was closed, so its connectivity no longer changes.
+        state.polling = False
+        state.connectivity = None
+        return
+    state.polling = True
+    state.connectivity = (
+        _common.CYGRPC_CONNECTIVITY_STATE_TO_CHANNEL_CONNECTIVITY[connectivity]
+    )
+
+
+def _on_connectivity_changed(state: _ChannelConnectivityState) -> None:
+    with state.lock:
+        if not state.callbacks_and_connectivities:
+            state.polling = False
+            state.connectivity = None
+            return
+        _watch_connectivity(state, False)
+        if not state.delivering:
+            callbacks = _deliveries(state)
+            if callbacks:
+                _spawn_delivery(state, callbacks)
+
+
+class _ConnectivityWatcher(object):
+    """Watches the connectivity of all subscribed channels of the process.
+
+    The watches of all channels complete on one completion queue, drained by
+    a single thread that blocks until the state of some channel changes.
+    Callbacks are delivered by a shared set of daemon threads, each channel's
+    in order. The threads are started by the first subscription and kept for
+    the lifetime of the process.
+    """
+
+    _completion_queue: cygrpc.CompletionQueue
+    _deliveries: queue.SimpleQueue
+
+    def __init__(self):
+        self._completion_queue = cygrpc.CompletionQueue()
+        self._deliveries = queue.SimpleQueue()
+        for _ in range(_CONNECTIVITY_DELIVERY_WORKERS):
+            delivering_thread = cygrpc.ForkManagedThread(
+                target=self._deliver_callbacks
+            )
+            delivering_thread.setDaemon(True)
+            delivering_thread.start()
+        watching_thread = cygrpc.ForkManagedThread(
+            target=self._watch_completions
+        )
+        watching_thread.setDaemon(True)
+        watching_thread.start()
+
+    def watch(
+        self, state: _ChannelConnectivityState, connectivity: int
+    ) -> None:
+        state.channel.watch_connectivity_state_on(
+            connectivity,
+            time.time() + _CONNECTIVITY_WATCH_TIMEOUT_S,
+            self._completion_queue,
+            state,
+        )
+
+    def deliver(self, behavior: Callable, *args: Any) -> None:
+        self._deliveries.put((behavior, args))
+
+    def _deliver_callbacks(self) -> None:
+        while True:
+            behavior, args = self._deliveries.get()
+            try:
+                behavior(*args)
+            except Exception:  # pylint: disable=broad-except
+                # The thread delivers the callbacks of others too.
+                _LOGGER.exception("Exception delivering channel connectivity!")
+
+    def _watch_completions(self) -> None:
+        while True:
+            event = self._completion_queue.poll()
+            if event.completion_type == cygrpc.CompletionType.queue_timeout:
+                continue
+            try:
+                _on_connectivity_changed(event.tag)
+            except Exception:  # pylint: disable=broad-except
+                # The thread watches the channels of others too.
+                _LOGGER.exception("Exception watching channel connectivity!")
+
+
+_CONNECTIVITY_WATCHER_LOCK = threading.Lock()
+_CONNECTIVITY_WATCHER: Optional[_ConnectivityWatcher] = None
+
+
+def _connectivity_watcher() -> _ConnectivityWatcher:
+    global _CONNECTIVITY_WATCHER  # pylint: disable=global-statement
+    with _CONNECTIVITY_WATCHER_LOCK:
+        if _CONNECTIVITY_WATCHER is None:
+            _CONNECTIVITY_WATCHER = _ConnectivityWatcher()
+        return _CONNECTIVITY_WATCHER
+
+
 def _subscribe(
     state: _ChannelConnectivityState,
     callback: Callable[[grpc.ChannelConnectivity], None],
     try_to_connect: bool,
 ) -> None:
     with state.lock:
-        if not state.callbacks_and_connectivities and not state.polling:
+        # Like the shared spin threads, the shared watcher never pauses for
+        # fork(), so channels poll their connectivity on threads of their own
+        # when fork support is enabled.
+        if state.watcher is None and not cygrpc.is_fork_support_enabled():
+            state.watcher = _connectivity_watcher()
+        if state.watcher is not None:
+            if not state.polling:
+                _watch_connectivity(state, bool(try_to_connect))
+            elif try_to_connect:
+                # A change of connectivity completes the pending watch.
+                try:
+                    state.channel.check_connectivity_state(True)
+                except ValueError:
+                    pass
+            state.callbacks_and_connectivities.append([callback, None])
+            if not state.delivering and state.connectivity is not None:
+                _spawn_delivery(state, _deliveries(state))
+        elif not state.callbacks_and_connectivities and not state.polling:
             polling_thread = cygrpc.ForkManagedThread(
                 target=_poll_connectivity,
                 args=(state, state.channel, bool(try_to_connect)),
@@ -2030,9 +2433,10 @@ def _separate_channel_options(
     core_options = []
     python_options = []
     for pair in options:
-        if (
-            pair[0]
-            == grpc.experimental.ChannelOptions.SingleThreadedUnaryStream
+        if pair[0] in (
+            grpc.experimental.ChannelOptions.SingleThreadedUnaryStream,
+            grpc.experimental.ChannelOptions.SharedSpinThreads,
+            grpc.experimental.ChannelOptions.RequestSendWindow,
         ):
             python_options.append(pair)
         else:
@@ -2044,6 +2448,7 @@ class Channel(grpc.Channel):
     """A cygrpc.Channel-backed implementation of grpc.Channel."""
 
     _single_threaded_unary_stream: bool
+    _request_send_window: int
     _channel: cygrpc.Channel
     _call_state: _ChannelCallState
     _connectivity_state: _ChannelConnectivityState
@@ -2071,13 +2476,34 @@ class Channel(grpc.Channel):
             _DEFAULT_SINGLE_THREADED_UNARY_STREAM
         )
         self._process_python_options(python_options)
+        self._request_send_window = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ChannelOptions.RequestSendWindow,
+            _DEFAULT_REQUEST_SEND_WINDOW,
+        )
+        shared_spin_threads = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ChannelOptions.SharedSpinThreads,
+            _DEFAULT_SHARED_SPIN_THREADS,
+        )
+        # The shared threads never pause for fork(), so the option is ignored
+        # when fork support is enabled.
+        if shared_spin_threads and not cygrpc.is_fork_support_enabled():
+            call_completion_queue = _spin_thread_pool(
+                shared_spin_threads
+            ).completion_queue()
+        else:
+            call_completion_queue = None
         self._channel = cygrpc.Channel(
             _common.encode(target),
             _augment_options(core_options, compression),
             credentials,
+            call_completion_queue,
         )
         self._target = target
-        self._call_state = _ChannelCallState(self._channel)
+        self._call_state = _ChannelCallState(
+            self._channel, call_completion_queue is not None
+        )
         self._connectivity_state = _ChannelConnectivityState(self._channel)
         cygrpc.fork_register_channel(self)
         if cygrpc.g_gevent_activated:
@@ -2197,6 +2623,7 @@ class Channel(grpc.Channel):
             request_serializer,
             response_deserializer,
             _registered_call_handle,
+            self._request_send_window,
         )
 
     # pylint: disable=arguments-differ
@@ -2218,6 +2645,7 @@ class Channel(grpc.Channel):
             request_serializer,
             response_deserializer,
             _registered_call_handle,
+            self._request_send_window,
         )
 
     def _unsubscribe_all(self) -> None:
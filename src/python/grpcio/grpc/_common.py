@@ -15,11 +15,13 @@
 
 import logging
 import time
-from typing import Any, AnyStr, Callable, Optional, Union
+from typing import Any, AnyStr, Callable, Optional, Sequence, Union
 
 import grpc
 from grpc._cython import cygrpc
+from grpc._typing import ChannelArgumentType
 from grpc._typing import DeserializingFunction
+from grpc._typing import SerializedMessageType
 from grpc._typing import SerializingFunction
 
 _LOGGER = logging.getLogger(__name__)
@@ -92,18 +94,50 @@ def _transform(
             return None
 
 
-def serialize(message: Any, serializer: Optional[SerializingFunction]) -> bytes:
+def serialize(
+    message: Any, serializer: Optional[SerializingFunction]
+) -> SerializedMessageType:
     return _transform(message, serializer, "Exception serializing message!")
 
 
 def deserialize(
-    serialized_message: bytes, deserializer: Optional[DeserializingFunction]
+    serialized_message: Union[bytes, memoryview],
+    deserializer: Optional[DeserializingFunction],
 ) -> Any:
     return _transform(
         serialized_message, deserializer, "Exception deserializing message!"
     )
 
 
+def received_message(
+    receive_message_operation: cygrpc.ReceiveMessageOperation,
+    deserializer: Optional[DeserializingFunction],
+) -> Optional[Union[bytes, memoryview]]:
+    if getattr(deserializer, "experimental_zero_copy", False):
+        return receive_message_operation.message_view()
+    return receive_message_operation.message()
+
+
+def positive_int_python_option(
+    python_options: Sequence[ChannelArgumentType], key: str, default: int
+) -> int:
+    result = default
+    for option_key, value in python_options:
+        if option_key == key:
+            if (
+                not isinstance(value, int)
+                or isinstance(value, bool)
+                or value < 1
+            ):
+                raise ValueError(
+                    "{} must be a positive integer, got {!r}.".format(
+                        key, value
+                    )
+                )
+            result = value
+    return result
+
+
 def fully_qualified_method(group: str, method: str) -> str:
     return "/{}/{}".format(group, method)
 
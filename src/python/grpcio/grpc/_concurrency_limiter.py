@@ -0,0 +1,301 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Limiters of the number of RPCs a server handles concurrently."""
+
+import abc
+import math
+import threading
+from typing import Optional, Sequence
+
+from grpc._typing import ChannelArgumentType
+
+_DEFAULT_INITIAL_LIMIT = 20
+_DEFAULT_MIN_LIMIT = 1
+_DEFAULT_MAX_LIMIT = 1000
+
+
+class ConcurrencyLimiter(abc.ABC):
+    """Decides whether a server admits each RPC it accepts.
+
+    A limiter is consulted once a server found the handler of an accepted
+    RPC and decided to handle it, before the RPC is handed to the thread
+    pool of a server or handled on the event loop of a grpc.aio server. RPCs
+    it rejects fail with RESOURCE_EXHAUSTED. Implementations must be
+    thread-safe and must not block.
+
+    This is an EXPERIMENTAL API.
+    """
+
+    @abc.abstractmethod
+    def acquire(self) -> bool:
+        """Claims a slot for an RPC being accepted.
+
+        Returns:
+          Whether the RPC is admitted. Every admitted RPC is later passed to
+          either release or discard.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def release(self, latency: float, queueing_delay: float) -> None:
+        """Returns the slot of an admitted RPC once its handler returned.
+
+        Args:
+          latency: The number of seconds the handler of the RPC ran for.
+          queueing_delay: The number of seconds the RPC waited between being
+            admitted and its handler starting.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def discard(self) -> None:
+        """Returns the slot of an admitted RPC that was never handled.
+
+        The RPC was cancelled or its deadline passed before its handler
+        started, so it says nothing about the load of the server.
+        """
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def limit(self) -> int:
+        """The number of RPCs currently allowed to be handled concurrently."""
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def rejected_count(self) -> int:
+        """The number of RPCs rejected so far."""
+        raise NotImplementedError()
+
+
+class _AdaptiveConcurrencyLimiter(ConcurrencyLimiter):
+    """A limiter whose limit is updated by each released RPC."""
+
+    _lock: threading.Lock
+    _limit: float
+    _min_limit: int
+    _max_limit: int
+    _in_flight: int
+    _rejected_count: int
+
+    def __init__(self, initial_limit: int, min_limit: int, max_limit: int):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Expected 1 <= min_limit <= initial_limit <= max_limit, got"
+                " {}, {} and {}.".format(min_limit, initial_limit, max_limit)
+            )
+        self._lock = threading.Lock()
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._in_flight = 0
+        self._rejected_count = 0
+
+    @abc.abstractmethod
+    def _next_limit(
+        self,
+        limit: float,
+        in_flight: int,
+        latency: float,
+        queueing_delay: float,
+    ) -> float:
+        """Computes the limit following an RPC released at in_flight RPCs.
+
+        Called with the lock of the limiter held.
+        """
+        raise NotImplementedError()
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self._in_flight >= int(self._limit):
+                self._rejected_count += 1
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, latency: float, queueing_delay: float) -> None:
+        with self._lock:
+            limit = self._next_limit(
+                self._limit, self._in_flight, latency, queueing_delay
+            )
+            self._limit = min(max(limit, self._min_limit), self._max_limit)
+            self._in_flight -= 1
+
+    def discard(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of admitted RPCs not yet released."""
+        return self._in_flight
+
+    @property
+    def rejected_count(self) -> int:
+        return self._rejected_count
+
+
+class GradientConcurrencyLimiter(_AdaptiveConcurrencyLimiter):
+    """Follows the ratio of the long-term to the recent time spent per RPC.
+
+    The time spent by an RPC is its queueing delay plus its handler latency.
+    While it stays within tolerance of its long-term average the limit grows
+    by roughly its square root per RPC, and as it rises above that the limit
+    shrinks in proportion, by at most half.
+
+    This is an EXPERIMENTAL API.
+
+    Args:
+      initial_limit: The limit before any RPC was released.
+      min_limit: The lowest the limit may shrink to.
+      max_limit: The highest the limit may grow to.
+      smoothing: The weight, between 0 and 1, of each update of the limit.
+      tolerance: How many times its long-term average the time spent by an
+        RPC may be before the limit shrinks.
+      long_window: The number of RPCs the long-term average spans.
+    """
+
+    _smoothing: float
+    _tolerance: float
+    _long_window: int
+    _long_time_spent: Optional[float]
+
+    def __init__(
+        self,
+        initial_limit: int = _DEFAULT_INITIAL_LIMIT,
+        min_limit: int = _DEFAULT_MIN_LIMIT,
+        max_limit: int = _DEFAULT_MAX_LIMIT,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 600,
+    ):
+        super().__init__(initial_limit, min_limit, max_limit)
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1].")
+        if tolerance < 1:
+            raise ValueError("tolerance must be at least 1.")
+        if long_window < 1:
+            raise ValueError("long_window must be positive.")
+        self._smoothing = smoothing
+        self._tolerance = tolerance
+        self._long_window = long_window
+        self._long_time_spent = None
+
+    def _next_limit(
+        self,
+        limit: float,
+        in_flight: int,
+        latency: float,
+        queueing_delay: float,
+    ) -> float:
+        time_spent = latency + queueing_delay
+        if time_spent <= 0:
+            return limit
+        if self._long_time_spent is None:
+            self._long_time_spent = time_spent
+        else:
+            self._long_time_spent += (
+                time_spent - self._long_time_spent
+            ) / self._long_window
+            # Lets the average recover quickly once an overload is over.
+            if self._long_time_spent > 2 * time_spent:
+                self._long_time_spent *= 0.95
+        # The limit only grows while it is actually being used.
+        if in_flight < limit / 2:
+            return limit
+        gradient = max(
+            0.5,
+            min(1.0, self._tolerance * self._long_time_spent / time_spent),
+        )
+        new_limit = limit * gradient + math.sqrt(limit)
+        return limit * (1 - self._smoothing) + new_limit * self._smoothing
+
+
+class AimdConcurrencyLimiter(_AdaptiveConcurrencyLimiter):
+    """Grows the limit additively and shrinks it multiplicatively.
+
+    Each RPC released within both thresholds grows the limit by one, as long
+    as at least half of it is in use. Each RPC exceeding either threshold
+    multiplies the limit by the backoff ratio.
+
+    This is an EXPERIMENTAL API.
+
+    Args:
+      initial_limit: The limit before any RPC was released.
+      min_limit: The lowest the limit may shrink to.
+      max_limit: The highest the limit may grow to.
+      latency_threshold: The number of seconds a handler may run for before
+        the limit shrinks.
+      queueing_delay_threshold: The number of seconds an RPC may wait for its
+        handler to start before the limit shrinks.
+      backoff_ratio: The factor, between 0 and 1, the limit shrinks by.
+    """
+
+    _latency_threshold: float
+    _queueing_delay_threshold: float
+    _backoff_ratio: float
+
+    def __init__(
+        self,
+        initial_limit: int = _DEFAULT_INITIAL_LIMIT,
+        min_limit: int = _DEFAULT_MIN_LIMIT,
+        max_limit: int = _DEFAULT_MAX_LIMIT,
+        latency_threshold: float = 1.0,
+        queueing_delay_threshold: float = 0.1,
+        backoff_ratio: float = 0.9,
+    ):
+        super().__init__(initial_limit, min_limit, max_limit)
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be in (0, 1).")
+        self._latency_threshold = latency_threshold
+        self._queueing_delay_threshold = queueing_delay_threshold
+        self._backoff_ratio = backoff_ratio
+
+    def _next_limit(
+        self,
+        limit: float,
+        in_flight: int,
+        latency: float,
+        queueing_delay: float,
+    ) -> float:
+        if (
+            latency > self._latency_threshold
+            or queueing_delay > self._queueing_delay_threshold
+        ):
+            return limit * self._backoff_ratio
+        elif in_flight >= limit / 2:
+            return limit + 1
+        else:
+            return limit
+
+
+def concurrency_limiter_python_option(
+    python_options: Sequence[ChannelArgumentType], key: str
+) -> Optional[ConcurrencyLimiter]:
+    limiter = None
+    for option_key, value in python_options:
+        if option_key == key:
+            if not isinstance(value, ConcurrencyLimiter):
+                raise ValueError(
+                    "{} must be a ConcurrencyLimiter, got {!r}.".format(
+                        key, value
+                    )
+                )
+            limiter = value
+    return limiter
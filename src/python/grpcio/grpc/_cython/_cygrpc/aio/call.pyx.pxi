@@ -117,7 +117,7 @@ cdef class _AioCall(GrpcCallWrapper):
             self._channel.channel,
             NULL,
             _EMPTY_MASK,
-            global_completion_queue(),
+            loop_completion_queue(self._loop),
             method_slice,
             NULL,
             c_deadline,
@@ -294,15 +294,19 @@ cdef class _AioCall(GrpcCallWrapper):
         ))
 
     async def unary_unary(self,
-                          bytes request,
+                          object request,
                           tuple outbound_initial_metadata,
-                          object context = None):
+                          object context = None,
+                          object response_deserializer = None):
         """Performs a unary unary RPC.
 
         Args:
-          request: the serialized requests in bytes.
+          request: the serialized request, as bytes or any other object
+            exporting the buffer protocol.
           outbound_initial_metadata: optional outbound metadata.
           context: instrumentation context.
+          response_deserializer: the deserializer the response will be
+            handed to, which decides whether it is returned as a memoryview.
         """
         cdef tuple ops
 
@@ -340,7 +344,7 @@ cdef class _AioCall(GrpcCallWrapper):
         ))
 
         if code == StatusCode.ok:
-            return receive_message_op.message()
+            return _received_message(receive_message_op, response_deserializer)
         else:
             return None
 
@@ -361,9 +365,10 @@ cdef class _AioCall(GrpcCallWrapper):
             op.error_string(),
         ))
 
-    async def receive_serialized_message(self):
-        """Receives one single raw message in bytes."""
-        cdef bytes received_message
+    async def receive_serialized_message(self,
+                                         object response_deserializer = None):
+        """Receives one single raw message in bytes or a memoryview."""
+        cdef object received_message
 
         # Receives a message. Returns None when failed:
         # * EOF, no more messages to read;
@@ -371,15 +376,16 @@ cdef class _AioCall(GrpcCallWrapper):
         # * The server sends final status.
         received_message = await _receive_message(
             self,
-            self._loop
+            self._loop,
+            response_deserializer
         )
         if received_message is not None:
             return received_message
         else:
             return EOF
 
-    async def send_serialized_message(self, bytes message):
-        """Sends one single raw message in bytes."""
+    async def send_serialized_message(self, object message):
+        """Sends one single raw message in bytes or a buffer object."""
         await _send_message(self,
                             message,
                             None,
@@ -393,7 +399,7 @@ cdef class _AioCall(GrpcCallWrapper):
         await execute_batch(self, ops, self._loop)
 
     async def initiate_unary_stream(self,
-                           bytes request,
+                           object request,
                            tuple outbound_initial_metadata,
                            object context = None):
         """Implementation of the start of a unary-stream call."""
@@ -437,7 +443,8 @@ cdef class _AioCall(GrpcCallWrapper):
     async def stream_unary(self,
                            tuple outbound_initial_metadata,
                            object metadata_sent_observer,
-                           object context = None):
+                           object context = None,
+                           object response_deserializer = None):
         """Actual implementation of the complete unary-stream call.
 
         Needs to pay extra attention to the raise mechanism. If we want to
@@ -489,7 +496,7 @@ cdef class _AioCall(GrpcCallWrapper):
         ))
 
         if code == StatusCode.ok:
-            return receive_message_op.message()
+            return _received_message(receive_message_op, response_deserializer)
         else:
             return None
 
@@ -112,8 +112,18 @@ cdef prepend_send_initial_metadata_op(tuple ops, tuple metadata):
     ),) + ops
 
 
+cdef object _received_message(ReceiveMessageOperation receive_op,
+                              object deserializer):
+    # Deserializers marked by grpc.experimental.zero_copy_deserializer are
+    # handed a memoryview over the received message instead of bytes.
+    if getattr(deserializer, 'experimental_zero_copy', False):
+        return receive_op.message_view()
+    return receive_op.message()
+
+
 async def _receive_message(GrpcCallWrapper grpc_call_wrapper,
-                           object loop):
+                           object loop,
+                           object deserializer=None):
     """Retrieves parsed messages from Core.
 
     The messages maybe already in Core's buffer, so there isn't a 1-to-1
@@ -133,11 +143,11 @@ async def _receive_message(GrpcCallWrapper grpc_call_wrapper,
         _LOGGER.debug('Failed to receive any message from Core')
     # NOTE(lidiz) The returned message might be an empty bytes (aka. b'').
     # Please explicitly check if it is None or falsey string object!
-    return receive_op.message()
+    return _received_message(receive_op, deserializer)
 
 
 async def _send_message(GrpcCallWrapper grpc_call_wrapper,
-                        bytes message,
+                        object message,
                         Operation send_initial_metadata_op,
                         int write_flag,
                         object loop):
@@ -33,6 +33,7 @@ cdef class AioChannel:
         cdef _ChannelArgs channel_args = _ChannelArgs(options)
         self._target = target
         self.loop = loop
+        acquire_loop_completion_queue(loop)
         self._status = AIO_CHANNEL_STATUS_READY
 
         if credentials is None:
@@ -51,6 +52,9 @@ cdef class AioChannel:
             grpc_channel_credentials_release(creds)
 
     def __dealloc__(self):
+        # The queue of an open channel may still get its events.
+        if self.loop is not None and self._status == AIO_CHANNEL_STATUS_DESTROYED:
+            release_loop_completion_queue(self.loop)
         shutdown_grpc_aio()
 
     def __repr__(self):
@@ -90,7 +94,7 @@ cdef class AioChannel:
             self.channel,
             last_observed_state,
             c_deadline,
-            global_completion_queue(),
+            loop_completion_queue(self.loop),
             wrapper.c_functor())
 
         try:
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import threading
 import warnings
 
 from cpython.version cimport PY_MAJOR_VERSION, PY_MINOR_VERSION
@@ -32,7 +34,7 @@ cdef grpc_status_code get_status_code(object code) except *:
             return StatusCode.unknown
 
 
-cdef object deserialize(object deserializer, bytes raw_message):
+cdef object deserialize(object deserializer, object raw_message):
     """Perform deserialization on raw bytes.
 
     Failure to deserialize is a fatal error.
@@ -43,10 +45,11 @@ cdef object deserialize(object deserializer, bytes raw_message):
         return raw_message
 
 
-cdef bytes serialize(object serializer, object message):
+cdef object serialize(object serializer, object message):
     """Perform serialization on a message.
 
-    Failure to serialize is a fatal error.
+    The serialized message may be bytes or any other object exporting the
+    buffer protocol. Failure to serialize is a fatal error.
     """
     if isinstance(message, str):
         message = message.encode('utf-8')
@@ -138,8 +141,14 @@ def async_generator_to_generator(object agen, object loop):
         pass
 
 
-async def generator_to_async_generator(object gen, object loop, object thread_pool):
-    """Converts a generator into async generator.
+def _wake_up(object waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def generator_to_async_batches(object gen, object loop, object thread_pool,
+                                     int high_water_mark=1):
+    """Converts a generator into async generator of lists of its items.
 
     The generator might block, so we need to delegate the iteration to thread
     pool. Also, we can't simply delegate __next__ to the thread pool, otherwise
@@ -147,27 +156,64 @@ async def generator_to_async_generator(object gen, object loop, object thread_po
 
         TypeError: StopIteration interacts badly with generators and cannot be
             raised into a Future
-    """
-    queue = asyncio.Queue(maxsize=1)
 
-    def yield_to_queue():
+    Instead of handing items over one at a time, the thread appends them to a
+    buffer, wakes the event loop up only when it is waiting for items, and
+    blocks only once high_water_mark items are buffered. Each yielded list
+    holds all the items buffered since the previous one.
+    """
+    items = collections.deque()
+    condition = threading.Condition()
+    waiter = None
+    exhausted = False
+    closed = False
+
+    def wake_up_loop():
+        nonlocal waiter
+        if waiter is not None:
+            loop.call_soon_threadsafe(_wake_up, waiter)
+            waiter = None
+
+    def yield_to_buffer():
+        nonlocal exhausted
         try:
             for item in gen:
-                asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+                with condition:
+                    while len(items) >= high_water_mark and not closed:
+                        condition.wait()
+                    if closed:
+                        return
+                    items.append(item)
+                    wake_up_loop()
         finally:
-            asyncio.run_coroutine_threadsafe(queue.put(EOF), loop).result()
+            with condition:
+                exhausted = True
+                wake_up_loop()
 
     future = loop.run_in_executor(
         thread_pool,
-        yield_to_queue,
+        yield_to_buffer,
     )
 
-    while True:
-        response = await queue.get()
-        if response is EOF:
-            break
-        else:
-            yield response
+    try:
+        while True:
+            with condition:
+                batch = list(items)
+                items.clear()
+                condition.notify()
+                if not batch:
+                    if exhausted:
+                        break
+                    waiter = ready = loop.create_future()
+            if batch:
+                yield batch
+            else:
+                await ready
+    finally:
+        # Unblocks the thread if the batches are no longer consumed.
+        with condition:
+            closed = True
+            condition.notify()
 
     # Port the exception if there is any
     await future
@@ -23,6 +23,13 @@ IF UNAME_SYSNAME == "Windows":
         int win_socket_send "send" (WIN_SOCKET s, const char *buf, int len, int flags)
 
 
+IF UNAME_SYSNAME == "Linux":
+    cdef extern from "sys/eventfd.h" nogil:
+        int EFD_CLOEXEC
+        int EFD_NONBLOCK
+        int eventfd(unsigned int initval, int flags)
+
+
 cdef void _unified_socket_write(int fd) noexcept nogil
 
 
@@ -34,7 +41,7 @@ cdef class BaseCompletionQueue:
 
 cdef class _BoundEventLoop:
     cdef readonly object loop
-    cdef readonly object read_socket  # socket.socket
+    cdef readonly object read_fd  # socket.socket or file descriptor
     cdef bint _has_reader
 
 
@@ -44,9 +51,16 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
     cdef mutex _queue_mutex
     cdef object _poller_thread  # threading.Thread
     cdef int _write_fd
+    cdef object _read_fd        # socket.socket or file descriptor
     cdef object _read_socket    # socket.socket
     cdef object _write_socket   # socket.socket
     cdef dict _loops            # Mapping[asyncio.AbstractLoop, _BoundEventLoop]
+    # Guarded by _queue_mutex
+    cdef uint64_t _events
+    cdef uint64_t _wakeups
+    cdef uint64_t _drains
 
     cdef void _poll(self) nogil
+    cdef void _notify(self) noexcept nogil
+    cdef void _clear_notifications(self) except *
     cdef shutdown(self)
@@ -14,8 +14,11 @@
 
 import socket
 
+from libc.errno cimport errno
+
 cdef gpr_timespec _GPR_INF_FUTURE = gpr_inf_future(GPR_CLOCK_REALTIME)
 cdef float _POLL_AWAKE_INTERVAL_S = 0.2
+cdef int _NOTIFICATION_BUFFER_SIZE = 4096
 
 # This bool indicates if the event loop impl can monitor a given fd, or has
 # loop.add_reader method.
@@ -30,6 +33,11 @@ ELSE:
     cdef void _unified_socket_write(int fd) noexcept nogil:
         unistd.write(fd, b"1", 1)
 
+IF UNAME_SYSNAME == "Linux":
+    cdef void _eventfd_write(int fd) noexcept nogil:
+        cdef uint64_t increment = 1
+        unistd.write(fd, &increment, sizeof(increment))
+
 
 def _handle_callback_wrapper(CallbackWrapper callback_wrapper, int success):
     CallbackWrapper.functor_run(callback_wrapper.c_functor(), success)
@@ -43,10 +51,10 @@ cdef class BaseCompletionQueue:
 
 cdef class _BoundEventLoop:
 
-    def __cinit__(self, object loop, object read_socket, object handler):
+    def __cinit__(self, object loop, object read_fd, object handler):
         global _has_fd_monitoring
         self.loop = loop
-        self.read_socket = read_socket
+        self.read_fd = read_fd
         reader_function = functools.partial(
             handler,
             loop
@@ -57,7 +65,7 @@ cdef class _BoundEventLoop:
         # uses different types of event loops (e.g., 1 Proactor, 3 Selectors).
         if _has_fd_monitoring:
             try:
-                self.loop.add_reader(self.read_socket, reader_function)
+                self.loop.add_reader(self.read_fd, reader_function)
                 self._has_reader = True
             except NotImplementedError:
                 _has_fd_monitoring = False
@@ -66,7 +74,7 @@ cdef class _BoundEventLoop:
     def close(self):
         if self.loop:
             if self._has_reader:
-                self.loop.remove_reader(self.read_socket)
+                self.loop.remove_reader(self.read_fd)
 
 
 cdef class PollerCompletionQueue(BaseCompletionQueue):
@@ -74,29 +82,79 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
     def __cinit__(self):
         self._cq = grpc_completion_queue_create_for_next(NULL)
         self._shutdown = False
-        self._poller_thread = threading.Thread(target=self._poll_wrapper, daemon=True)
-        self._poller_thread.start()
-
-        self._read_socket, self._write_socket = socket.socketpair()
-        self._write_fd = self._write_socket.fileno()
         self._loops = {}
-
-        # The read socket might be read by multiple threads. But only one of them will
-        # read the 1 byte sent by the poller thread. This setting is essential to allow
-        # multiple loops in multiple threads bound to the same poller.
-        self._read_socket.setblocking(False)
-
         self._queue = cpp_event_queue()
+        self._events = 0
+        self._wakeups = 0
+        self._drains = 0
+
+        # The wakeup fd might be read by multiple threads, so it is
+        # non-blocking. This is essential to allow multiple loops in multiple
+        # threads bound to the same poller.
+        IF UNAME_SYSNAME == "Linux":
+            self._write_fd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC)
+            if self._write_fd < 0:
+                raise OSError(errno, os.strerror(errno))
+            self._read_fd = self._write_fd
+            self._read_socket = None
+            self._write_socket = None
+        ELSE:
+            self._read_socket, self._write_socket = socket.socketpair()
+            self._read_socket.setblocking(False)
+            self._write_fd = self._write_socket.fileno()
+            self._read_fd = self._read_socket
+
+        self._poller_thread = threading.Thread(target=self._poll_wrapper, daemon=True)
+        self._poller_thread.start()
 
     def bind_loop(self, object loop):
         if loop in self._loops:
             return
         else:
-            self._loops[loop] = _BoundEventLoop(loop, self._read_socket, self._handle_events)
+            self._loops[loop] = _BoundEventLoop(loop, self._read_fd, self._handle_events)
+
+    def statistics(self):
+        """Returns counters of the events this poller handed to event loops.
+
+        Returns:
+          A dict with the number of events received from Core ("events"), the
+          number of times event loops were notified ("wakeups") and the number
+          of passes draining the event queue ("drains").
+        """
+        cdef uint64_t events
+        cdef uint64_t wakeups
+        cdef uint64_t drains
+        self._queue_mutex.lock()
+        events = self._events
+        wakeups = self._wakeups
+        drains = self._drains
+        self._queue_mutex.unlock()
+        return {'events': events, 'wakeups': wakeups, 'drains': drains}
+
+    cdef void _notify(self) noexcept nogil:
+        IF UNAME_SYSNAME == "Linux":
+            _eventfd_write(self._write_fd)
+        ELSE:
+            _unified_socket_write(self._write_fd)
+
+    cdef void _clear_notifications(self) except *:
+        IF UNAME_SYSNAME == "Linux":
+            try:
+                os.read(self._read_fd, sizeof(uint64_t))
+            except BlockingIOError:
+                # Another loop has consumed the notification.
+                pass
+        ELSE:
+            try:
+                self._read_socket.recv(_NOTIFICATION_BUFFER_SIZE)
+            except BlockingIOError:
+                # Another loop has consumed the notification.
+                pass
 
     cdef void _poll(self) nogil:
         cdef grpc_event event
         cdef CallbackContext *context
+        cdef bint notify
 
         while not self._shutdown:
             event = grpc_completion_queue_next(self._cq,
@@ -110,10 +168,17 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
                 self._shutdown = True
             else:
                 self._queue_mutex.lock()
+                # Loops drain the whole queue once woken up, so they only need
+                # a notification when it stops being empty.
+                notify = self._queue.empty()
                 self._queue.push(event)
+                self._events += 1
+                if notify:
+                    self._wakeups += 1
                 self._queue_mutex.unlock()
                 if _has_fd_monitoring:
-                    _unified_socket_write(self._write_fd)
+                    if notify:
+                        self._notify()
                 else:
                     with gil:
                         # Event loops can be paused or killed at any time. So,
@@ -136,18 +201,27 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
             self._poller_thread.join(timeout=_POLL_AWAKE_INTERVAL_S)
         grpc_completion_queue_destroy(self._cq)
 
-        # Clean up socket resources
-        self._read_socket.close()
-        self._write_socket.close()
+        # Clean up wakeup resources
+        IF UNAME_SYSNAME == "Linux":
+            os.close(self._write_fd)
+        ELSE:
+            self._read_socket.close()
+            self._write_socket.close()
 
     def _handle_events(self, object context_loop):
-        cdef bytes data
-        if _has_fd_monitoring:
-            # If fd monitoring is working, clean the socket without blocking.
-            data = self._read_socket.recv(1)
         cdef grpc_event event
         cdef CallbackContext *context
 
+        if _has_fd_monitoring:
+            # If fd monitoring is working, consume the pending notifications
+            # without blocking. Events queued from now on will be drained by
+            # this pass or trigger a new notification.
+            self._clear_notifications()
+
+        self._queue_mutex.lock()
+        self._drains += 1
+        self._queue_mutex.unlock()
+
         while True:
             self._queue_mutex.lock()
             if self._queue.empty():
@@ -18,11 +18,23 @@ cdef class _AioState:
     cdef int refcount
     cdef object engine  # AsyncIOEngine
     cdef BaseCompletionQueue cq
+    cdef dict loop_cqs  # Mapping[asyncio.AbstractEventLoop, PollerCompletionQueue]
+    cdef dict loop_cq_refcounts  # Mapping[asyncio.AbstractEventLoop, int]
+    cdef dict retired_poller_statistics  # Mapping[str, int]
 
 
 cdef grpc_completion_queue *global_completion_queue()
 
 
+cdef grpc_completion_queue *loop_completion_queue(object loop) except NULL
+
+
+cdef acquire_loop_completion_queue(object loop)
+
+
+cdef release_loop_completion_queue(object loop)
+
+
 cpdef init_grpc_aio()
 
 
@@ -23,6 +23,9 @@ class AsyncIOEngine(enum.Enum):
     # EventEngine project, which will be the only IO platform in Core.
     CUSTOM_IO_MANAGER = 'custom_io_manager'
     POLLER = 'poller'
+    # Each event loop gets its own completion queue and poller thread, so
+    # events never have to be handed over between loops.
+    POLLER_PER_LOOP = 'poller_per_loop'
 
 
 cdef _default_asyncio_engine():
@@ -33,6 +36,55 @@ cdef grpc_completion_queue *global_completion_queue():
     return _global_aio_state.cq.c_ptr()
 
 
+cdef grpc_completion_queue *loop_completion_queue(object loop) except NULL:
+    """Returns the completion queue for Core objects driven by the given loop.
+
+    With the poller_per_loop engine, the loop must be bound to a channel or
+    server that acquired its completion queue.
+    """
+    if _global_aio_state.engine is AsyncIOEngine.POLLER_PER_LOOP:
+        return (<PollerCompletionQueue>_global_aio_state.loop_cqs[loop]).c_ptr()
+    else:
+        return global_completion_queue()
+
+
+cdef acquire_loop_completion_queue(object loop):
+    """Holds the completion queue of a loop for a channel or server."""
+    if _global_aio_state.engine is not AsyncIOEngine.POLLER_PER_LOOP:
+        return
+    cdef PollerCompletionQueue cq
+    with _global_aio_state.lock:
+        if loop not in _global_aio_state.loop_cqs:
+            cq = PollerCompletionQueue()
+            cq.bind_loop(loop)
+            _global_aio_state.loop_cqs[loop] = cq
+            _global_aio_state.loop_cq_refcounts[loop] = 0
+        _global_aio_state.loop_cq_refcounts[loop] += 1
+
+
+cdef release_loop_completion_queue(object loop):
+    """Shuts the completion queue of a loop down once nothing holds it.
+
+    Dropping the queue also drops its reference to the loop, so loops that
+    are done with gRPC can be collected.
+    """
+    if _global_aio_state.engine is not AsyncIOEngine.POLLER_PER_LOOP:
+        return
+    with _global_aio_state.lock:
+        _global_aio_state.loop_cq_refcounts[loop] -= 1
+        if _global_aio_state.loop_cq_refcounts[loop]:
+            return
+        del _global_aio_state.loop_cq_refcounts[loop]
+        _retire_poller(_global_aio_state.loop_cqs.pop(loop))
+
+
+cdef _retire_poller(PollerCompletionQueue cq):
+    # Keeps the counters of aio_poller_statistics monotonic.
+    for name, value in cq.statistics().items():
+        _global_aio_state.retired_poller_statistics[name] += value
+    cq.shutdown()
+
+
 cdef class _AioState:
 
     def __cinit__(self):
@@ -40,6 +92,9 @@ cdef class _AioState:
         self.refcount = 0
         self.engine = None
         self.cq = None
+        self.loop_cqs = {}
+        self.loop_cq_refcounts = {}
+        self.retired_poller_statistics = {'events': 0, 'wakeups': 0, 'drains': 0}
 
 
 cdef _initialize_poller():
@@ -61,6 +116,9 @@ cdef _actual_aio_initialization():
     # Initializes the process-level state accordingly
     if _global_aio_state.engine is AsyncIOEngine.POLLER:
         _initialize_poller()
+    elif _global_aio_state.engine is AsyncIOEngine.POLLER_PER_LOOP:
+        # Completion queues are created as loops get bound.
+        grpc_init()
     else:
         raise ValueError('Unsupported engine type [%s]' % _global_aio_state.engine)
 
@@ -78,6 +136,12 @@ cdef _actual_aio_shutdown():
     if _global_aio_state.engine is AsyncIOEngine.POLLER:
         (<PollerCompletionQueue>_global_aio_state.cq).shutdown()
         grpc_shutdown()
+    elif _global_aio_state.engine is AsyncIOEngine.POLLER_PER_LOOP:
+        for cq in _global_aio_state.loop_cqs.values():
+            _retire_poller(cq)
+        _global_aio_state.loop_cqs.clear()
+        _global_aio_state.loop_cq_refcounts.clear()
+        grpc_shutdown()
     else:
         raise ValueError('Unsupported engine type [%s]' % _global_aio_state.engine)
 
@@ -88,6 +152,27 @@ cdef _initialize_per_loop():
         _global_aio_state.cq.bind_loop(loop)
 
 
+def aio_poller_statistics():
+    """Sums up the counters of the AsyncIO pollers.
+
+    Returns:
+      A dict with the number of events received from Core ("events"), the
+      number of times event loops were notified ("wakeups") and the number of
+      passes draining the event queues ("drains").
+    """
+    cdef dict statistics
+    with _global_aio_state.lock:
+        statistics = dict(_global_aio_state.retired_poller_statistics)
+        if _global_aio_state.cq is not None:
+            pollers = [_global_aio_state.cq]
+        else:
+            pollers = list(_global_aio_state.loop_cqs.values())
+    for poller in pollers:
+        for name, value in (<PollerCompletionQueue>poller).statistics().items():
+            statistics[name] += value
+    return statistics
+
+
 cpdef init_grpc_aio():
     """Initializes the gRPC AsyncIO module.
 
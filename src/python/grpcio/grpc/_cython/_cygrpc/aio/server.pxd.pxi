@@ -19,6 +19,9 @@ cdef class _HandlerCallDetails:
 
 cdef class RPCState(GrpcCallWrapper):
     cdef grpc_call_details details
+    # The method of a call accepted as a registered method, whose name core
+    # does not fill into details.
+    cdef bytes registered_method
     cdef grpc_metadata_array request_metadata
     cdef AioServer server
     # NOTE(lidiz) Under certain corner case, receiving the client close
@@ -35,6 +38,7 @@ cdef class RPCState(GrpcCallWrapper):
     cdef object compression_algorithm
     cdef bint disable_next_compression
     cdef object callbacks
+    cdef double accepted_at
 
     cdef bytes method(self)
     cdef tuple invocation_metadata(self)
@@ -59,6 +63,7 @@ cdef class _SyncServicerContext:
 cdef class _MessageReceiver:
     cdef _ServicerContext _servicer_context
     cdef object _agen
+    cdef int _prefetch_depth
 
 
 cdef enum AioServerStatus:
@@ -78,15 +83,29 @@ cdef class _ConcurrentRpcLimiter:
 cdef class AioServer:
     cdef Server _server
     cdef list _generic_handlers
+    cdef dict _registered_method_handlers  # Mapping[bytes, RpcMethodHandler]
+    cdef int _pending_call_slots
+    cdef int _request_prefetch_depth
+    cdef int _response_write_window
     cdef AioServerStatus _status
     cdef object _loop  # asyncio.EventLoop
+    cdef grpc_completion_queue *_cq
     cdef object _serving_task  # asyncio.Task
     cdef object _shutdown_lock  # asyncio.Lock
     cdef object _shutdown_completed  # asyncio.Future
     cdef CallbackWrapper _shutdown_callback_wrapper
     cdef object _crash_exception  # Exception
     cdef tuple _interceptors
+    # The intercepted handlers of registered methods, None unless all
+    # interceptors are cacheable.
+    cdef dict _intercepted_handlers
     cdef object _thread_pool  # concurrent.futures.ThreadPoolExecutor
     cdef _ConcurrentRpcLimiter _limiter
+    cdef object _concurrency_limiter  # grpc.experimental.ConcurrencyLimiter
+    cdef double _queue_wait
+    cdef double _queue_wait_observed_at
 
     cdef thread_pool(self)
+    cdef int response_write_window(self)
+    cdef void observe_queue_wait(self, double wait)
+    cdef double queue_wait(self)
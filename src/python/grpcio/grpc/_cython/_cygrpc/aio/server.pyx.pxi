@@ -21,6 +21,8 @@ import functools
 cdef int _EMPTY_FLAG = 0
 cdef str _RPC_FINISHED_DETAILS = 'RPC already finished.'
 cdef str _SERVER_STOPPED_DETAILS = 'Server already stopped.'
+cdef double _QUEUE_WAIT_SMOOTHING = 0.1
+cdef double _QUEUE_WAIT_HALF_LIFE_S = 1.0
 
 cdef _augment_metadata(tuple metadata, object compression):
     if compression is None:
@@ -48,6 +50,7 @@ cdef class RPCState:
         init_grpc_aio()
         self.call = NULL
         self.server = server
+        self.registered_method = None
         grpc_metadata_array_init(&self.request_metadata)
         grpc_call_details_init(&self.details)
         self.client_closed = False
@@ -61,8 +64,11 @@ cdef class RPCState:
         self.compression_algorithm = None
         self.disable_next_compression = False
         self.callbacks = []
+        self.accepted_at = 0
 
     cdef bytes method(self):
+        if self.registered_method is not None:
+            return self.registered_method
         return _slice_bytes(self.details.method)
 
     cdef tuple invocation_metadata(self):
@@ -125,10 +131,12 @@ cdef class _ServicerContext:
         self._loop = loop
 
     async def read(self):
-        cdef bytes raw_message
+        cdef object raw_message
         self._rpc_state.raise_for_termination()
 
-        raw_message = await _receive_message(self._rpc_state, self._loop)
+        raw_message = await _receive_message(self._rpc_state,
+                                             self._loop,
+                                             self._request_deserializer)
         self._rpc_state.raise_for_termination()
 
         if raw_message is None:
@@ -368,8 +376,12 @@ def _is_async_handler(object handler):
 
 
 async def _find_method_handler(str method, tuple metadata, list generic_handlers,
-                          tuple interceptors):
+                          tuple interceptors, object registered_handler=None):
     def query_handlers(handler_call_details):
+        # The handler of a registered method takes precedence over generic
+        # handlers for the same method.
+        if registered_handler is not None:
+            return registered_handler
         for generic_handler in generic_handlers:
             method_handler = generic_handler.service(handler_call_details)
             if method_handler is not None:
@@ -426,7 +438,7 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
     rpc_state.raise_for_termination()
 
     # Serializes the response message
-    cdef bytes response_raw
+    cdef object response_raw
     if rpc_state.status_code == StatusCode.ok:
         response_raw = serialize(
             response_serializer,
@@ -457,6 +469,53 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
     uninstall_context()
 
 
+cdef int _positive_int_for_behavior(object behavior, str attribute,
+                                    int default):
+    cdef object value = getattr(behavior, attribute, None)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    else:
+        return default
+
+
+cdef int _prefetch_depth_for_behavior(object behavior, int default_prefetch_depth):
+    return _positive_int_for_behavior(
+        behavior, 'experimental_prefetch_depth', default_prefetch_depth)
+
+
+cdef int _write_window_for_behavior(object behavior, int default_write_window):
+    return _positive_int_for_behavior(
+        behavior, 'experimental_write_window', default_write_window)
+
+
+async def _write_response_batch(RPCState rpc_state,
+                                _ServicerContext servicer_context,
+                                list response_batch,
+                                object loop):
+    """Writes responses handed over together by a sync handler.
+
+    Every response but the last is written with a buffer hint, so that core
+    may coalesce them on the wire instead of flushing each of them.
+    """
+    cdef int last_index = len(response_batch) - 1
+    cdef int index
+    cdef int write_flag
+    for index, response_message in enumerate(response_batch):
+        # Raises exception if aborted
+        rpc_state.raise_for_termination()
+
+        write_flag = rpc_state.get_write_flag()
+        if index < last_index:
+            write_flag |= WriteFlag.buffer_hint
+        await _send_message(rpc_state,
+                            serialize(servicer_context._response_serializer,
+                                      response_message),
+                            rpc_state.create_send_initial_metadata_op_if_not_sent(),
+                            write_flag,
+                            loop)
+        rpc_state.metadata_sent = True
+
+
 async def _finish_handler_with_stream_responses(RPCState rpc_state,
                                                 object stream_handler,
                                                 object request,
@@ -469,6 +528,7 @@ async def _finish_handler_with_stream_responses(RPCState rpc_state,
     stream-stream handlers.
     """
     cdef object async_response_generator
+    cdef object async_response_batches
     cdef object response_message
     install_context_from_request_call_event_aio(rpc_state)
 
@@ -479,23 +539,13 @@ async def _finish_handler_with_stream_responses(RPCState rpc_state,
             request,
             servicer_context,
         )
-    else:
-        if inspect.isasyncgenfunction(stream_handler):
-            # Case 2: Async handler - async generator
-            # The handler uses async generator API
-            async_response_generator = stream_handler(
-                request,
-                servicer_context,
-            )
-        else:
-            # Case 3: Sync handler - normal generator
-            # NOTE(lidiz) Streaming handler in sync stack is either a generator
-            # function or a function returns a generator.
-            sync_servicer_context = _SyncServicerContext(servicer_context)
-            gen = stream_handler(request, sync_servicer_context)
-            async_response_generator = generator_to_async_generator(gen,
-                                                                    loop,
-                                                                    rpc_state.server.thread_pool())
+    elif inspect.isasyncgenfunction(stream_handler):
+        # Case 2: Async handler - async generator
+        # The handler uses async generator API
+        async_response_generator = stream_handler(
+            request,
+            servicer_context,
+        )
 
         # Consumes messages from the generator
         async for response_message in async_response_generator:
@@ -503,6 +553,29 @@ async def _finish_handler_with_stream_responses(RPCState rpc_state,
             rpc_state.raise_for_termination()
 
             await servicer_context.write(response_message)
+    else:
+        # Case 3: Sync handler - normal generator
+        # NOTE(lidiz) Streaming handler in sync stack is either a generator
+        # function or a function returns a generator.
+        sync_servicer_context = _SyncServicerContext(servicer_context)
+        gen = stream_handler(request, sync_servicer_context)
+        async_response_batches = generator_to_async_batches(
+            gen,
+            loop,
+            rpc_state.server.thread_pool(),
+            _write_window_for_behavior(
+                stream_handler, rpc_state.server.response_write_window()),
+        )
+
+        # Consumes batches of messages from the generator
+        try:
+            async for response_batch in async_response_batches:
+                await _write_response_batch(rpc_state,
+                                            servicer_context,
+                                            response_batch,
+                                            loop)
+        finally:
+            await async_response_batches.aclose()
 
     # Raises exception if aborted
     rpc_state.raise_for_termination()
@@ -531,7 +604,8 @@ async def _handle_unary_unary_rpc(object method_handler,
                                   RPCState rpc_state,
                                   object loop):
     # Receives request message
-    cdef bytes request_raw = await _receive_message(rpc_state, loop)
+    cdef object request_raw = await _receive_message(
+        rpc_state, loop, method_handler.request_deserializer)
     if request_raw is None:
         # The RPC was cancelled immediately after start on client side.
         return
@@ -565,7 +639,8 @@ async def _handle_unary_stream_rpc(object method_handler,
                                    RPCState rpc_state,
                                    object loop):
     # Receives request message
-    cdef bytes request_raw = await _receive_message(rpc_state, loop)
+    cdef object request_raw = await _receive_message(
+        rpc_state, loop, method_handler.request_deserializer)
     if request_raw is None:
         return
 
@@ -594,11 +669,16 @@ async def _handle_unary_stream_rpc(object method_handler,
 
 
 cdef class _MessageReceiver:
-    """Bridge between the async generator API and the reader-writer API."""
+    """Bridge between the async generator API and the reader-writer API.
+
+    With a prefetch depth above one, a task reads messages ahead of the
+    application into a queue holding up to that many messages.
+    """
 
-    def __cinit__(self, _ServicerContext servicer_context):
+    def __cinit__(self, _ServicerContext servicer_context, int prefetch_depth=1):
         self._servicer_context = servicer_context
         self._agen = None
+        self._prefetch_depth = prefetch_depth
 
     async def _async_message_receiver(self):
         """An async generator that receives messages."""
@@ -610,10 +690,47 @@ cdef class _MessageReceiver:
             else:
                 break
 
+    async def _prefetch_messages(self, object queue):
+        """Reads messages into the queue until EOF or an error."""
+        cdef object message
+        while True:
+            try:
+                message = await self._servicer_context.read()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                await queue.put((None, exception))
+                return
+            await queue.put((message, None))
+            if message is EOF:
+                return
+
+    async def _prefetching_message_receiver(self):
+        """An async generator that yields the messages read ahead of it."""
+        cdef object queue = asyncio.Queue(maxsize=self._prefetch_depth)
+        cdef object prefetch_task = self._servicer_context._loop.create_task(
+            self._prefetch_messages(queue))
+        cdef object message
+        cdef object exception
+        try:
+            while True:
+                message, exception = await queue.get()
+                if exception is not None:
+                    raise exception
+                elif message is EOF:
+                    break
+                else:
+                    yield message
+        finally:
+            prefetch_task.cancel()
+
     def __aiter__(self):
         # Prevents never awaited warning if application never used the async generator
         if self._agen is None:
-            self._agen = self._async_message_receiver()
+            if self._prefetch_depth > 1:
+                self._agen = self._prefetching_message_receiver()
+            else:
+                self._agen = self._async_message_receiver()
         return self._agen
 
     async def __anext__(self):
@@ -622,7 +739,8 @@ cdef class _MessageReceiver:
 
 async def _handle_stream_unary_rpc(object method_handler,
                                    RPCState rpc_state,
-                                   object loop):
+                                   object loop,
+                                   int prefetch_depth=1):
     # Creates a dedicated ServicerContext
     cdef _ServicerContext servicer_context = _ServicerContext(
         rpc_state,
@@ -633,11 +751,13 @@ async def _handle_stream_unary_rpc(object method_handler,
 
     # Prepares the request generator
     cdef object request_iterator
+    prefetch_depth = _prefetch_depth_for_behavior(
+        method_handler.stream_unary, prefetch_depth)
     if _is_async_handler(method_handler.stream_unary):
-        request_iterator = _MessageReceiver(servicer_context)
+        request_iterator = _MessageReceiver(servicer_context, prefetch_depth)
     else:
         request_iterator = async_generator_to_generator(
-            _MessageReceiver(servicer_context),
+            _MessageReceiver(servicer_context, prefetch_depth),
             loop
         )
 
@@ -654,7 +774,8 @@ async def _handle_stream_unary_rpc(object method_handler,
 
 async def _handle_stream_stream_rpc(object method_handler,
                                     RPCState rpc_state,
-                                    object loop):
+                                    object loop,
+                                    int prefetch_depth=1):
     # Creates a dedicated ServicerContext
     cdef _ServicerContext servicer_context = _ServicerContext(
         rpc_state,
@@ -665,11 +786,13 @@ async def _handle_stream_stream_rpc(object method_handler,
 
     # Prepares the request generator
     cdef object request_iterator
+    prefetch_depth = _prefetch_depth_for_behavior(
+        method_handler.stream_stream, prefetch_depth)
     if _is_async_handler(method_handler.stream_stream):
-        request_iterator = _MessageReceiver(servicer_context)
+        request_iterator = _MessageReceiver(servicer_context, prefetch_depth)
     else:
         request_iterator = async_generator_to_generator(
-            _MessageReceiver(servicer_context),
+            _MessageReceiver(servicer_context, prefetch_depth),
             loop
         )
 
@@ -792,16 +915,47 @@ async def _schedule_rpc_coro(object rpc_coro,
         traceback.print_exc()
 
 
+cdef bint _deadline_expires_within(RPCState rpc_state, double seconds) except *:
+    if rpc_state.details.deadline.seconds == _GPR_INF_FUTURE.seconds:
+        return False
+    return _time_from_timespec(rpc_state.details.deadline) - time.time() <= seconds
+
+
 async def _handle_rpc(list generic_handlers, tuple interceptors,
-                      RPCState rpc_state, object loop, bint concurrency_exceeded):
+                      dict intercepted_handlers, RPCState rpc_state, object loop, bint concurrency_exceeded,
+                      object registered_handler=None,
+                      int request_prefetch_depth=1,
+                      bint deadline_exceeded=False,
+                      object concurrency_limiter=None):
     cdef object method_handler
+    cdef double started_at
+    rpc_state.server.observe_queue_wait(loop.time() - rpc_state.accepted_at)
     # Finds the method handler (application logic)
-    method_handler = await _find_method_handler(
-        rpc_state.method().decode(),
-        rpc_state.invocation_metadata(),
-        generic_handlers,
-        interceptors,
-    )
+    if registered_handler is not None and not interceptors:
+        method_handler = registered_handler
+    elif registered_handler is not None and intercepted_handlers is not None:
+        # A registered method is always served by the same handler, so the
+        # handler cacheable interceptors make of it can be reused.
+        method = rpc_state.method()
+        method_handler = intercepted_handlers.get(method)
+        if method_handler is None:
+            method_handler = await _find_method_handler(
+                method.decode(),
+                rpc_state.invocation_metadata(),
+                generic_handlers,
+                interceptors,
+                registered_handler,
+            )
+            if method_handler is not None:
+                intercepted_handlers[method] = method_handler
+    else:
+        method_handler = await _find_method_handler(
+            rpc_state.method().decode(),
+            rpc_state.invocation_metadata(),
+            generic_handlers,
+            interceptors,
+            registered_handler,
+        )
     if method_handler is None:
         rpc_state.status_sent = True
         await _send_error_status_from_server(
@@ -826,6 +980,57 @@ async def _handle_rpc(list generic_handlers, tuple interceptors,
         )
         return
 
+    # Drops RPCs that were doomed when accepted, or whose deadline passed
+    # while they waited to be scheduled.
+    if deadline_exceeded or _deadline_expires_within(rpc_state, 0):
+        rpc_state.status_sent = True
+        try:
+            await _send_error_status_from_server(
+                rpc_state,
+                StatusCode.deadline_exceeded,
+                'Deadline Exceeded',
+                _IMMUTABLE_EMPTY_METADATA,
+                rpc_state.create_send_initial_metadata_op_if_not_sent(),
+                loop
+            )
+        except ExecuteBatchError:
+            # Core may already have cancelled the call as its deadline passed.
+            pass
+        return
+
+    # Only RPCs about to be handled are passed to the limiter, so that it
+    # does not learn from RPCs rejected for other reasons.
+    if concurrency_limiter is not None and not concurrency_limiter.acquire():
+        rpc_state.status_sent = True
+        await _send_error_status_from_server(
+            rpc_state,
+            StatusCode.resource_exhausted,
+            'Concurrent RPC limit exceeded!',
+            _IMMUTABLE_EMPTY_METADATA,
+            rpc_state.create_send_initial_metadata_op_if_not_sent(),
+            loop
+        )
+        return
+
+    started_at = loop.time()
+    try:
+        await _handle_method_handler(method_handler,
+                                     rpc_state,
+                                     loop,
+                                     request_prefetch_depth)
+    finally:
+        if concurrency_limiter is not None:
+            try:
+                concurrency_limiter.release(loop.time() - started_at,
+                                            started_at - rpc_state.accepted_at)
+            except Exception:
+                _LOGGER.exception('Exception releasing concurrency limiter!')
+
+
+async def _handle_method_handler(object method_handler,
+                                 RPCState rpc_state,
+                                 object loop,
+                                 int request_prefetch_depth):
     # Handles unary-unary case
     if not method_handler.request_streaming and not method_handler.response_streaming:
         await _handle_unary_unary_rpc(method_handler,
@@ -844,14 +1049,16 @@ async def _handle_rpc(list generic_handlers, tuple interceptors,
     if method_handler.request_streaming and not method_handler.response_streaming:
         await _handle_stream_unary_rpc(method_handler,
                                        rpc_state,
-                                       loop)
+                                       loop,
+                                       request_prefetch_depth)
         return
 
     # Handles stream-stream case
     if method_handler.request_streaming and method_handler.response_streaming:
         await _handle_stream_stream_rpc(method_handler,
                                         rpc_state,
-                                        loop)
+                                        loop,
+                                        request_prefetch_depth)
         return
 
 
@@ -876,10 +1083,10 @@ cdef class _ConcurrentRpcLimiter:
         self._active_rpcs = 0
         self.limiter_concurrency_exceeded = False
 
-    def check_before_request_call(self):
-        if self._active_rpcs >= self._maximum_concurrent_rpcs:
-            self.limiter_concurrency_exceeded = True
-        else:
+    def check_before_handling_call(self):
+        self.limiter_concurrency_exceeded = (
+            self._active_rpcs >= self._maximum_concurrent_rpcs)
+        if not self.limiter_concurrency_exceeded:
             self._active_rpcs += 1
 
     def _decrease_active_rpcs_count(self, unused_future):
@@ -894,15 +1101,20 @@ cdef class _ConcurrentRpcLimiter:
 cdef class AioServer:
 
     def __init__(self, loop, thread_pool, generic_handlers, interceptors,
-                 options, maximum_concurrent_rpcs):
+                 options, maximum_concurrent_rpcs, int pending_call_slots=1,
+                 int request_prefetch_depth=1, int response_write_window=1,
+                 concurrency_limiter=None,
+                 bint cache_intercepted_handlers=False):
         init_grpc_aio()
         # NOTE(lidiz) Core objects won't be deallocated automatically.
         # If AioServer.shutdown is not called, those objects will leak.
         # TODO(rbellevi): Support xDS in aio server.
         self._server = Server(options, False)
+        acquire_loop_completion_queue(loop)
+        self._cq = loop_completion_queue(loop)
         grpc_server_register_completion_queue(
             self._server.c_server,
-            global_completion_queue(),
+            self._cq,
             NULL
         )
 
@@ -910,6 +1122,10 @@ cdef class AioServer:
         self._status = AIO_SERVER_STATUS_READY
         self._generic_handlers = []
         self.add_generic_rpc_handlers(generic_handlers)
+        self._registered_method_handlers = {}
+        self._pending_call_slots = pending_call_slots
+        self._request_prefetch_depth = request_prefetch_depth
+        self._response_write_window = response_write_window
         self._serving_task = None
 
         self._shutdown_lock = asyncio.Lock()
@@ -924,14 +1140,30 @@ cdef class AioServer:
             self._interceptors = tuple(interceptors)
         else:
             self._interceptors = ()
+        if cache_intercepted_handlers:
+            self._intercepted_handlers = {}
+        else:
+            self._intercepted_handlers = None
 
         self._thread_pool = thread_pool
         if maximum_concurrent_rpcs is not None:
             self._limiter = _ConcurrentRpcLimiter(maximum_concurrent_rpcs)
+        self._concurrency_limiter = concurrency_limiter
+        self._queue_wait = 0
+        self._queue_wait_observed_at = loop.time()
 
     def add_generic_rpc_handlers(self, object generic_rpc_handlers):
         self._generic_handlers.extend(generic_rpc_handlers)
 
+    def add_registered_method_handlers(self, dict method_handlers):
+        # Methods can't be registered with core once the server started.
+        if self._status != AIO_SERVER_STATUS_READY:
+            return
+        for fully_qualified_method, method_handler in method_handlers.items():
+            self._server.register_method(fully_qualified_method)
+            self._registered_method_handlers[
+                str_to_bytes(fully_qualified_method)] = method_handler
+
     def add_insecure_port(self, address):
         return self._server.add_http2_port(address)
 
@@ -939,22 +1171,39 @@ cdef class AioServer:
         return self._server.add_http2_port(address,
                                            server_credentials._credentials)
 
-    async def _request_call(self):
+    async def _request_call(self, bytes registered_method):
         cdef grpc_call_error error
         cdef RPCState rpc_state = RPCState(self)
+        cdef RegisteredMethod c_registered_method
         cdef object future = self._loop.create_future()
         cdef CallbackWrapper wrapper = CallbackWrapper(
             future,
             self._loop,
             REQUEST_CALL_FAILURE_HANDLER)
-        error = grpc_server_request_call(
-            self._server.c_server, &rpc_state.call, &rpc_state.details,
-            &rpc_state.request_metadata,
-            global_completion_queue(), global_completion_queue(),
-            wrapper.c_functor()
-        )
-        if error != GRPC_CALL_OK:
-            raise InternalError("Error in grpc_server_request_call: %s" % error)
+        if registered_method is None:
+            error = grpc_server_request_call(
+                self._server.c_server, &rpc_state.call, &rpc_state.details,
+                &rpc_state.request_metadata,
+                self._cq, self._cq,
+                wrapper.c_functor()
+            )
+            if error != GRPC_CALL_OK:
+                raise InternalError("Error in grpc_server_request_call: %s" % error)
+        else:
+            rpc_state.registered_method = registered_method
+            c_registered_method = self._server.registered_methods[registered_method]
+            # optional_payload is NULL because methods are registered with
+            # GRPC_SRM_PAYLOAD_NONE.
+            error = grpc_server_request_registered_call(
+                self._server.c_server,
+                c_registered_method.c_registered_method,
+                &rpc_state.call, &rpc_state.details.deadline,
+                &rpc_state.request_metadata, NULL,
+                self._cq, self._cq,
+                wrapper.c_functor()
+            )
+            if error != GRPC_CALL_OK:
+                raise InternalError("Error in grpc_server_request_registered_call: %s" % error)
 
         await future
         return rpc_state
@@ -962,22 +1211,49 @@ cdef class AioServer:
     async def _server_main_loop(self,
                                 object server_started):
         self._server.start(backup_queue=False)
-        cdef RPCState rpc_state
         server_started.set_result(True)
-        rpc_tasks = set()
+        cdef set rpc_tasks = set()
+
+        # Core matches calls to registered methods against their own requests,
+        # so each registered method is accepted by loops that already know its
+        # handler. Calls to other methods go through the generic handlers.
+        # Every method keeps several requests outstanding, so that a burst of
+        # calls does not wait for each to round trip through the event loop
+        # before the next one can be accepted.
+        cdef list accepted_methods = [(None, None)]
+        accepted_methods.extend(self._registered_method_handlers.items())
+        await asyncio.gather(*[
+            self._loop.create_task(
+                self._accept_calls(method, method_handler, rpc_tasks),
+                name="accept_calls",
+            )
+            for method, method_handler in accepted_methods
+            for _ in range(self._pending_call_slots)
+        ])
+
+    async def _accept_calls(self,
+                            bytes registered_method,
+                            object registered_handler,
+                            set rpc_tasks):
+        cdef RPCState rpc_state
+        cdef bint concurrency_exceeded
+        cdef bint concurrency_reserved
 
         while True:
             # When shutdown begins, no more new connections.
             if self._status != AIO_SERVER_STATUS_RUNNING:
                 break
 
+            # Accepts new request from Core
+            rpc_state = await self._request_call(registered_method)
+            rpc_state.accepted_at = self._loop.time()
+
             concurrency_exceeded = False
             if self._limiter is not None:
-                self._limiter.check_before_request_call()
+                self._limiter.check_before_handling_call()
                 concurrency_exceeded = self._limiter.limiter_concurrency_exceeded
-
-            # Accepts new request from Core
-            rpc_state = await self._request_call()
+            concurrency_reserved = (self._limiter is not None
+                                    and not concurrency_exceeded)
 
             # Creates the dedicated RPC coroutine. If we schedule it right now,
             # there is no guarantee if the cancellation listening coroutine is
@@ -986,9 +1262,15 @@ cdef class AioServer:
             # coroutine.
             rpc_coro = _handle_rpc(self._generic_handlers,
                                    self._interceptors,
+                                   self._intercepted_handlers,
                                    rpc_state,
                                    self._loop,
-                                   concurrency_exceeded)
+                                   concurrency_exceeded,
+                                   registered_handler,
+                                   self._request_prefetch_depth,
+                                   _deadline_expires_within(
+                                       rpc_state, self.queue_wait()),
+                                   self._concurrency_limiter)
 
             # Fires off a task that listens on the cancellation from client.
             rpc_task = self._loop.create_task(
@@ -1005,7 +1287,9 @@ cdef class AioServer:
             rpc_tasks.add(rpc_task)
             rpc_task.add_done_callback(rpc_tasks.discard)
 
-            if self._limiter is not None:
+            # Only RPCs that were counted against the limit give their slot
+            # back once finished.
+            if concurrency_reserved:
                 self._limiter.decrease_once_finished(rpc_task)
 
     def _serving_task_crash_handler(self, object task):
@@ -1041,7 +1325,7 @@ cdef class AioServer:
         # The shutdown callback won't be called until there is no live RPC.
         grpc_server_shutdown_and_notify(
             self._server.c_server,
-            global_completion_queue(),
+            self._cq,
             self._shutdown_callback_wrapper.c_functor())
 
         # Ensures the serving task (coroutine) exits.
@@ -1117,11 +1401,29 @@ cdef class AioServer:
                 self,
                 self._status
             )
+        # Core no longer delivers events of the server unless it is serving.
+        if (self._status == AIO_SERVER_STATUS_READY or
+                self._status == AIO_SERVER_STATUS_STOPPED):
+            release_loop_completion_queue(self._loop)
         shutdown_grpc_aio()
 
     cdef thread_pool(self):
         """Access the thread pool instance."""
         return self._thread_pool
 
+    cdef int response_write_window(self):
+        """Access the response write window of sync handlers."""
+        return self._response_write_window
+
+    cdef void observe_queue_wait(self, double wait):
+        self._queue_wait += (wait - self._queue_wait) * _QUEUE_WAIT_SMOOTHING
+        self._queue_wait_observed_at = self._loop.time()
+
+    cdef double queue_wait(self):
+        # Decays while no RPC is scheduled, so that the estimate left by a
+        # backlog that has since cleared does not keep rejecting RPCs.
+        cdef double idle = self._loop.time() - self._queue_wait_observed_at
+        return self._queue_wait * 0.5 ** (idle / _QUEUE_WAIT_HALF_LIFE_S)
+
     def is_running(self):
         return self._status == AIO_SERVER_STATUS_RUNNING
@@ -51,6 +51,9 @@ cdef class _ChannelState:
   # A dict from _BatchOperationTag to _CallState
   cdef dict integrated_call_states
   cdef grpc_completion_queue *c_call_completion_queue
+  # The CompletionQueue backing c_call_completion_queue if it is shared with
+  # other channels, None if the channel owns it.
+  cdef object shared_call_completion_queue
 
   # A set of _CallState
   cdef set segregated_call_states
@@ -146,6 +146,7 @@ cdef object _operate_from_integrated_call(
       c_call_error, tag = _operate(call_state.c_call, operations, user_tag)
       if c_call_error == GRPC_CALL_OK:
         call_state.due.add(tag)
+        tag._channel_state = channel_state
         channel_state.integrated_call_states[tag] = call_state
         return True
       else:
@@ -317,6 +318,34 @@ cdef void _process_integrated_call_tag(
   if not call_state.due:
     call_state.delete_call()
 
+cdef _next_integrated_call_event(
+    grpc_completion_queue *c_completion_queue, object deadline):
+  """Blocks on the next event of integrated calls of one or more channels."""
+  cdef _ChannelState channel_state
+  tag, event = _latent_event(c_completion_queue, deadline)
+  if tag is not None:
+    channel_state = (<_BatchOperationTag>tag)._channel_state
+    with channel_state.condition:
+      _process_integrated_call_tag(channel_state, tag)
+      channel_state.condition.notify_all()
+  return event
+
+
+def next_integrated_call_event(CompletionQueue completion_queue, deadline=None):
+  """Blocks on the next event of a completion queue shared by channels.
+
+  Args:
+    completion_queue: A CompletionQueue passed to several Channels for their
+      integrated calls.
+    deadline: The point after which to give up waiting, or None.
+
+  Returns:
+    The event, whose tag is the one passed in with the operations.
+  """
+  return _next_integrated_call_event(
+      completion_queue.c_completion_queue, deadline)
+
+
 cdef class IntegratedCall:
 
   def __cinit__(self, _ChannelState channel_state, _CallState call_state):
@@ -338,7 +367,9 @@ cdef IntegratedCall _integrated_call(
   call_state = _CallState()
 
   def on_success(started_tags):
+    cdef _BatchOperationTag started_tag
     for started_tag in started_tags:
+      started_tag._channel_state = state
       state.integrated_call_states[started_tag] = call_state
 
   _call(
@@ -441,6 +472,21 @@ cdef object _watch_connectivity_state(
   return event
 
 
+cdef _watch_connectivity_state_on(
+    _ChannelState state, grpc_connectivity_state last_observed_state,
+    object deadline, CompletionQueue completion_queue, object tag):
+  cdef _ConnectivityTag connectivity_tag = _ConnectivityTag(tag)
+  with state.condition:
+    if state.open:
+      cpython.Py_INCREF(connectivity_tag)
+      grpc_channel_watch_connectivity_state(
+          state.c_channel, last_observed_state, _timespec_from_time(deadline),
+          completion_queue.c_completion_queue,
+          <cpython.PyObject *>connectivity_tag)
+    else:
+      raise ValueError('Cannot monitor channel state: %s' % state.closed_reason)
+
+
 cdef _close(Channel channel, grpc_status_code code, object details,
     drain_calls):
   cdef _ChannelState state = channel._state
@@ -471,7 +517,10 @@ cdef _close(Channel channel, grpc_status_code code, object details,
         while state.connectivity_due:
           state.condition.wait()
 
-      _destroy_c_completion_queue(state.c_call_completion_queue)
+      if state.shared_call_completion_queue is None:
+        _destroy_c_completion_queue(state.c_call_completion_queue)
+      else:
+        state.shared_call_completion_queue = None
       _destroy_c_completion_queue(state.c_connectivity_completion_queue)
       grpc_channel_destroy(state.c_channel)
       state.c_channel = NULL
@@ -492,12 +541,20 @@ cdef class Channel:
 
   def __cinit__(
       self, bytes target, object arguments,
-      ChannelCredentials channel_credentials):
+      ChannelCredentials channel_credentials,
+      CompletionQueue call_completion_queue=None):
     arguments = () if arguments is None else tuple(arguments)
     fork_handlers_and_grpc_init()
     self._state = _ChannelState(target)
-    self._state.c_call_completion_queue = (
-        grpc_completion_queue_create_for_next(NULL))
+    if call_completion_queue is None:
+      self._state.c_call_completion_queue = (
+          grpc_completion_queue_create_for_next(NULL))
+    else:
+      # Events of integrated calls must then be consumed with
+      # next_integrated_call_event.
+      self._state.c_call_completion_queue = (
+          call_completion_queue.c_completion_queue)
+      self._state.shared_call_completion_queue = call_completion_queue
     self._state.c_connectivity_completion_queue = (
         grpc_completion_queue_create_for_next(NULL))
     self._arguments = arguments
@@ -534,6 +591,9 @@ cdef class Channel:
       queue_deadline = time.time() + 1.0
     else:
       queue_deadline = None
+    if self._state.shared_call_completion_queue is not None:
+      return _next_integrated_call_event(
+          self._state.c_call_completion_queue, queue_deadline)
     # NOTE(gnossen): It is acceptable for on_failure to be None here because
     # failure conditions can only ever happen on the main thread and this
     # method is only ever invoked on the channel spin thread.
@@ -560,6 +620,24 @@ cdef class Channel:
       self, grpc_connectivity_state last_observed_state, object deadline):
     return _watch_connectivity_state(self._state, last_observed_state, deadline)
 
+  def watch_connectivity_state_on(
+      self, grpc_connectivity_state last_observed_state, object deadline,
+      CompletionQueue completion_queue, object tag):
+    """Starts watching the connectivity state without waiting for a change.
+
+    Args:
+      last_observed_state: The state the watch completes once it differs
+        from.
+      deadline: The point after which the watch completes anyway, or None.
+      completion_queue: A CompletionQueue that outlives the channel, on which
+        a ConnectivityEvent carrying tag is delivered once the watch
+        completes. Closing the channel completes the watch rather than
+        waiting for it.
+      tag: The tag of the ConnectivityEvent.
+    """
+    _watch_connectivity_state_on(
+        self._state, last_observed_state, deadline, completion_queue, tag)
+
   def close(self, code, details):
     _close(self, code, details, False)
 
@@ -91,8 +91,10 @@ cdef extern from "grpc/support/alloc.h":
 cdef extern from "grpc/byte_buffer_reader.h":
 
   struct grpc_byte_buffer_reader:
-    # We don't care about the internals
-    pass
+    # Compressed messages are decompressed into buffer_out, so it, rather than
+    # the buffer the reader was initialized with, holds the slices the reader
+    # yields.
+    grpc_byte_buffer *buffer_out
 
 
 cdef extern from "grpc/impl/codegen/grpc_types.h":
@@ -113,6 +115,8 @@ cdef extern from "grpc/grpc.h":
   grpc_slice grpc_slice_new(void *p, size_t len, void (*destroy)(void *)) nogil
   grpc_slice grpc_slice_new_with_len(
       void *p, size_t len, void (*destroy)(void *, size_t)) nogil
+  grpc_slice grpc_slice_new_with_user_data(
+      void *p, size_t len, void (*destroy)(void *), void *user_data) nogil
   grpc_slice grpc_slice_malloc(size_t length) nogil
   grpc_slice grpc_slice_from_copied_string(const char *source) nogil
   grpc_slice grpc_slice_from_copied_buffer(const char *source, size_t len) nogil
@@ -304,6 +308,9 @@ cdef extern from "grpc/grpc.h":
     grpc_slice value
     # ignore the 'internal_data.obfuscated' fields.
 
+  int grpc_header_key_is_legal(grpc_slice slice) nogil
+  int grpc_header_nonbin_value_is_legal(grpc_slice slice) nogil
+
   ctypedef enum grpc_completion_type:
     GRPC_QUEUE_SHUTDOWN
     GRPC_QUEUE_TIMEOUT
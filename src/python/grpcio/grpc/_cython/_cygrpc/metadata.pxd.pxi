@@ -13,6 +13,12 @@
 # limitations under the License.
 
 
+cdef class _MetadatumSlices:
+
+  cdef grpc_slice c_key
+  cdef grpc_slice c_value
+
+
 cdef void _store_c_metadata(
     metadata, grpc_metadata **c_metadata, size_t *c_count) except *
 
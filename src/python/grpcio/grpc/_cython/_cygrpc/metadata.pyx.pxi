@@ -23,9 +23,56 @@ class InitialMetadataFlags:
 
 _Metadatum = collections.namedtuple('_Metadatum', ('key', 'value',))
 
+# Received metadata keys are few and repeat from call to call, so their
+# decoded forms are kept rather than decoded for every call.
+cdef dict _decoded_metadata_keys = {}
+cdef Py_ssize_t _DECODED_METADATA_KEYS_LIMIT = 1024
+
+
+cdef class _MetadatumSlices:
+  """The core slices of a metadatum, encoded once and shared by many calls."""
+
+  def __cinit__(self):
+    self.c_key = grpc_empty_slice()
+    self.c_value = grpc_empty_slice()
+
+  def __dealloc__(self):
+    grpc_slice_unref(self.c_key)
+    grpc_slice_unref(self.c_value)
+
+
+class _PreparedMetadatum(tuple):
+  """A (key, value) metadatum carrying its already encoded core slices."""
+
+  def __new__(cls, key, value, slices):
+    metadatum = tuple.__new__(cls, (key, value))
+    metadatum.slices = slices
+    return metadatum
+
+
+def prepare_metadatum(key, value):
+  """Encodes and validates a metadatum for reuse across calls."""
+  cdef bytes encoded_key = _encode(key)
+  cdef bint binary = encoded_key[-4:] == b'-bin'
+  encoded_value = value if binary else _encode(value)
+  if not isinstance(encoded_value, bytes):
+    raise TypeError('Binary metadata key="%s" expected bytes, got %s' % (
+      key,
+      type(encoded_value)
+    ))
+  cdef _MetadatumSlices slices = _MetadatumSlices()
+  slices.c_key = _slice_from_bytes(encoded_key)
+  slices.c_value = _slice_from_bytes(encoded_value)
+  if not grpc_header_key_is_legal(slices.c_key):
+    raise ValueError('Invalid metadata key: %r' % (key,))
+  if not binary and not grpc_header_nonbin_value_is_legal(slices.c_value):
+    raise ValueError('Invalid metadata value for key %r: %r' % (key, value))
+  return _PreparedMetadatum(key, value, slices)
+
 
 cdef void _store_c_metadata(
     metadata, grpc_metadata **c_metadata, size_t *c_count) except *:
+  cdef _MetadatumSlices slices
   if metadata is None:
     c_count[0] = 0
     c_metadata[0] = NULL
@@ -38,7 +85,13 @@ cdef void _store_c_metadata(
       c_count[0] = metadatum_count
       c_metadata[0] = <grpc_metadata *>gpr_malloc(
           metadatum_count * sizeof(grpc_metadata))
-      for index, (key, value) in enumerate(metadata):
+      for index, metadatum in enumerate(metadata):
+        if type(metadatum) is _PreparedMetadatum:
+          slices = metadatum.slices
+          c_metadata[0][index].key = grpc_slice_ref(slices.c_key)
+          c_metadata[0][index].value = grpc_slice_ref(slices.c_value)
+          continue
+        key, value = metadatum
         encoded_key = _encode(key)
         encoded_value = value if encoded_key[-4:] == b'-bin' else _encode(value)
         if not isinstance(encoded_value, bytes):
@@ -58,11 +111,21 @@ cdef void _release_c_metadata(grpc_metadata *c_metadata, int count) except *:
     gpr_free(c_metadata)
 
 
+cdef str _decode_metadata_key(bytes key):
+  cdef str decoded_key = _decoded_metadata_keys.get(key)
+  if decoded_key is None:
+    decoded_key = _decode(key)
+    if len(_decoded_metadata_keys) < _DECODED_METADATA_KEYS_LIMIT:
+      _decoded_metadata_keys[key] = decoded_key
+  return decoded_key
+
+
 cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice):
   cdef bytes key = _slice_bytes(key_slice)
   cdef bytes value = _slice_bytes(value_slice)
   return <tuple>_Metadatum(
-      _decode(key), value if key[-4:] == b'-bin' else _decode(value))
+      _decode_metadata_key(key),
+      value if key[-4:] == b'-bin' else _decode(value))
 
 
 cdef tuple _metadata(grpc_metadata_array *c_metadata_array):
@@ -35,7 +35,7 @@ cdef class SendInitialMetadataOperation(Operation):
 
 cdef class SendMessageOperation(Operation):
 
-  cdef readonly bytes _message
+  cdef readonly object _message
   cdef readonly int _flags
   cdef grpc_byte_buffer *_c_message_byte_buffer
 
@@ -75,11 +75,19 @@ cdef class ReceiveInitialMetadataOperation(Operation):
   cdef void un_c(self) except *
 
 
+cdef class _SliceBuffer:
+
+  cdef grpc_slice _c_slice
+
+
 cdef class ReceiveMessageOperation(Operation):
 
   cdef readonly int _flags
   cdef grpc_byte_buffer *_c_message_byte_buffer
-  cdef bytes _message
+  cdef grpc_slice _c_message_slice
+  cdef bint _has_c_message_slice
+  # None, bytes, or a _SliceBuffer once message_view() has been called.
+  cdef object _message
 
   cdef void c(self) except *
   cdef void un_c(self) except *
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from libc.string cimport memcpy
+
 
 cdef class Operation:
 
@@ -46,13 +48,67 @@ cdef class SendInitialMetadataOperation(Operation):
         self._c_initial_metadata, self._c_initial_metadata_count)
 
 
+# Messages at least this large are wrapped in a slice that borrows the
+# memory of the Python object rather than being copied into core.
+cdef Py_ssize_t _ZERO_COPY_SEND_MIN_BYTES = 64 * 1024
+
+
+# This is called by C-core once it drops the last reference to a zero-copy
+# message slice, possibly from a core thread. Like _destroy() in
+# credentials.pyx.pxi, it must not grab the GIL once Python is shutting down.
+cdef void _release_message_buffer(void *view) noexcept nogil:
+  global g_shutdown_mu
+  global g_shutting_down
+  g_shutdown_mu.lock()
+  if g_shutting_down > -1:
+    g_shutting_down += 1
+    g_shutdown_mu.unlock()
+    with gil:
+      cpython.PyBuffer_Release(<Py_buffer *>view)
+    g_shutdown_mu.lock()
+    g_shutting_down -= 1
+  g_shutdown_mu.unlock()
+  gpr_free(view)
+
+
+cdef grpc_slice _message_slice(object message) except *:
+  cdef Py_buffer *view
+  cdef grpc_slice message_slice
+  if type(message) is bytes and len(message) < _ZERO_COPY_SEND_MIN_BYTES:
+    return grpc_slice_from_copied_buffer(<bytes>message, len(message))
+  view = <Py_buffer *>gpr_malloc(sizeof(Py_buffer))
+  try:
+    cpython.PyObject_GetBuffer(message, view, cpython.PyBUF_SIMPLE)
+  except:
+    gpr_free(view)
+    raise
+  if view.len < _ZERO_COPY_SEND_MIN_BYTES:
+    message_slice = grpc_slice_from_copied_buffer(
+        <const char *>view.buf, view.len)
+    cpython.PyBuffer_Release(view)
+    gpr_free(view)
+    return message_slice
+  # The exported buffer pins the message object until core releases the slice.
+  _maybe_register_shutdown_handler()
+  return grpc_slice_new_with_user_data(
+      view.buf, view.len, _release_message_buffer, view)
+
+
 cdef class SendMessageOperation(Operation):
 
-  def __cinit__(self, bytes message, int flags):
+  def __cinit__(self, object message, int flags):
     if message is None:
       self._message = b''
-    else:
+    elif isinstance(message, bytes):
       self._message = message
+    else:
+      # Any object exporting the buffer protocol may be sent. A slice can only
+      # borrow contiguous memory, so other buffers are flattened here.
+      message_view = memoryview(message)
+      if message_view.c_contiguous:
+        self._message = message_view
+      else:
+        self._message = message_view.tobytes()
     self._flags = flags
 
   def type(self):
@@ -61,8 +117,7 @@ cdef class SendMessageOperation(Operation):
   cdef void c(self) except *:
     self.c_op.type = GRPC_OP_SEND_MESSAGE
     self.c_op.flags = self._flags
-    cdef grpc_slice message_slice = grpc_slice_from_copied_buffer(
-        self._message, len(self._message))
+    cdef grpc_slice message_slice = _message_slice(self._message)
     self._c_message_byte_buffer = grpc_raw_byte_buffer_create(
         &message_slice, 1)
     grpc_slice_unref(message_slice)
@@ -142,10 +197,30 @@ cdef class ReceiveInitialMetadataOperation(Operation):
     return self._initial_metadata
 
 
+cdef class _SliceBuffer:
+  """Exports the memory of a core slice through the buffer protocol."""
+
+  def __cinit__(self):
+    self._c_slice = grpc_empty_slice()
+
+  def __getbuffer__(self, Py_buffer *buffer, int flags):
+    cpython.PyBuffer_FillInfo(
+        buffer, self, grpc_slice_start_ptr(self._c_slice),
+        grpc_slice_length(self._c_slice), 1, flags)
+
+  def __dealloc__(self):
+    grpc_slice_unref(self._c_slice)
+
+
 cdef class ReceiveMessageOperation(Operation):
 
   def __cinit__(self, flags):
     self._flags = flags
+    self._has_c_message_slice = False
+
+  def __dealloc__(self):
+    if self._has_c_message_slice:
+      grpc_slice_unref(self._c_message_slice)
 
   def type(self):
     return GRPC_OP_RECV_MESSAGE
@@ -160,29 +235,66 @@ cdef class ReceiveMessageOperation(Operation):
     cdef grpc_byte_buffer_reader message_reader
     cdef bint message_reader_status
     cdef grpc_slice message_slice
+    cdef size_t message_length
     cdef size_t message_slice_length
-    cdef void *message_slice_pointer
+    cdef size_t message_offset
+    cdef char *message_pointer
+    self._message = None
     if self._c_message_byte_buffer != NULL:
       message_reader_status = grpc_byte_buffer_reader_init(
           &message_reader, self._c_message_byte_buffer)
       if message_reader_status:
-        message = bytearray()
-        while grpc_byte_buffer_reader_next(&message_reader, &message_slice):
-          message_slice_pointer = grpc_slice_start_ptr(message_slice)
-          message_slice_length = grpc_slice_length(message_slice)
-          message += (<char *>message_slice_pointer)[:message_slice_length]
-          grpc_slice_unref(message_slice)
+        message_length = grpc_byte_buffer_length(message_reader.buffer_out)
+        if not grpc_byte_buffer_reader_next(&message_reader, &message_slice):
+          self._message = b''
+        elif grpc_slice_length(message_slice) == message_length:
+          # The whole message is in one slice, which is kept until the message
+          # is read so that message_view() can hand it out without a copy.
+          self._c_message_slice = message_slice
+          self._has_c_message_slice = True
+        else:
+          message = cpython.PyBytes_FromStringAndSize(NULL, message_length)
+          message_pointer = cpython.PyBytes_AS_STRING(message)
+          message_offset = 0
+          while True:
+            message_slice_length = grpc_slice_length(message_slice)
+            memcpy(message_pointer + message_offset,
+                   grpc_slice_start_ptr(message_slice), message_slice_length)
+            message_offset += message_slice_length
+            grpc_slice_unref(message_slice)
+            if not grpc_byte_buffer_reader_next(
+                &message_reader, &message_slice):
+              break
+          self._message = message
         grpc_byte_buffer_reader_destroy(&message_reader)
-        self._message = bytes(message)
-      else:
-        self._message = None
       grpc_byte_buffer_destroy(self._c_message_byte_buffer)
-    else:
-      self._message = None
 
   def message(self):
+    if self._has_c_message_slice:
+      self._message = (<char *>grpc_slice_start_ptr(self._c_message_slice))[
+          :grpc_slice_length(self._c_message_slice)]
+      grpc_slice_unref(self._c_message_slice)
+      self._has_c_message_slice = False
+    elif type(self._message) is _SliceBuffer:
+      return bytes(self._message)
     return self._message
 
+  def message_view(self):
+    """Returns the message as a read-only memoryview.
+
+    A message received in a single slice is not copied; the memoryview keeps
+    that slice alive for as long as it is referenced.
+    """
+    cdef _SliceBuffer slice_buffer
+    if self._has_c_message_slice:
+      slice_buffer = _SliceBuffer()
+      slice_buffer._c_slice = self._c_message_slice
+      self._has_c_message_slice = False
+      self._message = slice_buffer
+    if self._message is None:
+      return None
+    return memoryview(self._message)
+
 
 cdef class ReceiveStatusOnClientOperation(Operation):
 
@@ -41,6 +41,9 @@ cdef class _BatchOperationTag(_Tag):
   cdef object _user_tag
   cdef readonly object _operations
   cdef readonly object _retained_call
+  # The _ChannelState of an integrated call, for completion queues shared by
+  # several channels.
+  cdef object _channel_state
   cdef grpc_op *c_ops
   cdef size_t c_nops
 
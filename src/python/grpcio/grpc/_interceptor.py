@@ -16,7 +16,7 @@
 import collections
 import sys
 import types
-from typing import Any, Callable, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
 import grpc
 
@@ -27,11 +27,41 @@ from ._typing import RequestIterableType
 from ._typing import SerializingFunction
 
 
+class CacheableServerInterceptor(object):
+    """Marks a server interceptor whose handler depends on the method alone.
+
+    Mixed into a grpc.ServerInterceptor or a grpc.aio.ServerInterceptor, it
+    declares that intercept_service only wraps or passes through the handler
+    returned by its continuation, and that neither the handler it returns
+    nor its own behavior depends on anything but the method of the
+    handler call details. Once all the interceptors of a server are
+    cacheable, the server runs them once per method served by a fixed
+    handler and reuses the resulting handler for all later RPCs to that
+    method, so per-RPC work must be done by the returned handler rather than
+    in intercept_service. Methods served by a fixed handler are registered
+    methods and, on servers other than grpc.aio ones, the methods of
+    grpc.experimental.StaticGenericRpcHandler instances.
+
+    This is an EXPERIMENTAL API.
+    """
+
+
+def cacheable_interceptors(interceptors: Optional[Sequence[Any]]) -> bool:
+    return bool(interceptors) and all(
+        isinstance(interceptor, CacheableServerInterceptor)
+        for interceptor in interceptors
+    )
+
+
 class _ServicePipeline(object):
     interceptors: Tuple[grpc.ServerInterceptor]
+    cacheable: bool
+    _cached_handlers: Dict[str, grpc.RpcMethodHandler]
 
     def __init__(self, interceptors: Sequence[grpc.ServerInterceptor]):
         self.interceptors = tuple(interceptors)
+        self.cacheable = cacheable_interceptors(self.interceptors)
+        self._cached_handlers = {}
 
     def _continuation(self, thunk: Callable, index: int) -> Callable:
         return lambda context: self._intercept_at(thunk, index, context)
@@ -51,6 +81,22 @@ class _ServicePipeline(object):
     ) -> grpc.RpcMethodHandler:
         return self._intercept_at(thunk, 0, context)
 
+    def cached_handler(self, method: str) -> Optional[grpc.RpcMethodHandler]:
+        return self._cached_handlers.get(method)
+
+    def execute_and_cache(
+        self, thunk: Callable, context: grpc.HandlerCallDetails
+    ) -> grpc.RpcMethodHandler:
+        """Executes the pipeline and keeps its handler for the method.
+
+        Only valid for cacheable pipelines and methods whose handler before
+        interception is the same for every RPC.
+        """
+        method_handler = self.execute(thunk, context)
+        if method_handler is not None:
+            self._cached_handlers[context.method] = method_handler
+        return method_handler
+
 
 def service_pipeline(
     interceptors: Optional[Sequence[grpc.ServerInterceptor]],
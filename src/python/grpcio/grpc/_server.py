@@ -27,6 +27,7 @@ import traceback
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     Iterator,
@@ -42,8 +43,10 @@ from typing import (
 import grpc  # pytype: disable=pyi-error
 from grpc import _common  # pytype: disable=pyi-error
 from grpc import _compression  # pytype: disable=pyi-error
+from grpc import _concurrency_limiter  # pytype: disable=pyi-error
 from grpc import _interceptor  # pytype: disable=pyi-error
 from grpc import _observability  # pytype: disable=pyi-error
+from grpc import _utilities  # pytype: disable=pyi-error
 from grpc._cython import cygrpc
 from grpc._typing import ArityAgnosticMethodHandler
 from grpc._typing import ChannelArgumentType
@@ -51,14 +54,15 @@ from grpc._typing import DeserializingFunction
 from grpc._typing import MetadataType
 from grpc._typing import NullaryCallbackType
 from grpc._typing import ResponseType
+from grpc._typing import SerializedMessageType
 from grpc._typing import SerializingFunction
 from grpc._typing import ServerCallbackTag
 from grpc._typing import ServerTagCallbackType
+import grpc.experimental  # pytype: disable=pyi-error
 
 _LOGGER = logging.getLogger(__name__)
 
 _SHUTDOWN_TAG = "shutdown"
-_REQUEST_CALL_TAG = "request_call"
 
 _RECEIVE_CLOSE_ON_SERVER_TOKEN = "receive_close_on_server"
 _SEND_INITIAL_METADATA_TOKEN = "send_initial_metadata"
@@ -81,9 +85,21 @@ _EMPTY_FLAGS = 0
 _DEALLOCATED_SERVER_CHECK_PERIOD_S = 1.0
 _INF_TIMEOUT = 1e9
 
+_DEFAULT_PENDING_CALL_SLOTS = 1
+_DEFAULT_COMPLETION_QUEUE_SHARDS = 1
+_DEFAULT_RESPONSE_WRITE_WINDOW = 1
+_DEFAULT_REQUEST_PREFETCH_DEPTH = 1
+_QUEUE_WAIT_SMOOTHING = 0.1
+_QUEUE_WAIT_HALF_LIFE_S = 1.0
 
-def _serialized_request(request_event: cygrpc.BaseEvent) -> bytes:
-    return request_event.batch_operations[0].message()
+
+def _serialized_request(
+    request_event: cygrpc.BaseEvent,
+    request_deserializer: Optional[DeserializingFunction],
+) -> Optional[Union[bytes, memoryview]]:
+    return _common.received_message(
+        request_event.batch_operations[0], request_deserializer
+    )
 
 
 def _application_code(code: grpc.StatusCode) -> cygrpc.StatusCode:
@@ -124,6 +140,24 @@ class _HandlerCallDetails(
     pass
 
 
+class _RequestCallSlot(
+    collections.namedtuple(
+        "_RequestCallSlot",
+        (
+            "method",
+            "index",
+        ),
+    )
+):
+    """Identifies one request_call kept armed on the completion queue.
+
+    Attributes:
+      method: The fully qualified name of a registered method, or None for
+        the slots accepting calls to unregistered methods.
+      index: The index of this slot among the slots of the same method.
+    """
+
+
 class _Method(abc.ABC):
     @abc.abstractmethod
     def name(self) -> Optional[str]:
@@ -135,6 +169,11 @@ class _Method(abc.ABC):
     ) -> Optional[grpc.RpcMethodHandler]:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def static_handler(self, method: str) -> Optional[grpc.RpcMethodHandler]:
+        """Returns the handler that serves every RPC to method, if fixed."""
+        raise NotImplementedError()
+
 
 class _RegisteredMethod(_Method):
     def __init__(
@@ -153,13 +192,33 @@ class _RegisteredMethod(_Method):
     ) -> Optional[grpc.RpcMethodHandler]:
         return self._registered_handler
 
+    def static_handler(self, method: str) -> Optional[grpc.RpcMethodHandler]:
+        return self._registered_handler
+
 
 class _GenericMethod(_Method):
+    _static_handlers: Dict[str, grpc.RpcMethodHandler]
+    _dynamic_handlers: Tuple[grpc.GenericRpcHandler, ...]
+
     def __init__(
         self,
-        generic_handlers: List[grpc.GenericRpcHandler],
+        generic_handlers: Sequence[grpc.GenericRpcHandler],
     ):
-        self._generic_handlers = generic_handlers
+        # The static generic handlers before the first other one are indexed
+        # by method. The others may pick a handler by anything in the
+        # handler call details, so they are still asked for each RPC.
+        self._static_handlers = {}
+        dynamic_start = len(generic_handlers)
+        for index, generic_handler in enumerate(generic_handlers):
+            if not isinstance(
+                generic_handler, _utilities.StaticGenericRpcHandler
+            ):
+                dynamic_start = index
+                break
+            method_handlers = generic_handler.method_handlers()
+            for method, method_handler in method_handlers.items():
+                self._static_handlers.setdefault(method, method_handler)
+        self._dynamic_handlers = tuple(generic_handlers[dynamic_start:])
 
     def name(self) -> Optional[str]:
         return None
@@ -169,12 +228,42 @@ class _GenericMethod(_Method):
     ) -> Optional[grpc.RpcMethodHandler]:
         # If the same method have both generic and registered handler,
         # registered handler will take precedence.
-        for generic_handler in self._generic_handlers:
+        method_handler = self._static_handlers.get(handler_call_details.method)
+        if method_handler is not None:
+            return method_handler
+        for generic_handler in self._dynamic_handlers:
             method_handler = generic_handler.service(handler_call_details)
             if method_handler is not None:
                 return method_handler
         return None
 
+    def static_handler(self, method: str) -> Optional[grpc.RpcMethodHandler]:
+        return self._static_handlers.get(method)
+
+
+class _QueueWaitEstimate(object):
+    """A moving average of how long RPCs wait for their handler to start."""
+
+    lock: threading.Lock
+    average: float
+    observed_at: float
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.average = 0.0
+        self.observed_at = time.monotonic()
+
+    def observe(self, wait: float) -> None:
+        with self.lock:
+            self.average += (wait - self.average) * _QUEUE_WAIT_SMOOTHING
+            self.observed_at = time.monotonic()
+
+    def seconds(self) -> float:
+        # Decays while no RPC is taken up, so that the estimate left by a
+        # backlog that has since cleared does not keep rejecting RPCs.
+        idle = time.monotonic() - self.observed_at
+        return self.average * 0.5 ** (idle / _QUEUE_WAIT_HALF_LIFE_S)
+
 
 class _RPCState(object):
     context: contextvars.Context
@@ -192,8 +281,20 @@ class _RPCState(object):
     rpc_errors: List[Exception]
     callbacks: Optional[List[NullaryCallbackType]]
     aborted: bool
+    write_window: int
+    pending_writes: Deque[Sequence[cygrpc.Operation]]
+    prefetch_depth: int
+    queue_wait_estimate: Optional[_QueueWaitEstimate]
+    queued_at: Optional[float]
+    handler_started_at: Optional[float]
+    non_blocking: bool
 
-    def __init__(self):
+    def __init__(
+        self,
+        write_window: int = _DEFAULT_RESPONSE_WRITE_WINDOW,
+        prefetch_depth: int = _DEFAULT_REQUEST_PREFETCH_DEPTH,
+        queue_wait_estimate: Optional[_QueueWaitEstimate] = None,
+    ):
         self.context = contextvars.Context()
         self.condition = threading.Condition()
         self.due = set()
@@ -209,6 +310,13 @@ class _RPCState(object):
         self.rpc_errors = []
         self.callbacks = []
         self.aborted = False
+        self.write_window = write_window
+        self.pending_writes = collections.deque()
+        self.prefetch_depth = prefetch_depth
+        self.queue_wait_estimate = queue_wait_estimate
+        self.queued_at = None
+        self.handler_started_at = None
+        self.non_blocking = False
 
 
 def _raise_rpc_error(state: _RPCState) -> None:
@@ -291,6 +399,8 @@ def _abort(
                 ),
             )
             token = _SEND_STATUS_FROM_SERVER_TOKEN
+        # Responses that were not handed to core yet are dropped.
+        state.pending_writes.clear()
         call.start_server_batch(
             operations, _send_status_from_server(state, token)
         )
@@ -317,7 +427,9 @@ def _receive_message(
     request_deserializer: Optional[DeserializingFunction],
 ) -> ServerCallbackTag:
     def receive_message(receive_message_event):
-        serialized_request = _serialized_request(receive_message_event)
+        serialized_request = _serialized_request(
+            receive_message_event, request_deserializer
+        )
         if serialized_request is None:
             with state.condition:
                 if state.client is _OPEN:
@@ -352,15 +464,54 @@ def _send_initial_metadata(state: _RPCState) -> ServerCallbackTag:
     return send_initial_metadata
 
 
-def _send_message(state: _RPCState, token: str) -> ServerCallbackTag:
+def _send_message(
+    state: _RPCState, call: cygrpc.Call, token: str
+) -> ServerCallbackTag:
     def send_message(unused_send_message_event):
         with state.condition:
             state.condition.notify_all()
+            if state.pending_writes:
+                if _is_rpc_state_active(state):
+                    state.due.remove(token)
+                    _start_send_message(
+                        state,
+                        call,
+                        state.pending_writes.popleft(),
+                        _SEND_MESSAGE_TOKEN,
+                    )
+                    return None, ()
+                state.pending_writes.clear()
             return _possibly_finish_call(state, token)
 
     return send_message
 
 
+def _start_send_message(
+    state: _RPCState,
+    call: cygrpc.Call,
+    operations: Sequence[cygrpc.Operation],
+    token: str,
+) -> None:
+    call.start_server_batch(operations, _send_message(state, call, token))
+    state.due.add(token)
+
+
+def _writes_in_flight(state: _RPCState) -> int:
+    """Counts the responses accepted for the RPC but not yet sent.
+
+    Core allows a single SendMessage batch per call at a time, so at most one
+    response is in core and the others wait in state.pending_writes until the
+    batch before them completes.
+    """
+    if (
+        _SEND_MESSAGE_TOKEN in state.due
+        or _SEND_INITIAL_METADATA_AND_SEND_MESSAGE_TOKEN in state.due
+    ):
+        return len(state.pending_writes) + 1
+    else:
+        return len(state.pending_writes)
+
+
 class _Context(grpc.ServicerContext):
     _rpc_event: cygrpc.BaseEvent
     _state: _RPCState
@@ -484,19 +635,176 @@ class _Context(grpc.ServicerContext):
 
 
 class _RequestIterator(object):
+    """Iterates over the requests of a request-streaming RPC.
+
+    With a prefetch depth above one, requests are received and deserialized
+    ahead of the handler into a buffer of that many requests. Core allows a
+    single ReceiveMessage batch per call at a time, so the completion of each
+    receive starts the next one until the buffer is full, and the handler
+    taking a request makes room for more.
+
+    A non-blocking handler may instead have the requests delivered to a
+    callback as they arrive, in which case they are taken from the same
+    buffer by the thread pool of the handler.
+    """
+
     _state: _RPCState
     _call: cygrpc.Call
     _request_deserializer: Optional[DeserializingFunction]
+    _prefetch_depth: int
+    _prefetched_requests: Deque[Any]
+    _end_of_stream: bool
+    _thread_pool: Optional[futures.ThreadPoolExecutor]
+    _request_callback: Optional[Callable[[Any], None]]
+    _delivering: bool
 
     def __init__(
         self,
         state: _RPCState,
         call: cygrpc.Call,
         request_deserializer: Optional[DeserializingFunction],
+        prefetch_depth: int = _DEFAULT_REQUEST_PREFETCH_DEPTH,
+        thread_pool: Optional[futures.ThreadPoolExecutor] = None,
     ):
         self._state = state
         self._call = call
         self._request_deserializer = request_deserializer
+        self._prefetch_depth = prefetch_depth
+        self._prefetched_requests = collections.deque()
+        self._end_of_stream = False
+        self._thread_pool = thread_pool
+        self._request_callback = None
+        self._delivering = False
+        if prefetch_depth > 1:
+            with state.condition:
+                self._maybe_prefetch_request()
+
+    def deliver_to(self, request_callback: Callable[[Any], None]) -> None:
+        """Delivers the remaining requests to a callback instead.
+
+        The callback is called in the thread pool of the handler with each
+        request in order, never concurrently, and with None once the client
+        is done sending requests. It is not called after the RPC terminated.
+        """
+        with self._state.condition:
+            self._request_callback = request_callback
+            self._maybe_prefetch_request()
+            self._maybe_deliver_requests()
+
+    def _maybe_deliver_requests(self) -> None:
+        if (
+            self._request_callback is not None
+            and not self._delivering
+            and (self._prefetched_requests or self._end_of_stream)
+        ):
+            self._delivering = True
+            self._thread_pool.submit(
+                self._state.context.run, self._deliver_requests
+            )
+
+    def _take_request_to_deliver(self) -> Tuple[Any, bool]:
+        with self._state.condition:
+            if not _is_rpc_state_active(self._state):
+                return None, False
+            elif self._prefetched_requests:
+                request = self._prefetched_requests.popleft()
+                self._maybe_prefetch_request()
+                return request, True
+            elif self._end_of_stream:
+                # Marks the end of stream as delivered.
+                self._request_callback = None
+                return None, True
+            else:
+                self._delivering = False
+                return None, False
+
+    def _deliver_requests(self) -> None:
+        request_callback = self._request_callback
+        while True:
+            request, proceed = self._take_request_to_deliver()
+            if not proceed:
+                return
+            try:
+                request_callback(request)
+            except Exception as exception:  # pylint: disable=broad-except
+                _abort_for_application_exception(
+                    self._state, self._call, exception
+                )
+                return
+            if request is None:
+                return
+
+    def _can_prefetch_request(self) -> bool:
+        return (
+            not self._end_of_stream
+            and len(self._prefetched_requests) < self._prefetch_depth
+            and self._state.client is _OPEN
+            and _is_rpc_state_active(self._state)
+        )
+
+    def _start_prefetching_request(self) -> None:
+        self._call.start_server_batch(
+            (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+            self._receive_prefetched_request,
+        )
+        self._state.due.add(_RECEIVE_MESSAGE_TOKEN)
+
+    def _maybe_prefetch_request(self) -> None:
+        if (
+            _RECEIVE_MESSAGE_TOKEN not in self._state.due
+            and self._can_prefetch_request()
+        ):
+            self._start_prefetching_request()
+
+    def _receive_prefetched_request(
+        self, receive_message_event: cygrpc.BaseEvent
+    ) -> ServerTagCallbackType:
+        serialized_request = _serialized_request(
+            receive_message_event, self._request_deserializer
+        )
+        if serialized_request is None:
+            request = None
+        else:
+            request = _common.deserialize(
+                serialized_request, self._request_deserializer
+            )
+        with self._state.condition:
+            if serialized_request is None:
+                self._end_of_stream = True
+            elif request is None:
+                _abort(
+                    self._state,
+                    self._call,
+                    cygrpc.StatusCode.internal,
+                    b"Exception deserializing request!",
+                )
+            else:
+                self._prefetched_requests.append(request)
+            self._state.condition.notify_all()
+            self._maybe_deliver_requests()
+            if self._can_prefetch_request():
+                # The receive token stays due for the next receive.
+                self._start_prefetching_request()
+                return None, ()
+            else:
+                return _possibly_finish_call(
+                    self._state, _RECEIVE_MESSAGE_TOKEN
+                )
+
+    def _next_prefetched(self) -> Any:
+        with self._state.condition:
+            while True:
+                if self._state.client is _CANCELLED:
+                    _raise_rpc_error(self._state)
+                elif self._prefetched_requests:
+                    request = self._prefetched_requests.popleft()
+                    self._maybe_prefetch_request()
+                    return request
+                elif _RECEIVE_MESSAGE_TOKEN not in self._state.due:
+                    if not self._can_prefetch_request():
+                        raise StopIteration()
+                    self._start_prefetching_request()
+                self._state.condition.wait()
 
     def _raise_or_start_receive_message(self) -> None:
         if self._state.client is _CANCELLED:
@@ -528,6 +836,8 @@ class _RequestIterator(object):
         raise AssertionError()  # should never run
 
     def _next(self) -> Any:
+        if self._prefetch_depth > 1:
+            return self._next_prefetched()
         with self._state.condition:
             self._raise_or_start_receive_message()
             while True:
@@ -587,6 +897,39 @@ def _unary_request(
     return unary_request
 
 
+def _abort_for_application_exception(
+    state: _RPCState, call: cygrpc.Call, exception: Exception
+) -> None:
+    with state.condition:
+        if state.aborted:
+            _abort(
+                state,
+                call,
+                cygrpc.StatusCode.unknown,
+                b"RPC Aborted",
+            )
+        elif exception not in state.rpc_errors:
+            try:
+                details = "Exception calling application: {}".format(exception)
+            except Exception:  # pylint: disable=broad-except
+                details = "Calling application raised unprintable Exception!"
+                _LOGGER.exception(
+                    traceback.format_exception(
+                        type(exception),
+                        exception,
+                        exception.__traceback__,
+                    )
+                )
+                traceback.print_exc()
+            _LOGGER.exception(details)
+            _abort(
+                state,
+                call,
+                cygrpc.StatusCode.unknown,
+                _common.encode(details),
+            )
+
+
 def _call_behavior(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
@@ -610,38 +953,7 @@ def _call_behavior(
                 response_or_iterator = behavior(argument, context)
             return response_or_iterator, True
         except Exception as exception:  # pylint: disable=broad-except
-            with state.condition:
-                if state.aborted:
-                    _abort(
-                        state,
-                        rpc_event.call,
-                        cygrpc.StatusCode.unknown,
-                        b"RPC Aborted",
-                    )
-                elif exception not in state.rpc_errors:
-                    try:
-                        details = "Exception calling application: {}".format(
-                            exception
-                        )
-                    except Exception:  # pylint: disable=broad-except
-                        details = (
-                            "Calling application raised unprintable Exception!"
-                        )
-                        _LOGGER.exception(
-                            traceback.format_exception(
-                                type(exception),
-                                exception,
-                                exception.__traceback__,
-                            )
-                        )
-                        traceback.print_exc()
-                    _LOGGER.exception(details)
-                    _abort(
-                        state,
-                        rpc_event.call,
-                        cygrpc.StatusCode.unknown,
-                        _common.encode(details),
-                    )
+            _abort_for_application_exception(state, rpc_event.call, exception)
             return None, False
 
 
@@ -710,7 +1022,9 @@ def _reset_per_message_state(state: _RPCState) -> None:
 
 
 def _send_response(
-    rpc_event: cygrpc.BaseEvent, state: _RPCState, serialized_response: bytes
+    rpc_event: cygrpc.BaseEvent,
+    state: _RPCState,
+    serialized_response: SerializedMessageType,
 ) -> bool:
     with state.condition:
         if not _is_rpc_state_active(state):
@@ -734,15 +1048,18 @@ def _send_response(
                     ),
                 )
                 token = _SEND_MESSAGE_TOKEN
-            rpc_event.call.start_server_batch(
-                operations, _send_message(state, token)
-            )
-            state.due.add(token)
+            if _writes_in_flight(state):
+                state.pending_writes.append(operations)
+            else:
+                _start_send_message(state, rpc_event.call, operations, token)
             _reset_per_message_state(state)
-            while True:
+            # The handler only blocks once its write window is full.
+            while (
+                _is_rpc_state_active(state)
+                and _writes_in_flight(state) >= state.write_window
+            ):
                 state.condition.wait()
-                if token not in state.due:
-                    return _is_rpc_state_active(state)
+            return _is_rpc_state_active(state)
 
 
 def _status(
@@ -751,6 +1068,9 @@ def _status(
     serialized_response: Optional[bytes],
 ) -> None:
     with state.condition:
+        # The status must follow the responses still in the write window.
+        while state.client is not _CANCELLED and _writes_in_flight(state):
+            state.condition.wait()
         if state.client is not _CANCELLED:
             code = _completion_code(state)
             details = _details(state)
@@ -777,6 +1097,88 @@ def _status(
             state.due.add(_SEND_STATUS_FROM_SERVER_TOKEN)
 
 
+def _is_non_blocking_behavior(behavior: ArityAgnosticMethodHandler) -> bool:
+    return bool(getattr(behavior, "experimental_non_blocking", False))
+
+
+def _is_non_blocking_method_handler(
+    method_handler: grpc.RpcMethodHandler,
+) -> bool:
+    if method_handler.request_streaming:
+        if method_handler.response_streaming:
+            behavior = method_handler.stream_stream
+        else:
+            behavior = method_handler.stream_unary
+    else:
+        if method_handler.response_streaming:
+            behavior = method_handler.unary_stream
+        else:
+            behavior = method_handler.unary_unary
+    return _is_non_blocking_behavior(behavior)
+
+
+def _call_non_blocking_behavior(
+    rpc_event: cygrpc.BaseEvent,
+    state: _RPCState,
+    behavior: ArityAgnosticMethodHandler,
+    argument: Any,
+    request_deserializer: Optional[DeserializingFunction],
+    send_response_callback: Callable[[ResponseType], None],
+) -> None:
+    """Calls a behavior that sends its responses through a callback.
+
+    The behavior returns without waiting for the RPC to complete. A behavior
+    of a request-streaming RPC may return a callable, to which the requests
+    are then delivered as they arrive instead of through the request
+    iterator.
+    """
+    request_callback, proceed = _call_behavior(
+        rpc_event,
+        state,
+        behavior,
+        argument,
+        request_deserializer,
+        send_response_callback=send_response_callback,
+    )
+    if (
+        proceed
+        and callable(request_callback)
+        and isinstance(argument, _RequestIterator)
+    ):
+        argument.deliver_to(request_callback)
+
+
+def _deadline_expires_within(
+    rpc_event: cygrpc.BaseEvent, seconds: float
+) -> bool:
+    return rpc_event.call_details.deadline - time.time() <= seconds
+
+
+def _start_handler(rpc_event: cygrpc.BaseEvent, state: _RPCState) -> bool:
+    """Records that a worker took up the RPC, returning whether to handle it.
+
+    RPCs that were cancelled or whose deadline passed while they were queued
+    are dropped rather than handled.
+    """
+    started_at = time.monotonic()
+    if state.queue_wait_estimate is not None and state.queued_at is not None:
+        state.queue_wait_estimate.observe(started_at - state.queued_at)
+    with state.condition:
+        if not _is_rpc_state_active(state):
+            return False
+        elif _deadline_expires_within(rpc_event, 0):
+            _abort(
+                state,
+                rpc_event.call,
+                cygrpc.StatusCode.deadline_exceeded,
+                b"Deadline Exceeded",
+            )
+            return False
+        else:
+            state.handler_started_at = started_at
+            return True
+
+
 def _unary_response_in_pool(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
@@ -785,20 +1187,41 @@ def _unary_response_in_pool(
     request_deserializer: Optional[SerializingFunction],
     response_serializer: Optional[SerializingFunction],
 ) -> None:
+    if not _start_handler(rpc_event, state):
+        return
     cygrpc.install_context_from_request_call_event(rpc_event)
 
+    def send_response(response: Any) -> None:
+        # Like the response returned by a blocking behavior, None fails to
+        # serialize, so the RPC is aborted with the code the behavior set.
+        serialized_response = _serialize_response(
+            rpc_event, state, response, response_serializer
+        )
+        if serialized_response is not None:
+            _status(rpc_event, state, serialized_response)
+
     try:
         argument = argument_thunk()
         if argument is not None:
-            response, proceed = _call_behavior(
-                rpc_event, state, behavior, argument, request_deserializer
-            )
-            if proceed:
-                serialized_response = _serialize_response(
-                    rpc_event, state, response, response_serializer
+            if _is_non_blocking_behavior(behavior):
+                _call_non_blocking_behavior(
+                    rpc_event,
+                    state,
+                    behavior,
+                    argument,
+                    request_deserializer,
+                    send_response,
                 )
-                if serialized_response is not None:
-                    _status(rpc_event, state, serialized_response)
+            else:
+                response, proceed = _call_behavior(
+                    rpc_event, state, behavior, argument, request_deserializer
+                )
+                if proceed:
+                    serialized_response = _serialize_response(
+                        rpc_event, state, response, response_serializer
+                    )
+                    if serialized_response is not None:
+                        _status(rpc_event, state, serialized_response)
     except Exception:  # pylint: disable=broad-except
         traceback.print_exc()
     finally:
@@ -813,6 +1236,8 @@ def _stream_response_in_pool(
     request_deserializer: Optional[DeserializingFunction],
     response_serializer: Optional[SerializingFunction],
 ) -> None:
+    if not _start_handler(rpc_event, state):
+        return
     cygrpc.install_context_from_request_call_event(rpc_event)
 
     def send_response(response: Any) -> None:
@@ -828,17 +1253,14 @@ def _stream_response_in_pool(
     try:
         argument = argument_thunk()
         if argument is not None:
-            if (
-                hasattr(behavior, "experimental_non_blocking")
-                and behavior.experimental_non_blocking
-            ):
-                _call_behavior(
+            if _is_non_blocking_behavior(behavior):
+                _call_non_blocking_behavior(
                     rpc_event,
                     state,
                     behavior,
                     argument,
                     request_deserializer,
-                    send_response_callback=send_response,
+                    send_response,
                 )
             else:
                 response_iterator, proceed = _call_behavior(
@@ -888,6 +1310,32 @@ def _select_thread_pool_for_behavior(
         return default_thread_pool
 
 
+def _select_positive_int_for_behavior(
+    behavior: ArityAgnosticMethodHandler, attribute: str, default: int
+) -> int:
+    value = getattr(behavior, attribute, None)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    else:
+        return default
+
+
+def _select_write_window_for_behavior(
+    behavior: ArityAgnosticMethodHandler, default_write_window: int
+) -> int:
+    return _select_positive_int_for_behavior(
+        behavior, "experimental_write_window", default_write_window
+    )
+
+
+def _select_prefetch_depth_for_behavior(
+    behavior: ArityAgnosticMethodHandler, default_prefetch_depth: int
+) -> int:
+    return _select_positive_int_for_behavior(
+        behavior, "experimental_prefetch_depth", default_prefetch_depth
+    )
+
+
 def _handle_unary_unary(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
@@ -924,6 +1372,9 @@ def _handle_unary_stream(
     thread_pool = _select_thread_pool_for_behavior(
         method_handler.unary_stream, default_thread_pool
     )
+    state.write_window = _select_write_window_for_behavior(
+        method_handler.unary_stream, state.write_window
+    )
     return thread_pool.submit(
         state.context.run,
         _stream_response_in_pool,
@@ -942,12 +1393,18 @@ def _handle_stream_unary(
     method_handler: grpc.RpcMethodHandler,
     default_thread_pool: futures.ThreadPoolExecutor,
 ) -> futures.Future:
-    request_iterator = _RequestIterator(
-        state, rpc_event.call, method_handler.request_deserializer
-    )
     thread_pool = _select_thread_pool_for_behavior(
         method_handler.stream_unary, default_thread_pool
     )
+    request_iterator = _RequestIterator(
+        state,
+        rpc_event.call,
+        method_handler.request_deserializer,
+        _select_prefetch_depth_for_behavior(
+            method_handler.stream_unary, state.prefetch_depth
+        ),
+        thread_pool,
+    )
     return thread_pool.submit(
         state.context.run,
         _unary_response_in_pool,
@@ -966,12 +1423,21 @@ def _handle_stream_stream(
     method_handler: grpc.RpcMethodHandler,
     default_thread_pool: futures.ThreadPoolExecutor,
 ) -> futures.Future:
-    request_iterator = _RequestIterator(
-        state, rpc_event.call, method_handler.request_deserializer
-    )
     thread_pool = _select_thread_pool_for_behavior(
         method_handler.stream_stream, default_thread_pool
     )
+    request_iterator = _RequestIterator(
+        state,
+        rpc_event.call,
+        method_handler.request_deserializer,
+        _select_prefetch_depth_for_behavior(
+            method_handler.stream_stream, state.prefetch_depth
+        ),
+        thread_pool,
+    )
+    state.write_window = _select_write_window_for_behavior(
+        method_handler.stream_stream, state.write_window
+    )
     return thread_pool.submit(
         state.context.run,
         _stream_response_in_pool,
@@ -999,12 +1465,32 @@ def _find_method_handler(
     if not method_name:
         method_name = _common.decode(rpc_event.call_details.method)
 
+    # Registered methods and the methods of static generic handlers are
+    # always served by the same handler, and so is what a cacheable pipeline
+    # makes of it.
+    static_handler = method_with_handler.static_handler(method_name)
+    cache_handler = static_handler is not None and (
+        interceptor_pipeline is not None and interceptor_pipeline.cacheable
+    )
+    if static_handler is not None and interceptor_pipeline is None:
+        return static_handler
+    elif cache_handler:
+        method_handler = interceptor_pipeline.cached_handler(method_name)
+        if method_handler is not None:
+            return method_handler
+
     handler_call_details = _HandlerCallDetails(
         method_name,
         rpc_event.invocation_metadata,
     )
 
-    if interceptor_pipeline is not None:
+    if cache_handler:
+        return state.context.run(
+            interceptor_pipeline.execute_and_cache,
+            query_handlers,
+            handler_call_details,
+        )
+    elif interceptor_pipeline is not None:
         return state.context.run(
             interceptor_pipeline.execute, query_handlers, handler_call_details
         )
@@ -1072,22 +1558,34 @@ def _handle_call(
     interceptor_pipeline: Optional[_interceptor._ServicePipeline],
     thread_pool: futures.ThreadPoolExecutor,
     concurrency_exceeded: bool,
+    write_window: int = _DEFAULT_RESPONSE_WRITE_WINDOW,
+    prefetch_depth: int = _DEFAULT_REQUEST_PREFETCH_DEPTH,
+    queue_wait_estimate: Optional[_QueueWaitEstimate] = None,
+    concurrency_limiter: Optional[
+        _concurrency_limiter.ConcurrencyLimiter
+    ] = None,
 ) -> Tuple[Optional[_RPCState], Optional[futures.Future]]:
     """Handles RPC based on provided handlers.
 
       When receiving a call event from Core, registered method will have its
-    name as tag, we pass the tag as registered_method_name to this method,
-    then we can find the handler in registered_method_handlers based on
-    the method name.
+    name in the _RequestCallSlot tag, we pass it as registered_method_name to
+    this method, then we can find the handler in registered_method_handlers
+    based on the method name.
 
       For call event with unregistered method, the method name will be included
     in rpc_event.call_details.method and we need to query the generics handlers
     to find the actual handler.
+
+      RPCs whose deadline would expire before a worker is expected to take
+    them up, going by queue_wait_estimate, fail without being queued.
+
+      Only RPCs about to be queued are passed to concurrency_limiter, so that
+    it does not learn from RPCs rejected for other reasons.
     """
     if not rpc_event.success:
         return None, None
     if rpc_event.call_details.method or method_with_handler.name():
-        rpc_state = _RPCState()
+        rpc_state = _RPCState(write_window, prefetch_depth, queue_wait_estimate)
         try:
             method_handler = _find_method_handler(
                 rpc_event,
@@ -1121,7 +1619,33 @@ def _handle_call(
                 b"Concurrent RPC limit exceeded!",
             )
             return rpc_state, None
+        elif _deadline_expires_within(
+            rpc_event,
+            0 if queue_wait_estimate is None else queue_wait_estimate.seconds(),
+        ):
+            _reject_rpc(
+                rpc_event,
+                rpc_state,
+                cygrpc.StatusCode.deadline_exceeded,
+                b"Deadline would expire before the RPC is handled!",
+            )
+            return rpc_state, None
+        elif (
+            concurrency_limiter is not None
+            and not concurrency_limiter.acquire()
+        ):
+            _reject_rpc(
+                rpc_event,
+                rpc_state,
+                cygrpc.StatusCode.resource_exhausted,
+                b"Concurrent RPC limit exceeded!",
+            )
+            return rpc_state, None
         else:
+            rpc_state.queued_at = time.monotonic()
+            rpc_state.non_blocking = _is_non_blocking_method_handler(
+                method_handler
+            )
             return (
                 rpc_state,
                 _handle_with_method_handler(
@@ -1139,11 +1663,36 @@ class _ServerStage(enum.Enum):
     GRACE = "grace"
 
 
+class _ServerShard(object):
+    """A completion queue together with the RPCs accepted on it.
+
+    Each shard is polled by its own serving thread, and its lock guards only
+    the bookkeeping of the RPCs owned by that shard. The serving flag mirrors
+    whether the server is STARTED so that accepting a call never needs the
+    server-wide lock.
+    """
+
+    lock: threading.Lock
+    completion_queue: cygrpc.CompletionQueue
+    rpc_states: Set[_RPCState]
+    due: Set[_RequestCallSlot]
+    serving: bool
+
+    def __init__(self, completion_queue: cygrpc.CompletionQueue):
+        self.lock = threading.Lock()
+        self.completion_queue = completion_queue
+        self.rpc_states = set()
+        self.due = set()
+        self.serving = False
+
+
 class _ServerState(object):
     lock: threading.RLock
     completion_queue: cygrpc.CompletionQueue
+    shards: List[_ServerShard]
     server: cygrpc.Server
     generic_handlers: List[grpc.GenericRpcHandler]
+    generic_method: _GenericMethod
     registered_method_handlers: Dict[str, grpc.RpcMethodHandler]
     interceptor_pipeline: Optional[_interceptor._ServicePipeline]
     thread_pool: futures.ThreadPoolExecutor
@@ -1151,39 +1700,61 @@ class _ServerState(object):
     termination_event: threading.Event
     shutdown_events: List[threading.Event]
     maximum_concurrent_rpcs: Optional[int]
+    active_rpc_lock: threading.Lock
     active_rpc_count: int
-    rpc_states: Set[_RPCState]
+    pending_call_slots: int
+    response_write_window: int
+    request_prefetch_depth: int
+    concurrency_limiter: Optional[_concurrency_limiter.ConcurrencyLimiter]
+    queue_wait_estimate: _QueueWaitEstimate
     due: Set[str]
     server_deallocated: bool
 
     # pylint: disable=too-many-arguments
     def __init__(
         self,
-        completion_queue: cygrpc.CompletionQueue,
+        completion_queues: Sequence[cygrpc.CompletionQueue],
         server: cygrpc.Server,
         generic_handlers: Sequence[grpc.GenericRpcHandler],
         interceptor_pipeline: Optional[_interceptor._ServicePipeline],
         thread_pool: futures.ThreadPoolExecutor,
         maximum_concurrent_rpcs: Optional[int],
+        pending_call_slots: int = _DEFAULT_PENDING_CALL_SLOTS,
+        response_write_window: int = _DEFAULT_RESPONSE_WRITE_WINDOW,
+        request_prefetch_depth: int = _DEFAULT_REQUEST_PREFETCH_DEPTH,
+        concurrency_limiter: Optional[
+            _concurrency_limiter.ConcurrencyLimiter
+        ] = None,
     ):
         self.lock = threading.RLock()
-        self.completion_queue = completion_queue
+        # Server shutdown is always notified on the first completion queue.
+        self.completion_queue = completion_queues[0]
+        self.shards = [
+            _ServerShard(completion_queue)
+            for completion_queue in completion_queues
+        ]
         self.server = server
         self.generic_handlers = list(generic_handlers)
+        self.generic_method = _GenericMethod(self.generic_handlers)
         self.interceptor_pipeline = interceptor_pipeline
         self.thread_pool = thread_pool
         self.stage = _ServerStage.STOPPED
         self.termination_event = threading.Event()
         self.shutdown_events = [self.termination_event]
         self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
+        self.active_rpc_lock = threading.Lock()
         self.active_rpc_count = 0
+        self.pending_call_slots = pending_call_slots
+        self.response_write_window = response_write_window
+        self.request_prefetch_depth = request_prefetch_depth
+        self.concurrency_limiter = concurrency_limiter
+        self.queue_wait_estimate = _QueueWaitEstimate()
         self.registered_method_handlers = {}
 
-        # TODO(https://github.com/grpc/grpc/issues/6597): eliminate these fields.
-        self.rpc_states = set()
+        # TODO(https://github.com/grpc/grpc/issues/6597): eliminate this field.
         self.due = set()
 
-        # A "volatile" flag to interrupt the daemon serving thread
+        # A "volatile" flag to interrupt the daemon serving threads
         self.server_deallocated = False
 
 
@@ -1192,6 +1763,7 @@ def _add_generic_handlers(
 ) -> None:
     with state.lock:
         state.generic_handlers.extend(generic_handlers)
+        state.generic_method = _GenericMethod(state.generic_handlers)
 
 
 def _add_registered_method_handlers(
@@ -1217,44 +1789,169 @@ def _add_secure_port(
         )
 
 
-def _request_call(state: _ServerState) -> None:
+def _request_call(
+    state: _ServerState, shard: _ServerShard, slot: _RequestCallSlot
+) -> None:
     state.server.request_call(
-        state.completion_queue, state.completion_queue, _REQUEST_CALL_TAG
+        shard.completion_queue, shard.completion_queue, slot
     )
-    state.due.add(_REQUEST_CALL_TAG)
+    shard.due.add(slot)
 
 
-def _request_registered_call(state: _ServerState, method: str) -> None:
-    registered_call_tag = method
+def _request_registered_call(
+    state: _ServerState, shard: _ServerShard, slot: _RequestCallSlot
+) -> None:
     state.server.request_registered_call(
-        state.completion_queue,
-        state.completion_queue,
-        method,
-        registered_call_tag,
+        shard.completion_queue,
+        shard.completion_queue,
+        slot.method,
+        slot,
     )
-    state.due.add(registered_call_tag)
+    shard.due.add(slot)
+
+
+def _request_call_slot(
+    state: _ServerState, shard: _ServerShard, slot: _RequestCallSlot
+) -> None:
+    if slot.method is None:
+        _request_call(state, shard, slot)
+    else:
+        _request_registered_call(state, shard, slot)
 
 
 # TODO(https://github.com/grpc/grpc/issues/6597): delete this function.
 def _stop_serving(state: _ServerState) -> bool:
-    if not state.rpc_states and not state.due:
-        state.server.destroy()
-        for shutdown_event in state.shutdown_events:
-            shutdown_event.set()
-        state.stage = _ServerStage.STOPPED
+    # Must be called with state.lock held; shard locks are always acquired
+    # after state.lock, never before it.
+    if state.stage is _ServerStage.STOPPED:
         return True
-    else:
+    if state.due:
         return False
+    for shard in state.shards:
+        with shard.lock:
+            if shard.rpc_states or shard.due:
+                return False
+    state.server.destroy()
+    # The serving threads of the other shards exit once their completion
+    # queues report shutdown, rather than after their next poll timeout.
+    for shard in state.shards:
+        shard.completion_queue.shutdown()
+    for shutdown_event in state.shutdown_events:
+        shutdown_event.set()
+    state.stage = _ServerStage.STOPPED
+    return True
 
 
 def _on_call_completed(state: _ServerState) -> None:
-    with state.lock:
+    with state.active_rpc_lock:
         state.active_rpc_count -= 1
 
 
-# pylint: disable=too-many-branches
+def _when_handled(
+    rpc_state: _RPCState,
+    rpc_future: futures.Future,
+    callback: Callable[[], None],
+) -> None:
+    """Calls callback once the server is done handling a dispatched RPC.
+
+    Non-blocking behaviors return while their RPC is still open, so the RPCs
+    they handle are done once terminated rather than once they returned.
+    """
+    if rpc_state.non_blocking:
+        with rpc_state.condition:
+            if rpc_state.callbacks is not None:
+                rpc_state.callbacks.append(callback)
+                return
+        callback()
+    else:
+        rpc_future.add_done_callback(lambda unused_future: callback())
+
+
+def _reserve_concurrency(state: _ServerState) -> bool:
+    """Claims an active RPC slot, returning whether the limit was exceeded."""
+    if state.maximum_concurrent_rpcs is None:
+        return False
+    with state.active_rpc_lock:
+        if state.active_rpc_count >= state.maximum_concurrent_rpcs:
+            return True
+        state.active_rpc_count += 1
+        return False
+
+
+def _release_concurrency_limiter(
+    limiter: _concurrency_limiter.ConcurrencyLimiter, rpc_state: _RPCState
+) -> None:
+    try:
+        if rpc_state.handler_started_at is None:
+            limiter.discard()
+        else:
+            limiter.release(
+                time.monotonic() - rpc_state.handler_started_at,
+                rpc_state.handler_started_at - rpc_state.queued_at,
+            )
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Exception releasing concurrency limiter!")
+
+
+def _process_request_call_event(
+    state: _ServerState, shard: _ServerShard, event: cygrpc.BaseEvent
+) -> bool:
+    registered_method_name = event.tag.method
+    if registered_method_name is not None:
+        method_with_handler = _RegisteredMethod(
+            registered_method_name,
+            state.registered_method_handlers.get(registered_method_name, None),
+        )
+    else:
+        method_with_handler = state.generic_method
+    # Accepting a call only takes the lock of its shard, so the serving
+    # threads of different shards do not serialize on state.lock. The slot
+    # stays in shard.due until the RPC is tracked in shard.rpc_states, which
+    # keeps the server from being destroyed meanwhile.
+    concurrency_exceeded = _reserve_concurrency(state)
+    rpc_state, rpc_future = _handle_call(
+        event,
+        method_with_handler,
+        state.interceptor_pipeline,
+        state.thread_pool,
+        concurrency_exceeded,
+        state.response_write_window,
+        state.request_prefetch_depth,
+        state.queue_wait_estimate,
+        state.concurrency_limiter,
+    )
+    if state.maximum_concurrent_rpcs is not None:
+        if rpc_future is not None:
+            _when_handled(
+                rpc_state, rpc_future, lambda: _on_call_completed(state)
+            )
+        elif not concurrency_exceeded:
+            _on_call_completed(state)
+    # Only queued RPCs were admitted by the limiter.
+    if state.concurrency_limiter is not None and rpc_future is not None:
+        _when_handled(
+            rpc_state,
+            rpc_future,
+            lambda: _release_concurrency_limiter(
+                state.concurrency_limiter, rpc_state
+            ),
+        )
+    with shard.lock:
+        shard.due.remove(event.tag)
+        if rpc_state is not None:
+            shard.rpc_states.add(rpc_state)
+        if shard.serving:
+            # Re-arm the slot that just delivered a call; the remaining
+            # slots of this method are still outstanding, so core can
+            # accept further calls while this one is being dispatched.
+            _request_call_slot(state, shard, event.tag)
+            return True
+    with state.lock:
+        return not _stop_serving(state)
+
+
 def _process_event_and_continue(
-    state: _ServerState, event: cygrpc.BaseEvent
+    state: _ServerState, shard: _ServerShard, event: cygrpc.BaseEvent
 ) -> bool:
     should_continue = True
     if event.tag is _SHUTDOWN_TAG:
@@ -1262,53 +1959,8 @@ def _process_event_and_continue(
             state.due.remove(_SHUTDOWN_TAG)
             if _stop_serving(state):
                 should_continue = False
-    elif (
-        event.tag is _REQUEST_CALL_TAG
-        or event.tag in state.registered_method_handlers.keys()
-    ):
-        registered_method_name = None
-        if event.tag in state.registered_method_handlers.keys():
-            registered_method_name = event.tag
-            method_with_handler = _RegisteredMethod(
-                registered_method_name,
-                state.registered_method_handlers.get(
-                    registered_method_name, None
-                ),
-            )
-        else:
-            method_with_handler = _GenericMethod(
-                state.generic_handlers,
-            )
-        with state.lock:
-            state.due.remove(event.tag)
-            concurrency_exceeded = (
-                state.maximum_concurrent_rpcs is not None
-                and state.active_rpc_count >= state.maximum_concurrent_rpcs
-            )
-            rpc_state, rpc_future = _handle_call(
-                event,
-                method_with_handler,
-                state.interceptor_pipeline,
-                state.thread_pool,
-                concurrency_exceeded,
-            )
-            if rpc_state is not None:
-                state.rpc_states.add(rpc_state)
-            if rpc_future is not None:
-                state.active_rpc_count += 1
-                rpc_future.add_done_callback(
-                    lambda unused_future: _on_call_completed(state)
-                )
-            if state.stage is _ServerStage.STARTED:
-                if (
-                    registered_method_name
-                    in state.registered_method_handlers.keys()
-                ):
-                    _request_registered_call(state, registered_method_name)
-                else:
-                    _request_call(state)
-            elif _stop_serving(state):
-                should_continue = False
+    elif isinstance(event.tag, _RequestCallSlot):
+        should_continue = _process_request_call_event(state, shard, event)
     else:
         rpc_state, callbacks = event.tag(event)
         for callback in callbacks:
@@ -1317,21 +1969,29 @@ def _process_event_and_continue(
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Exception calling callback!")
         if rpc_state is not None:
-            with state.lock:
-                state.rpc_states.remove(rpc_state)
-                if _stop_serving(state):
-                    should_continue = False
+            with shard.lock:
+                shard.rpc_states.remove(rpc_state)
+                serving = shard.serving
+            # Serving only stops after the shutdown tag is due, which
+            # re-checks whether to stop serving once it is delivered.
+            if not serving:
+                with state.lock:
+                    if _stop_serving(state):
+                        should_continue = False
     return should_continue
 
 
-def _serve(state: _ServerState) -> None:
+def _serve(state: _ServerState, shard: _ServerShard) -> None:
     while True:
         timeout = time.time() + _DEALLOCATED_SERVER_CHECK_PERIOD_S
-        event = state.completion_queue.poll(timeout)
+        event = shard.completion_queue.poll(timeout)
         if state.server_deallocated:
             _begin_shutdown_once(state)
-        if event.completion_type != cygrpc.CompletionType.queue_timeout:
-            if not _process_event_and_continue(state, event):
+        if event.completion_type == cygrpc.CompletionType.queue_shutdown:
+            # Serving was stopped by the thread of another shard.
+            return
+        elif event.completion_type != cygrpc.CompletionType.queue_timeout:
+            if not _process_event_and_continue(state, shard, event):
                 return
         # We want to force the deletion of the previous event
         # ~before~ we poll again; if the event has a reference
@@ -1342,6 +2002,11 @@ def _serve(state: _ServerState) -> None:
 def _begin_shutdown_once(state: _ServerState) -> None:
     with state.lock:
         if state.stage is _ServerStage.STARTED:
+            # No slot is re-armed once its shard stops serving, so none is
+            # requested from core after the server has been shut down.
+            for shard in state.shards:
+                with shard.lock:
+                    shard.serving = False
             state.server.shutdown(state.completion_queue, _SHUTDOWN_TAG)
             state.stage = _ServerStage.GRACE
             state.due.add(_SHUTDOWN_TAG)
@@ -1379,14 +2044,22 @@ def _start(state: _ServerState) -> None:
             raise ValueError("Cannot start already-started server!")
         state.server.start()
         state.stage = _ServerStage.STARTED
-        # Request a call for each registered method so we can handle any of them.
-        for method in state.registered_method_handlers.keys():
-            _request_registered_call(state, method)
-        # Also request a call for non-registered method.
-        _request_call(state)
-        thread = threading.Thread(target=_serve, args=(state,))
-        thread.daemon = True
-        thread.start()
+        for shard in state.shards:
+            with shard.lock:
+                shard.serving = True
+                for index in range(state.pending_call_slots):
+                    # Request a call for each registered method so we can
+                    # handle any of them.
+                    for method in state.registered_method_handlers.keys():
+                        _request_registered_call(
+                            state, shard, _RequestCallSlot(method, index)
+                        )
+                    # Also request a call for non-registered method.
+                    _request_call(state, shard, _RequestCallSlot(None, index))
+        for shard in state.shards:
+            thread = threading.Thread(target=_serve, args=(state, shard))
+            thread.daemon = True
+            thread.start()
 
 
 def _validate_generic_rpc_handlers(
@@ -1401,6 +2074,26 @@ def _validate_generic_rpc_handlers(
             )
 
 
+def _separate_server_options(
+    options: Sequence[ChannelArgumentType],
+) -> Tuple[Sequence[ChannelArgumentType], Sequence[ChannelArgumentType]]:
+    """Separates core server options from Python server options."""
+    core_options = []
+    python_options = []
+    for pair in options:
+        if pair[0] in (
+            grpc.experimental.ServerOptions.PendingCallSlots,
+            grpc.experimental.ServerOptions.CompletionQueueShards,
+            grpc.experimental.ServerOptions.ResponseWriteWindow,
+            grpc.experimental.ServerOptions.RequestPrefetchDepth,
+            grpc.experimental.ServerOptions.ConcurrencyLimiter,
+        ):
+            python_options.append(pair)
+        else:
+            core_options.append(pair)
+    return python_options, core_options
+
+
 def _augment_options(
     base_options: Sequence[ChannelArgumentType],
     compression: Optional[grpc.Compression],
@@ -1431,16 +2124,52 @@ class _Server(grpc.Server):
         compression: Optional[grpc.Compression],
         xds: bool,
     ):
-        completion_queue = cygrpc.CompletionQueue()
-        server = cygrpc.Server(_augment_options(options, compression, xds), xds)
-        server.register_completion_queue(completion_queue)
+        python_options, core_options = _separate_server_options(options)
+        completion_queue_shards = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ServerOptions.CompletionQueueShards,
+            _DEFAULT_COMPLETION_QUEUE_SHARDS,
+        )
+        pending_call_slots = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ServerOptions.PendingCallSlots,
+            _DEFAULT_PENDING_CALL_SLOTS,
+        )
+        response_write_window = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ServerOptions.ResponseWriteWindow,
+            _DEFAULT_RESPONSE_WRITE_WINDOW,
+        )
+        request_prefetch_depth = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ServerOptions.RequestPrefetchDepth,
+            _DEFAULT_REQUEST_PREFETCH_DEPTH,
+        )
+        concurrency_limiter = (
+            _concurrency_limiter.concurrency_limiter_python_option(
+                python_options,
+                grpc.experimental.ServerOptions.ConcurrencyLimiter,
+            )
+        )
+        completion_queues = [
+            cygrpc.CompletionQueue() for _ in range(completion_queue_shards)
+        ]
+        server = cygrpc.Server(
+            _augment_options(core_options, compression, xds), xds
+        )
+        for completion_queue in completion_queues:
+            server.register_completion_queue(completion_queue)
         self._state = _ServerState(
-            completion_queue,
+            completion_queues,
             server,
             generic_handlers,
             _interceptor.service_pipeline(interceptors),
             thread_pool,
             maximum_concurrent_rpcs,
+            pending_call_slots,
+            response_write_window,
+            request_prefetch_depth,
+            concurrency_limiter,
         )
         self._cy_server = server
 
@@ -34,8 +34,11 @@ if TYPE_CHECKING:
 
 RequestType = TypeVar("RequestType")
 ResponseType = TypeVar("ResponseType")
-SerializingFunction = Callable[[Any], bytes]
-DeserializingFunction = Callable[[bytes], Any]
+# Serializers may return bytes or any other object exporting the buffer
+# protocol; these are the buffer types the annotations name explicitly.
+SerializedMessageType = Union[bytes, bytearray, memoryview]
+SerializingFunction = Callable[[Any], SerializedMessageType]
+DeserializingFunction = Callable[[Union[bytes, memoryview]], Any]
 MetadataType = Sequence[Tuple[str, Union[str, bytes]]]
 ChannelArgumentType = Tuple[str, Any]
 DoneCallbackType = Callable[[Any], None]
@@ -13,11 +13,12 @@
 # limitations under the License.
 """Internal utilities for gRPC Python."""
 
+import abc
 import collections
 import logging
 import threading
 import time
-from typing import Callable, Dict, Optional, Sequence
+from typing import Callable, Dict, Mapping, Optional, Sequence
 
 import grpc  # pytype: disable=pyi-error
 from grpc import _common  # pytype: disable=pyi-error
@@ -49,7 +50,31 @@ class RpcMethodHandler(
     pass
 
 
-class DictionaryGenericHandler(grpc.ServiceRpcHandler):
+class StaticGenericRpcHandler(grpc.GenericRpcHandler):
+    """A generic handler that serves each method with a fixed handler.
+
+    Servers look up the handlers of static generic handlers in an index
+    of their methods instead of calling service for each RPC, so service
+    must not be overridden to do anything but that lookup.
+
+    This is an EXPERIMENTAL API.
+    """
+
+    @abc.abstractmethod
+    def method_handlers(self) -> Mapping[str, grpc.RpcMethodHandler]:
+        """Returns the handlers served, keyed by fully qualified method name.
+
+        The result must stay the same for the lifetime of this handler.
+        """
+        raise NotImplementedError()
+
+    def service(
+        self, handler_call_details: grpc.HandlerCallDetails
+    ) -> Optional[grpc.RpcMethodHandler]:
+        return self.method_handlers().get(handler_call_details.method)
+
+
+class DictionaryGenericHandler(grpc.ServiceRpcHandler, StaticGenericRpcHandler):
     _name: str
     _method_handlers: Dict[str, grpc.RpcMethodHandler]
 
@@ -65,6 +90,9 @@ class DictionaryGenericHandler(grpc.ServiceRpcHandler):
     def service_name(self) -> str:
         return self._name
 
+    def method_handlers(self) -> Mapping[str, grpc.RpcMethodHandler]:
+        return self._method_handlers
+
     def service(
         self, handler_call_details: grpc.HandlerCallDetails
     ) -> Optional[grpc.RpcMethodHandler]:
@@ -290,22 +290,26 @@ class _APIStyle(enum.IntEnum):
 
 
 class _UnaryResponseMixin(Call, Generic[ResponseType]):
-    _call_response: asyncio.Task
+    _call_response: Optional[asyncio.Task]
 
-    def _init_unary_response_mixin(self, response_task: asyncio.Task):
+    def _init_unary_response_mixin(self, response_task: Optional[asyncio.Task]):
         self._call_response = response_task
 
     def cancel(self) -> bool:
         if super().cancel():
-            self._call_response.cancel()
+            if self._call_response is not None:
+                self._call_response.cancel()
             return True
         else:
             return False
 
+    def _wait_for_response(self) -> Generator[Any, None, ResponseType]:
+        return (yield from self._call_response)
+
     def __await__(self) -> Generator[Any, None, ResponseType]:
         """Wait till the ongoing RPC request finishes."""
         try:
-            response = yield from self._call_response
+            response = yield from self._wait_for_response()
         except asyncio.CancelledError:
             # Even if we caught all other CancelledError, there is still
             # this corner case. If the application cancels immediately after
@@ -376,7 +380,9 @@ class _StreamResponseMixin(Call):
 
         # Reads response message from Core
         try:
-            raw_response = await self._cython_call.receive_serialized_message()
+            raw_response = await self._cython_call.receive_serialized_message(
+                self._response_deserializer
+            )
         except asyncio.CancelledError:
             if not self.cancelled():
                 self.cancel()
@@ -543,10 +549,18 @@ class UnaryUnaryCall(_UnaryResponseMixin, Call, _base_call.UnaryUnaryCall):
     """Object for managing unary-unary RPC calls.
 
     Returned when an instance of `UnaryUnaryMultiCallable` object is called.
+
+    The first coroutine awaiting the call runs the RPC itself. A Task is only
+    created for calls which are not awaited before the next iteration of the
+    event loop.
     """
 
     _request: RequestType
-    _invocation_task: asyncio.Task
+    _invocation_started: bool
+    _invocation_finished: bool
+    _invocation_waiter: Optional[asyncio.Future]
+    _response: Any
+    _invocation_exception: Optional[BaseException]
 
     # pylint: disable=too-many-arguments
     def __init__(
@@ -571,10 +585,25 @@ class UnaryUnaryCall(_UnaryResponseMixin, Call, _base_call.UnaryUnaryCall):
         )
         self._request = request
         self._context = cygrpc.build_census_context()
-        self._invocation_task = loop.create_task(self._invoke())
-        self._init_unary_response_mixin(self._invocation_task)
+        self._invocation_started = False
+        self._invocation_finished = False
+        self._invocation_waiter = None
+        self._response = None
+        self._invocation_exception = None
+        self._init_unary_response_mixin(None)
+        # Keeps the RPC progressing even if nobody awaits the call.
+        loop.call_soon(self._start_invocation_task)
+
+    def _start_invocation_task(self) -> None:
+        if not self._invocation_started and not self.done():
+            self._invocation_started = True
+            self._call_response = self._loop.create_task(self._invoke())
 
     async def _invoke(self) -> ResponseType:
+        if self._cython_call.done():
+            # Cancelled before the RPC was started.
+            return cygrpc.EOF
+
         serialized_request = _common.serialize(
             self._request, self._request_serializer
         )
@@ -584,7 +613,10 @@ class UnaryUnaryCall(_UnaryResponseMixin, Call, _base_call.UnaryUnaryCall):
         # https://github.com/python/cpython/blob/edad4d89e357c92f70c0324b937845d652b20afd/Lib/asyncio/tasks.py#L785
         try:
             serialized_response = await self._cython_call.unary_unary(
-                serialized_request, self._metadata, self._context
+                serialized_request,
+                self._metadata,
+                self._context,
+                self._response_deserializer,
             )
         except asyncio.CancelledError:
             if not self.cancelled():
@@ -597,8 +629,50 @@ class UnaryUnaryCall(_UnaryResponseMixin, Call, _base_call.UnaryUnaryCall):
         else:
             return cygrpc.EOF
 
+    def _get_invocation_waiter(self) -> asyncio.Future:
+        if self._invocation_waiter is None:
+            self._invocation_waiter = self._loop.create_future()
+        return self._invocation_waiter
+
+    def _run_invocation(self) -> Generator[Any, None, ResponseType]:
+        """Runs the RPC within the awaiting coroutine and records its outcome."""
+        self._invocation_started = True
+        try:
+            self._response = yield from self._invoke().__await__()
+        except BaseException as exception:  # pylint: disable=broad-except
+            self._invocation_exception = exception
+            raise
+        finally:
+            self._invocation_finished = True
+            if (
+                self._invocation_waiter is not None
+                and not self._invocation_waiter.done()
+            ):
+                self._invocation_waiter.set_result(None)
+        return self._response
+
+    def _wait_for_invocation(self) -> Generator[Any, None, ResponseType]:
+        """Waits for the outcome of the RPC run by another coroutine."""
+        if not self._invocation_finished:
+            yield from asyncio.shield(self._get_invocation_waiter())
+        if self._invocation_exception is not None:
+            raise self._invocation_exception
+        return self._response
+
+    def _wait_for_response(self) -> Generator[Any, None, ResponseType]:
+        if self._call_response is not None:
+            return (yield from self._call_response)
+        elif self._invocation_started:
+            return (yield from self._wait_for_invocation())
+        else:
+            return (yield from self._run_invocation())
+
     async def wait_for_connection(self) -> None:
-        await self._invocation_task
+        self._start_invocation_task()
+        if self._call_response is not None:
+            await self._call_response
+        elif self._invocation_started and not self._invocation_finished:
+            await asyncio.shield(self._get_invocation_waiter())
         if self.done():
             await self._raise_for_status()
 
@@ -697,7 +771,10 @@ class StreamUnaryCall(
     async def _conduct_rpc(self) -> ResponseType:
         try:
             serialized_response = await self._cython_call.stream_unary(
-                self._metadata, self._metadata_sent_observer, self._context
+                self._metadata,
+                self._metadata_sent_observer,
+                self._context,
+                self._response_deserializer,
             )
         except asyncio.CancelledError:
             if not self.cancelled():
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Implementation of the metadata abstraction for gRPC Asyncio Python."""
-from collections import OrderedDict
+
 from collections import abc
-from typing import Any, Iterator, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 MetadataKey = str
 MetadataValue = Union[str, bytes]
+MetadatumType = Tuple[MetadataKey, MetadataValue]
 
 
 class Metadata(abc.Collection):
@@ -31,35 +32,68 @@ class Metadata(abc.Collection):
         * Getting by an element by key, retrieves the first mapped value
         * Supports an immutable view of the data
         * Allows partial mutation on the data without recreating the new object from scratch.
+
+    The entries are kept as a flat tuple, which copies of the metadata share
+    until they are mutated. Keys are only indexed on the first lookup.
     """
 
-    def __init__(self, *args: Tuple[MetadataKey, MetadataValue]) -> None:
-        self._metadata = OrderedDict()
-        for md_key, md_value in args:
-            self.add(md_key, md_value)
+    _entries: Tuple[MetadatumType, ...]
+    _index: Optional[Dict[MetadataKey, List[MetadataValue]]]
+
+    def __init__(self, *args: MetadatumType) -> None:
+        self._entries = args
+        self._index = None
+
+    @classmethod
+    def _from_entries(cls, entries: Tuple[MetadatumType, ...]) -> "Metadata":
+        metadata = cls.__new__(cls)
+        metadata._entries = entries
+        metadata._index = None
+        return metadata
 
     @classmethod
     def from_tuple(cls, raw_metadata: tuple):
         if raw_metadata:
-            return cls(*raw_metadata)
+            if isinstance(raw_metadata, Metadata):
+                return cls._from_entries(raw_metadata._entries)
+            return cls._from_entries(tuple(raw_metadata))
         return cls()
 
+    def _values_by_key(self) -> Dict[MetadataKey, List[MetadataValue]]:
+        if self._index is None:
+            index = {}
+            for key, value in self._entries:
+                index.setdefault(key, []).append(value)
+            self._index = index
+        return self._index
+
+    def _replace_entries(self, entries: Tuple[MetadatumType, ...]) -> None:
+        self._entries = entries
+        self._index = None
+
+    def _position(self, key: MetadataKey) -> int:
+        for position, (entry_key, _) in enumerate(self._entries):
+            if entry_key == key:
+                return position
+        return -1
+
     def add(self, key: MetadataKey, value: MetadataValue) -> None:
-        self._metadata.setdefault(key, [])
-        self._metadata[key].append(value)
+        self._entries += ((key, value),)
+        if self._index is not None:
+            self._index.setdefault(key, []).append(value)
 
     def __len__(self) -> int:
         """Return the total number of elements that there are in the metadata,
         including multiple values for the same key.
         """
-        return sum(map(len, self._metadata.values()))
+        return len(self._entries)
 
     def __getitem__(self, key: MetadataKey) -> MetadataValue:
         """When calling <metadata>[<key>], the first element of all those
         mapped for <key> is returned.
         """
         try:
-            return self._metadata[key][0]
+            return self._values_by_key()[key][0]
         except (ValueError, IndexError) as e:
             raise KeyError("{0!r}".format(key)) from e
 
@@ -67,27 +101,35 @@ class Metadata(abc.Collection):
         """Calling metadata[<key>] = <value>
         Maps <value> to the first instance of <key>.
         """
-        if key not in self:
-            self._metadata[key] = [value]
+        position = self._position(key)
+        if position < 0:
+            self.add(key, value)
         else:
-            current_values = self.get_all(key)
-            self._metadata[key] = [value, *current_values[1:]]
+            self._replace_entries(
+                self._entries[:position]
+                + ((key, value),)
+                + self._entries[position + 1 :]
+            )
 
     def __delitem__(self, key: MetadataKey) -> None:
         """``del metadata[<key>]`` deletes the first mapping for <key>."""
-        current_values = self.get_all(key)
-        if not current_values:
+        position = self._position(key)
+        if position < 0:
             raise KeyError(repr(key))
-        self._metadata[key] = current_values[1:]
+        self._replace_entries(
+            self._entries[:position] + self._entries[position + 1 :]
+        )
 
     def delete_all(self, key: MetadataKey) -> None:
         """Delete all mappings for <key>."""
-        del self._metadata[key]
+        if key not in self:
+            raise KeyError(key)
+        self._replace_entries(
+            tuple(entry for entry in self._entries if entry[0] != key)
+        )
 
-    def __iter__(self) -> Iterator[Tuple[MetadataKey, MetadataValue]]:
-        for key, values in self._metadata.items():
-            for value in values:
-                yield (key, value)
+    def __iter__(self) -> Iterator[MetadatumType]:
+        return iter(self._entries)
 
     def keys(self) -> abc.KeysView:
         return abc.KeysView(self)
@@ -110,28 +152,44 @@ class Metadata(abc.Collection):
         """For compatibility with other Metadata abstraction objects (like in Java),
         this would return all items under the desired <key>.
         """
-        return self._metadata.get(key, [])
+        return list(self._values_by_key().get(key, ()))
 
     def set_all(self, key: MetadataKey, values: List[MetadataValue]) -> None:
-        self._metadata[key] = values
+        position = self._position(key)
+        if position < 0:
+            position = len(self._entries)
+        remaining_entries = tuple(
+            entry for entry in self._entries if entry[0] != key
+        )
+        self._replace_entries(
+            remaining_entries[:position]
+            + tuple((key, value) for value in values)
+            + remaining_entries[position:]
+        )
 
     def __contains__(self, key: MetadataKey) -> bool:
-        return key in self._metadata
+        return key in self._values_by_key()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
-            return self._metadata == other._metadata
+            if self._entries == other._entries:
+                return True
+            # Metadata with the same values for the same keys, in the same
+            # order, is equal regardless of how the values of keys interleave.
+            return list(self._values_by_key().items()) == list(
+                other._values_by_key().items()
+            )
         if isinstance(other, tuple):
-            return tuple(self) == other
+            return self._entries == other
         return NotImplemented  # pytype: disable=bad-return-type
 
     def __add__(self, other: Any) -> "Metadata":
         if isinstance(other, self.__class__):
-            return Metadata(*(tuple(self) + tuple(other)))
+            return Metadata._from_entries(self._entries + other._entries)
         if isinstance(other, tuple):
-            return Metadata(*(tuple(self) + other))
+            return Metadata._from_entries(self._entries + other)
         return NotImplemented  # pytype: disable=bad-return-type
 
     def __repr__(self) -> str:
-        view = tuple(self)
+        view = tuple((key, value) for key, value in self._entries)
         return "{0}({1!r})".format(self.__class__.__name__, view)
@@ -14,17 +14,43 @@
 """Server-side implementation of gRPC Asyncio Python."""
 
 from concurrent.futures import Executor
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import grpc
 from grpc import _common
 from grpc import _compression
+from grpc import _concurrency_limiter
+from grpc import _interceptor as _grpc_interceptor
 from grpc._cython import cygrpc
+import grpc.experimental  # pytype: disable=pyi-error
 
 from . import _base_server
 from ._interceptor import ServerInterceptor
 from ._typing import ChannelArgumentType
 
+_DEFAULT_PENDING_CALL_SLOTS = 1
+_DEFAULT_REQUEST_PREFETCH_DEPTH = 1
+_DEFAULT_RESPONSE_WRITE_WINDOW = 1
+
+
+def _separate_server_options(
+    options: ChannelArgumentType,
+) -> Tuple[ChannelArgumentType, ChannelArgumentType]:
+    """Separates core server options from Python server options."""
+    core_options = []
+    python_options = []
+    for pair in options:
+        if pair[0] in (
+            grpc.experimental.ServerOptions.PendingCallSlots,
+            grpc.experimental.ServerOptions.RequestPrefetchDepth,
+            grpc.experimental.ServerOptions.ResponseWriteWindow,
+            grpc.experimental.ServerOptions.ConcurrencyLimiter,
+        ):
+            python_options.append(pair)
+        else:
+            core_options.append(pair)
+    return python_options, core_options
+
 
 def _augment_channel_arguments(
     base_options: ChannelArgumentType, compression: Optional[grpc.Compression]
@@ -57,13 +83,40 @@ class Server(_base_server.Server):
                     "Interceptor must be ServerInterceptor, the "
                     f"following are invalid: {invalid_interceptors}"
                 )
+        python_options, core_options = _separate_server_options(options)
+        pending_call_slots = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ServerOptions.PendingCallSlots,
+            _DEFAULT_PENDING_CALL_SLOTS,
+        )
+        request_prefetch_depth = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ServerOptions.RequestPrefetchDepth,
+            _DEFAULT_REQUEST_PREFETCH_DEPTH,
+        )
+        response_write_window = _common.positive_int_python_option(
+            python_options,
+            grpc.experimental.ServerOptions.ResponseWriteWindow,
+            _DEFAULT_RESPONSE_WRITE_WINDOW,
+        )
+        concurrency_limiter = (
+            _concurrency_limiter.concurrency_limiter_python_option(
+                python_options,
+                grpc.experimental.ServerOptions.ConcurrencyLimiter,
+            )
+        )
         self._server = cygrpc.AioServer(
             self._loop,
             thread_pool,
             generic_handlers,
             interceptors,
-            _augment_channel_arguments(options, compression),
+            _augment_channel_arguments(core_options, compression),
             maximum_concurrent_rpcs,
+            pending_call_slots,
+            request_prefetch_depth,
+            response_write_window,
+            concurrency_limiter,
+            _grpc_interceptor.cacheable_interceptors(interceptors),
         )
 
     def add_generic_rpc_handlers(
@@ -84,8 +137,25 @@ class Server(_base_server.Server):
         service_name: str,
         method_handlers: Dict[str, grpc.RpcMethodHandler],
     ) -> None:
-        # TODO(xuanwn): Implement this for AsyncIO.
-        pass
+        """Registers method handlers for the methods of a service.
+
+        Calls to registered methods are matched by the gRPC runtime and
+        dispatched to their handler without consulting the generic handlers.
+        This method is only safe to call before the server is started.
+
+        Args:
+          service_name: The fully qualified name of the service.
+          method_handlers: A dictionary mapping method names to the
+            RpcMethodHandlers of the service.
+        """
+        self._server.add_registered_method_handlers(
+            {
+                _common.fully_qualified_method(
+                    service_name, method
+                ): method_handler
+                for method, method_handler in method_handlers.items()
+            }
+        )
 
     def add_insecure_port(self, address: str) -> int:
         """Opens an insecure port for accepting RPCs.
@@ -32,8 +32,11 @@ from ._metadata import MetadataValue
 
 RequestType = TypeVar("RequestType")
 ResponseType = TypeVar("ResponseType")
-SerializingFunction = Callable[[Any], bytes]
-DeserializingFunction = Callable[[bytes], Any]
+# Serializers may return bytes or any other object exporting the buffer
+# protocol; these are the buffer types the annotations name explicitly.
+SerializedMessageType = Union[bytes, bytearray, memoryview]
+SerializingFunction = Callable[[Any], SerializedMessageType]
+DeserializingFunction = Callable[[Union[bytes, memoryview]], Any]
 MetadatumType = Tuple[MetadataKey, MetadataValue]
 MetadataType = Union[Metadata, Sequence[MetadatumType]]
 ChannelArgumentType = Sequence[Tuple[str, Any]]
@@ -22,7 +22,12 @@ import sys
 import warnings
 
 import grpc
+from grpc._concurrency_limiter import AimdConcurrencyLimiter
+from grpc._concurrency_limiter import ConcurrencyLimiter
+from grpc._concurrency_limiter import GradientConcurrencyLimiter
 from grpc._cython import cygrpc as _cygrpc
+from grpc._interceptor import CacheableServerInterceptor
+from grpc._utilities import StaticGenericRpcHandler
 
 _EXPERIMENTAL_APIS_USED = set()
 
@@ -34,9 +39,64 @@ class ChannelOptions(object):
 
     Attributes:
       SingleThreadedUnaryStream: Perform unary-stream RPCs on a single thread.
+      SharedSpinThreads: Serve the future and streaming RPCs of the channel
+        from a process-wide pool of this many threads, shared by all channels
+        created with the same value, instead of a thread started for the
+        channel whenever it has such RPCs in flight. Ignored when fork support
+        is enabled.
+      RequestSendWindow: The number of requests of a stream-unary or
+        stream-stream RPC that may be taken from the request iterator and
+        serialized before the send of the first of them completes. Requests
+        are still handed to core one at a time, in order. Defaults to 1.
     """
 
     SingleThreadedUnaryStream = "SingleThreadedUnaryStream"
+    SharedSpinThreads = "SharedSpinThreads"
+    RequestSendWindow = "RequestSendWindow"
+
+
+class ServerOptions(object):
+    """Indicates a server option unique to gRPC Python.
+
+    These are passed as key-value pairs in the options argument of
+    grpc.server alongside core channel arguments.
+
+    This enumeration is part of an EXPERIMENTAL API.
+
+    Attributes:
+      PendingCallSlots: The number of request_call slots the server keeps
+        armed on its completion queue for each registered method and for
+        unregistered methods. Defaults to 1. Also applies to grpc.aio
+        servers, where each slot is accepted by its own task.
+      CompletionQueueShards: The number of completion queues the server
+        registers with core. Each queue is polled by its own thread, which
+        dispatches and tracks the RPCs accepted on that queue. Defaults to 1.
+      ResponseWriteWindow: The number of responses a response-streaming
+        handler may write before it blocks waiting for earlier ones to be
+        sent. Responses are still handed to core one at a time, in order.
+        Defaults to 1. A handler can override it with an
+        experimental_write_window attribute. Also applies to sync
+        response-streaming handlers of grpc.aio servers, whose responses are
+        handed to the event loop in batches of up to this many.
+      RequestPrefetchDepth: The number of requests of a request-streaming RPC
+        the server receives and deserializes ahead of the handler. Requests are
+        still received one at a time, in order. Defaults to 1, which receives
+        each request only once the handler asks for it. A handler can override
+        it with an experimental_prefetch_depth attribute. Also applies to
+        grpc.aio servers.
+      ConcurrencyLimiter: A ConcurrencyLimiter, such as a
+        GradientConcurrencyLimiter or an AimdConcurrencyLimiter, consulted
+        for each accepted RPC the server is about to hand to the thread pool,
+        or to handle on the event loop of grpc.aio servers. RPCs it rejects
+        fail with RESOURCE_EXHAUSTED, and it is told how long the handler of
+        every admitted RPC took and how long the RPC waited for it to start.
+    """
+
+    PendingCallSlots = "PendingCallSlots"
+    CompletionQueueShards = "CompletionQueueShards"
+    ResponseWriteWindow = "ResponseWriteWindow"
+    RequestPrefetchDepth = "RequestPrefetchDepth"
+    ConcurrencyLimiter = "ConcurrencyLimiter"
 
 
 class UsageError(Exception):
@@ -117,12 +177,71 @@ def wrap_server_method_handler(wrapper, handler):
             )
 
 
+class PreparedMetadata(tuple):
+    """Metadata encoded once to be attached to many RPCs.
+
+    The keys and values are validated and encoded into the form core sends
+    them in when the object is created, rather than on every RPC. Being a
+    tuple of (key, value) pairs, it may be passed wherever metadata is
+    accepted, and concatenated with other metadata without losing the
+    encoding of its own entries.
+
+    This is an EXPERIMENTAL API.
+
+    Args:
+        metadata: An iterable of (key, value) pairs, with the same types as
+          the metadata passed to RPCs.
+
+    Raises:
+        TypeError: If a key or value has the wrong type.
+        ValueError: If a key or value would be rejected by core.
+    """
+
+    def __new__(cls, metadata=()):
+        return super().__new__(
+            cls,
+            (_cygrpc.prepare_metadatum(key, value) for key, value in metadata),
+        )
+
+
+def zero_copy_deserializer(deserializer):
+    """Marks a deserializer as accepting received messages as memoryviews.
+
+    Received messages are normally handed to deserializers as bytes. A
+    deserializer wrapped by this function is instead handed a read-only
+    memoryview over the memory the message was received into, which is only
+    copied when the message arrived in several slices. Protobuf's FromString
+    accepts memoryviews, so generated deserializers may be wrapped directly.
+
+    Args:
+        deserializer: A function that takes a bytes-like object and returns
+          the deserialized message.
+
+    Returns:
+        A deserializer that may be passed wherever the original one was.
+    """
+
+    def _deserializer(message):
+        return deserializer(message)
+
+    _deserializer.experimental_zero_copy = True
+    return _deserializer
+
+
 __all__ = (
+    "AimdConcurrencyLimiter",
+    "CacheableServerInterceptor",
     "ChannelOptions",
+    "ConcurrencyLimiter",
     "ExperimentalApiWarning",
+    "GradientConcurrencyLimiter",
+    "PreparedMetadata",
+    "ServerOptions",
+    "StaticGenericRpcHandler",
     "UsageError",
     "insecure_channel_credentials",
     "wrap_server_method_handler",
+    "zero_copy_deserializer",
 )
 
 if sys.version_info > (3, 6):
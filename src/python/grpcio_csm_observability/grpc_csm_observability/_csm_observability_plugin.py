@@ -12,9 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
 import re
-from typing import AnyStr, Callable, Dict, Iterable, List, Optional, Union
+from typing import (
+    AnyStr,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from google.protobuf import struct_pb2
 from grpc_observability._observability import OptionalLabelType
@@ -35,6 +45,8 @@ UNKNOWN_VALUE = "unknown"
 TYPE_GCE = "gcp_compute_engine"
 TYPE_GKE = "gcp_kubernetes_engine"
 MESH_ID_PREFIX = "mesh:"
+# The number of distinct peer metadata values kept deserialized.
+_PEER_METADATA_CACHE_SIZE = 256
 
 METADATA_EXCHANGE_KEY_FIXED_MAP = {
     "type": "csm.remote_workload_type",
@@ -151,34 +163,7 @@ class CSMOpenTelemetryLabelInjector(OpenTelemetryLabelInjector):
         deserialized_labels = {}
         for key, value in labels.items():
             if "XEnvoyPeerMetadata" == key:
-                pb_struct = struct_pb2.Struct()
-                pb_struct.ParseFromString(value)
-
-                remote_type = get_value_from_struct("type", pb_struct)
-
-                for (
-                    local_key,
-                    remote_key,
-                ) in METADATA_EXCHANGE_KEY_FIXED_MAP.items():
-                    deserialized_labels[remote_key] = get_value_from_struct(
-                        local_key, pb_struct
-                    )
-                if remote_type == TYPE_GKE:
-                    for (
-                        local_key,
-                        remote_key,
-                    ) in METADATA_EXCHANGE_KEY_GKE_MAP.items():
-                        deserialized_labels[remote_key] = get_value_from_struct(
-                            local_key, pb_struct
-                        )
-                elif remote_type == TYPE_GCE:
-                    for (
-                        local_key,
-                        remote_key,
-                    ) in METADATA_EXCHANGE_KEY_GCE_MAP.items():
-                        deserialized_labels[remote_key] = get_value_from_struct(
-                            local_key, pb_struct
-                        )
+                deserialized_labels.update(_deserialize_peer_metadata(value))
             # If CSM label injector is enabled on server side but client didn't send
             # XEnvoyPeerMetadata, we'll record remote label as unknown.
             else:
@@ -274,6 +259,28 @@ class CsmOpenTelemetryPlugin(OpenTelemetryPlugin):
         return [OptionalLabelType.XDS_SERVICE_LABELS]
 
 
+@functools.lru_cache(maxsize=_PEER_METADATA_CACHE_SIZE)
+def _deserialize_peer_metadata(value: bytes) -> Tuple[Tuple[str, str], ...]:
+    """Maps the serialized XEnvoyPeerMetadata of a peer to remote labels.
+
+    Peers send the same value with every RPC, so it is only parsed once.
+    """
+    pb_struct = struct_pb2.Struct()
+    pb_struct.ParseFromString(value)
+
+    remote_type = get_value_from_struct("type", pb_struct)
+    key_maps = [METADATA_EXCHANGE_KEY_FIXED_MAP]
+    if remote_type == TYPE_GKE:
+        key_maps.append(METADATA_EXCHANGE_KEY_GKE_MAP)
+    elif remote_type == TYPE_GCE:
+        key_maps.append(METADATA_EXCHANGE_KEY_GCE_MAP)
+    return tuple(
+        (remote_key, get_value_from_struct(local_key, pb_struct))
+        for key_map in key_maps
+        for local_key, remote_key in key_map.items()
+    )
+
+
 def get_value_from_struct(key: str, struct: struct_pb2.Struct) -> str:
     value = struct.fields.get(key)
     if not value:
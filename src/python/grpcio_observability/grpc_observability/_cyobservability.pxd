@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from libcpp.map cimport map
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
@@ -87,6 +88,8 @@ cdef extern from "observability_util.h" namespace "grpc_observability":
                                     bint registered_method) except +
   cdef void* CreateServerCallTracerFactory(const vector[Label] exchange_labels, const char* identifier) except +
   cdef queue[NativeCensusData]* g_census_data_buffer
+  cdef vector[AggregatedMetric]* g_aggregated_metrics
+  cdef void ClearAggregatedMetricsLocked() nogil
   cdef void AwaitNextBatchLocked(unique_lock[mutex]&, int) nogil
   cdef bint PythonCensusStatsEnabled() nogil
   cdef bint PythonCensusTracingEnabled() nogil
@@ -100,6 +103,13 @@ cdef extern from "observability_util.h" namespace "grpc_observability":
     SpanCensusData span_data
     vector[Label] labels
 
+  cppclass AggregatedMetric "::grpc_observability::AggregatedMetric":
+    Measurement measurement_data
+    vector[Label] labels
+    string identifier
+    map[int64_t, int64_t] int_value_counts
+    map[double, int64_t] double_value_counts
+
   ctypedef struct CloudMonitoring:
     pass
 
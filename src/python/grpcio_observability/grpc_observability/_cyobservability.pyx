@@ -262,6 +262,26 @@ def _get_stats_data(object measurement, object labels, object identifier) -> _ob
   return py_stat
 
 
+cdef object _get_aggregated_stats_data(AggregatedMetric* metric):
+  """Convert the measurements natively aggregated for a metric to StatsData."""
+  cdef bint measure_double = metric.measurement_data.type == kMeasurementDouble
+  value_counts = []
+  if measure_double:
+    for double_value_count in metric.double_value_counts:
+      value_counts.append((double_value_count.first, double_value_count.second))
+  else:
+    for value_count in metric.int_value_counts:
+      value_counts.append((value_count.first, value_count.second))
+  return _observability.StatsData(
+      name=_cy_metric_name_to_py_metric_name(metric.measurement_data.name),
+      measure_double=measure_double,
+      labels=_c_label_to_labels(metric.labels),
+      identifiers=set(_decode(metric.identifier).split(PLUGIN_IDENTIFIER_SEP)),
+      registered_method=metric.measurement_data.registered_method,
+      include_exchange_labels=metric.measurement_data.include_exchange_labels,
+      value_counts=tuple(value_counts))
+
+
 def _get_tracing_data(SpanCensusData span_data, vector[Label] span_labels,
                       vector[Annotation] span_annotations) -> _observability.TracingData:
   py_span_labels = _c_label_to_labels(span_labels)
@@ -312,7 +332,7 @@ cdef void _export_census_data(object exporter):
         AwaitNextBatchLocked(dereference(lk), export_interval_ms)
 
         # Break only when buffer have data
-        if not g_census_data_buffer.empty():
+        if not (g_census_data_buffer.empty() and g_aggregated_metrics.empty()):
           del lk
           break
         else:
@@ -330,10 +350,15 @@ cdef void _export_census_data(object exporter):
 cdef void _flush_census_data(object exporter):
   exporter: _observability.Exporter
 
+  cdef vector[AggregatedMetric] aggregated_metrics
   lk = new unique_lock[mutex](g_census_data_buffer_mutex)
-  if g_census_data_buffer.empty():
+  if g_census_data_buffer.empty() and g_aggregated_metrics.empty():
     del lk
     return
+  # Metrics are aggregated per label set natively, so only one StatsData is
+  # created for each of them per batch, after the lock is released.
+  aggregated_metrics.swap(dereference(g_aggregated_metrics))
+  ClearAggregatedMetricsLocked()
   py_metrics_batch = []
   py_spans_batch = []
   while not g_census_data_buffer.empty():
@@ -351,6 +376,8 @@ cdef void _flush_census_data(object exporter):
     g_census_data_buffer.pop()
 
   del lk
+  for i in range(aggregated_metrics.size()):
+    py_metrics_batch.append(_get_aggregated_stats_data(&aggregated_metrics[i]))
   exporter.export_stats_data(py_metrics_batch)
   exporter.export_tracing_data(py_spans_batch)
 
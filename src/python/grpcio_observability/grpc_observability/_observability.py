@@ -17,7 +17,7 @@ import abc
 from dataclasses import dataclass
 from dataclasses import field
 import enum
-from typing import AnyStr, Dict, List, Mapping, Set, Tuple
+from typing import AnyStr, Dict, Iterable, List, Mapping, Set, Tuple, Union
 
 
 class Exporter(metaclass=abc.ABCMeta):
@@ -60,6 +60,10 @@ class StatsData:
         belongs to.
       registered_method: Whether the method in this data is a registered method
         in stubs.
+      value_counts: The values of all the measurements of this metric with
+        the same labels that were recorded since the last export, each paired
+        with the number of times it was recorded. Empty if this data is a
+        single measurement, held by value_int or value_float.
     """
 
     name: "grpc_observability._cyobservability.MetricsName"
@@ -70,6 +74,16 @@ class StatsData:
     labels: Dict[str, AnyStr] = field(default_factory=dict)
     identifiers: Set[str] = field(default_factory=set)
     registered_method: bool = False
+    value_counts: Tuple[Tuple[Union[int, float], int], ...] = ()
+
+    def measurements(self) -> Iterable[Tuple[Union[int, float], int]]:
+        """Returns the (value, count) pairs of the measurements held."""
+        if self.value_counts:
+            return self.value_counts
+        elif self.measure_double:
+            return ((self.value_float, 1),)
+        else:
+            return ((self.value_int, 1),)
 
 
 @dataclass(frozen=True)
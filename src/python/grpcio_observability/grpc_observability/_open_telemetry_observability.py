@@ -12,10 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import logging
 import threading
 import time
-from typing import Any, AnyStr, Dict, Iterable, List, Optional, Set, Union
+import types
+from typing import (
+    Any,
+    AnyStr,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import grpc
 
@@ -47,6 +61,8 @@ GRPC_METHOD_LABEL = "grpc.method"
 GRPC_TARGET_LABEL = "grpc.target"
 GRPC_CLIENT_METRIC_PREFIX = "grpc.client"
 GRPC_OTHER_LABEL_VALUE = "other"
+# The number of distinct label sets each plugin keeps the attributes of.
+_ATTRIBUTES_CACHE_SIZE = 1024
 _observability_lock: threading.RLock = threading.RLock()
 _OPEN_TELEMETRY_OBSERVABILITY: Optional["OpenTelemetryObservability"] = None
 
@@ -71,11 +87,19 @@ GRPC_STATUS_CODE_TO_STRING = {
 }
 
 
+_AttributesCacheKey = Tuple[bool, bool, bool, FrozenSet[Tuple[str, AnyStr]]]
+
+
 class _OpenTelemetryPlugin:
     _plugin: OpenTelemetryPlugin
     _metric_to_recorder: Dict[MetricsName, Union[Counter, Histogram]]
     _enabled_client_plugin_options: Optional[List[OpenTelemetryPluginOption]]
     _enabled_server_plugin_options: Optional[List[OpenTelemetryPluginOption]]
+    _attributes_cache_lock: threading.Lock
+    # Least recently used first.
+    _attributes_cache: Dict[_AttributesCacheKey, Mapping[str, str]]
+    # Bumped by each clear of the cache.
+    _attributes_cache_generation: int
     identifier: str
 
     def __init__(self, plugin: OpenTelemetryPlugin):
@@ -84,6 +108,9 @@ class _OpenTelemetryPlugin:
         self.identifier = str(id(self))
         self._enabled_client_plugin_options = None
         self._enabled_server_plugin_options = None
+        self._attributes_cache_lock = threading.Lock()
+        self._attributes_cache = collections.OrderedDict()
+        self._attributes_cache_generation = 0
 
         meter_provider = self._plugin.meter_provider
         if meter_provider:
@@ -99,8 +126,58 @@ class _OpenTelemetryPlugin:
 
     def _record_stats_data(self, stats_data: StatsData) -> None:
         recorder = self._metric_to_recorder[stats_data.name]
-        enabled_plugin_options = []
-        if GRPC_CLIENT_METRIC_PREFIX in recorder.name:
+        is_client = GRPC_CLIENT_METRIC_PREFIX in recorder.name
+        attributes = self._get_attributes(is_client, stats_data)
+        if isinstance(recorder, Counter):
+            recorder.add(
+                sum(
+                    value * count for value, count in stats_data.measurements()
+                ),
+                attributes=attributes,
+            )
+        elif isinstance(recorder, Histogram):
+            # Histograms take one measurement at a time.
+            for value, count in stats_data.measurements():
+                for _ in range(count):
+                    recorder.record(value, attributes=attributes)
+
+    def _get_attributes(
+        self, is_client: bool, stats_data: StatsData
+    ) -> Mapping[str, str]:
+        """Gets the attributes to record stats_data with.
+
+        Measurements of the same RPCs carry the same labels, so the attributes
+        of each label set are computed once and shared by all its measurements.
+        Attributes computed while the cache was cleared are not cached, since
+        they may lack the labels of the plugin options activated meanwhile.
+        """
+        key = (
+            is_client,
+            stats_data.include_exchange_labels,
+            stats_data.registered_method,
+            frozenset(stats_data.labels.items()),
+        )
+        with self._attributes_cache_lock:
+            attributes = self._attributes_cache.get(key)
+            if attributes is not None:
+                self._attributes_cache.move_to_end(key)
+                return attributes
+            generation = self._attributes_cache_generation
+        attributes = types.MappingProxyType(
+            self._compute_attributes(is_client, stats_data)
+        )
+        with self._attributes_cache_lock:
+            if generation != self._attributes_cache_generation:
+                return attributes
+            self._attributes_cache[key] = attributes
+            if len(self._attributes_cache) > _ATTRIBUTES_CACHE_SIZE:
+                self._attributes_cache.popitem(last=False)
+        return attributes
+
+    def _compute_attributes(
+        self, is_client: bool, stats_data: StatsData
+    ) -> Dict[str, str]:
+        if is_client:
             enabled_plugin_options = self._enabled_client_plugin_options
         else:
             enabled_plugin_options = self._enabled_server_plugin_options
@@ -110,7 +187,7 @@ class _OpenTelemetryPlugin:
                 stats_data.labels, enabled_plugin_options
             )
         else:
-            deserialized_labels = stats_data.labels
+            deserialized_labels = dict(stats_data.labels)
         labels = self._maybe_add_labels(
             stats_data.include_exchange_labels,
             deserialized_labels,
@@ -131,16 +208,12 @@ class _OpenTelemetryPlugin:
             # Filter method name if it's not registered method and
             # generic_method_attribute_filter returns false.
             decoded_labels[GRPC_METHOD_LABEL] = GRPC_OTHER_LABEL_VALUE
+        return decoded_labels
 
-        value = 0
-        if stats_data.measure_double:
-            value = stats_data.value_float
-        else:
-            value = stats_data.value_int
-        if isinstance(recorder, Counter):
-            recorder.add(value, attributes=decoded_labels)
-        elif isinstance(recorder, Histogram):
-            recorder.record(value, attributes=decoded_labels)
+    def _clear_attributes_cache(self) -> None:
+        with self._attributes_cache_lock:
+            self._attributes_cache.clear()
+            self._attributes_cache_generation += 1
 
     def maybe_record_stats_data(self, stats_data: List[StatsData]) -> None:
         # Records stats data to MeterProvider.
@@ -182,6 +255,9 @@ class _OpenTelemetryPlugin:
                     plugin_option, "is_active_on_client_channel"
                 ) and plugin_option.is_active_on_client_channel(target_str):
                     self._enabled_client_plugin_options.append(plugin_option)
+            if self._enabled_client_plugin_options:
+                # Attributes computed so far lack the labels of these options.
+                self._clear_attributes_cache()
 
     def activate_server_plugin_options(self, xds: bool) -> None:
         """Activate server plugin options based on option settings."""
@@ -192,6 +268,9 @@ class _OpenTelemetryPlugin:
                     plugin_option, "is_active_on_server"
                 ) and plugin_option.is_active_on_server(xds):
                     self._enabled_server_plugin_options.append(plugin_option)
+            if self._enabled_server_plugin_options:
+                # Attributes computed so far lack the labels of these options.
+                self._clear_attributes_cache()
 
     @staticmethod
     def _deserialize_labels(
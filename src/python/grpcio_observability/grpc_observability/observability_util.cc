@@ -18,6 +18,8 @@
 #include <cstdlib>
 #include <map>
 #include <string>
+#include <tuple>
+#include <utility>
 
 #include "absl/status/statusor.h"
 #include "absl/strings/string_view.h"
@@ -30,6 +32,7 @@
 namespace grpc_observability {
 
 std::queue<CensusData>* g_census_data_buffer;
+std::vector<AggregatedMetric>* g_aggregated_metrics;
 std::mutex g_census_data_buffer_mutex;
 std::condition_variable g_census_data_buffer_cv;
 // TODO(xuanwn): Change below to a more appropriate number.
@@ -40,6 +43,30 @@ constexpr int kMaxExportBufferSize = 10000;
 
 namespace {
 
+// Identifies the AggregatedMetric a measurement is merged into.
+struct AggregatedMetricKey {
+  MetricsName name;
+  MeasurementType type;
+  bool registered_method;
+  bool include_exchange_labels;
+  std::string identifier;
+  std::vector<std::pair<std::string, std::string>> labels;
+
+  bool operator<(const AggregatedMetricKey& other) const {
+    return std::tie(name, type, registered_method, include_exchange_labels,
+                    identifier, labels) <
+           std::tie(other.name, other.type, other.registered_method,
+                    other.include_exchange_labels, other.identifier,
+                    other.labels);
+  }
+};
+
+// Indexes g_aggregated_metrics, guarded by g_census_data_buffer_mutex.
+std::map<AggregatedMetricKey, size_t>* g_aggregated_metric_index;
+// The number of distinct values held by g_aggregated_metrics, which is
+// bounded like the number of entries of g_census_data_buffer.
+size_t g_aggregated_value_count = 0;
+
 float GetExportThreadHold() {
   const char* value = std::getenv("GRPC_PYTHON_CENSUS_EXPORT_THRESHOLD");
   if (value != nullptr) {
@@ -69,8 +96,7 @@ void RecordIntMetric(MetricsName name, int64_t value,
   measurement_data.include_exchange_labels = include_exchange_labels;
   measurement_data.value.value_int = value;
 
-  CensusData data = CensusData(measurement_data, labels, identifier);
-  AddCensusDataToBuffer(data);
+  AggregateMetric(measurement_data, labels, identifier);
 }
 
 void RecordDoubleMetric(MetricsName name, double value,
@@ -84,8 +110,7 @@ void RecordDoubleMetric(MetricsName name, double value,
   measurement_data.include_exchange_labels = include_exchange_labels;
   measurement_data.value.value_double = value;
 
-  CensusData data = CensusData(measurement_data, labels, identifier);
-  AddCensusDataToBuffer(data);
+  AggregateMetric(measurement_data, labels, identifier);
 }
 
 void RecordSpan(const SpanCensusData& span_census_data) {
@@ -95,6 +120,8 @@ void RecordSpan(const SpanCensusData& span_census_data) {
 
 void NativeObservabilityInit() {
   g_census_data_buffer = new std::queue<CensusData>;
+  g_aggregated_metrics = new std::vector<AggregatedMetric>;
+  g_aggregated_metric_index = new std::map<AggregatedMetricKey, size_t>;
 }
 
 void* CreateClientCallTracer(const char* method, const char* target,
@@ -136,6 +163,53 @@ void AddCensusDataToBuffer(const CensusData& data) {
   }
 }
 
+void AggregateMetric(const Measurement& measurement,
+                     const std::vector<Label>& labels,
+                     const std::string& identifier) {
+  AggregatedMetricKey key{measurement.name,
+                          measurement.type,
+                          measurement.registered_method,
+                          measurement.include_exchange_labels,
+                          identifier,
+                          {}};
+  key.labels.reserve(labels.size());
+  for (const Label& label : labels) {
+    key.labels.emplace_back(label.key, label.value);
+  }
+  std::unique_lock<std::mutex> lk(g_census_data_buffer_mutex);
+  if (g_aggregated_value_count >=
+      static_cast<size_t>(GetMaxExportBufferSize())) {
+    VLOG(2) << "Reached maximum census data buffer size, discarding this "
+               "measurement";
+    return;
+  }
+  auto it = g_aggregated_metric_index->find(key);
+  if (it == g_aggregated_metric_index->end()) {
+    it = g_aggregated_metric_index
+             ->emplace(std::move(key), g_aggregated_metrics->size())
+             .first;
+    g_aggregated_metrics->emplace_back(measurement, labels, identifier);
+  }
+  AggregatedMetric& metric = (*g_aggregated_metrics)[it->second];
+  int64_t& count =
+      measurement.type == kMeasurementInt
+          ? metric.int_value_counts[measurement.value.value_int]
+          : metric.double_value_counts[measurement.value.value_double];
+  if (count++ == 0) {
+    ++g_aggregated_value_count;
+  }
+  if (g_aggregated_value_count >=
+      (GetExportThreadHold() * GetMaxExportBufferSize())) {
+    g_census_data_buffer_cv.notify_all();
+  }
+}
+
+void ClearAggregatedMetricsLocked() {
+  g_aggregated_metrics->clear();
+  g_aggregated_metric_index->clear();
+  g_aggregated_value_count = 0;
+}
+
 absl::string_view StatusCodeToString(grpc_status_code code) {
   switch (code) {
     case GRPC_STATUS_OK:
@@ -20,6 +20,7 @@
 
 #include <algorithm>
 #include <condition_variable>
+#include <map>
 #include <mutex>
 #include <queue>
 #include <string>
@@ -49,8 +50,25 @@ struct CensusData {
   CensusData(const SpanCensusData& sd) : type(kSpanData), span_data(sd) {}
 };
 
+// The measurements of one metric with the same labels, recorded since the
+// last export. Values are kept with the number of times each was recorded,
+// since most of them (RPC and message counts, message sizes) repeat.
+struct AggregatedMetric {
+  Measurement measurement_data;
+  std::vector<Label> labels;
+  std::string identifier;
+  std::map<int64_t, int64_t> int_value_counts;
+  std::map<double, int64_t> double_value_counts;
+  AggregatedMetric() {}
+  AggregatedMetric(const Measurement& mm, const std::vector<Label>& labels,
+                   std::string id)
+      : measurement_data(mm), labels(labels), identifier(id) {}
+};
+
 // extern is required for Cython
 extern std::queue<CensusData>* g_census_data_buffer;
+// Guarded by g_census_data_buffer_mutex.
+extern std::vector<AggregatedMetric>* g_aggregated_metrics;
 extern std::mutex g_census_data_buffer_mutex;
 extern std::condition_variable g_census_data_buffer_cv;
 
@@ -70,6 +88,15 @@ void AwaitNextBatchLocked(std::unique_lock<std::mutex>& lock, int timeout_ms);
 
 void AddCensusDataToBuffer(const CensusData& buffer);
 
+// Merges a measurement into g_aggregated_metrics.
+void AggregateMetric(const Measurement& measurement,
+                     const std::vector<Label>& labels,
+                     const std::string& identifier);
+
+// Must be called with g_census_data_buffer_mutex held, once the aggregated
+// metrics were exported.
+void ClearAggregatedMetricsLocked();
+
 void RecordIntMetric(MetricsName name, int64_t value,
                      const std::vector<Label>& labels, std::string identifier,
                      const bool registered_method,
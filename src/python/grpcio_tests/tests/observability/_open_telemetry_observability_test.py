@@ -31,6 +31,7 @@ from grpc_observability._open_telemetry_observability import GRPC_METHOD_LABEL
 from grpc_observability._open_telemetry_observability import GRPC_TARGET_LABEL
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import AggregationTemporality
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 from opentelemetry.sdk.metrics.export import MetricExportResult
 from opentelemetry.sdk.metrics.export import MetricExporter
 from opentelemetry.sdk.metrics.export import MetricsData
@@ -41,6 +42,7 @@ from tests.observability import _test_server
 logger = logging.getLogger(__name__)
 
 STREAM_LENGTH = 5
+RPC_COUNT = 20
 OTEL_EXPORT_INTERVAL_S = 0.5
 
 
@@ -139,6 +141,29 @@ class OpenTelemetryObservabilityTest(unittest.TestCase):
         self._validate_metrics_exist(self.all_metrics)
         self._validate_all_metrics_names(self.all_metrics.keys())
 
+    def testRecordCountersOfManyRpcs(self):
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+        with grpc_observability.OpenTelemetryPlugin(meter_provider=provider):
+            server, port = _test_server.start_server()
+            self._server = server
+            for _ in range(RPC_COUNT):
+                _test_server.unary_unary_call(port=port)
+
+        # Measurements of the same metric and labels are aggregated natively
+        # before they are recorded, which must not change the totals.
+        started_counts = defaultdict(int)
+        for resource_metric in reader.get_metrics_data().resource_metrics:
+            for scope_metric in resource_metric.scope_metrics:
+                for metric in scope_metric.metrics:
+                    for data_point in metric.data.data_points:
+                        if metric.name.endswith(".started"):
+                            started_counts[metric.name] += data_point.value
+        self.assertEqual(
+            RPC_COUNT, started_counts["grpc.client.attempt.started"]
+        )
+        self.assertEqual(RPC_COUNT, started_counts["grpc.server.call.started"])
+
     def testRecordUnaryUnaryUseGlobalInit(self):
         otel_plugin = grpc_observability.OpenTelemetryPlugin(
             meter_provider=self._provider
@@ -392,6 +417,28 @@ class OpenTelemetryObservabilityTest(unittest.TestCase):
         main_server.stop(0)
         backup_server.stop(0)
 
+    def testAttributeFilterCalledOncePerLabelSet(self):
+        def record_rpcs(rpc_count: int) -> int:
+            filtered_targets = []
+
+            def target_filter(target: str) -> bool:
+                filtered_targets.append(target)
+                return True
+
+            with grpc_observability.OpenTelemetryPlugin(
+                meter_provider=self._provider,
+                target_attribute_filter=target_filter,
+            ):
+                server, port = _test_server.start_server()
+                for _ in range(rpc_count):
+                    _test_server.unary_unary_call(port=port)
+            server.stop(0)
+            return len(filtered_targets)
+
+        # The attributes of each label set are computed once, however many
+        # RPCs are recorded with it.
+        self.assertEqual(record_rpcs(1), record_rpcs(RPC_COUNT))
+
     def testMethodAttributeFilter(self):
         # method_filter should replace method name 'test/UnaryUnaryFiltered' with 'other'.
         FILTERED_METHOD_NAME = "test/UnaryUnaryFiltered"
@@ -0,0 +1,148 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests sending messages serialized into buffer-protocol objects."""
+
+import logging
+import time
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import bound_socket
+from tests.unit.framework.common import test_constants
+
+_SMALL_MESSAGE = b"\x07" * 16
+# Larger than the threshold above which messages are sent without a copy.
+_LARGE_MESSAGE = bytes(range(256)) * 4096
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_STREAM_STREAM = "StreamStream"
+
+
+def _memoryview_serializer(message):
+    return memoryview(message)
+
+
+def _bytearray_serializer(message):
+    return bytearray(message)
+
+
+def _non_contiguous_serializer(message):
+    # Every other byte of a doubled message, which is not C-contiguous.
+    return memoryview(bytes(b for b in message for _ in range(2)))[::2]
+
+
+def handle_unary_unary(request, servicer_context):
+    return request
+
+
+def handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+_METHOD_HANDLERS = {
+    _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+        handle_unary_unary, response_serializer=_memoryview_serializer
+    ),
+    _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+        handle_stream_stream, response_serializer=_bytearray_serializer
+    ),
+}
+
+
+class BufferMessageTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _METHOD_HANDLERS
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(0)
+        self._channel.close()
+
+    def _unary_unary(self, request_serializer):
+        return self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            request_serializer=request_serializer,
+            _registered_method=True,
+        )
+
+    def testSmallMemoryviewMessage(self):
+        response = self._unary_unary(_memoryview_serializer)(_SMALL_MESSAGE)
+        self.assertEqual(_SMALL_MESSAGE, response)
+
+    def testLargeMemoryviewMessage(self):
+        response = self._unary_unary(_memoryview_serializer)(_LARGE_MESSAGE)
+        self.assertEqual(_LARGE_MESSAGE, response)
+
+    def testLargeBytearrayMessage(self):
+        response = self._unary_unary(_bytearray_serializer)(_LARGE_MESSAGE)
+        self.assertEqual(_LARGE_MESSAGE, response)
+
+    def testNonContiguousMessage(self):
+        response = self._unary_unary(_non_contiguous_serializer)(_SMALL_MESSAGE)
+        self.assertEqual(_SMALL_MESSAGE, response)
+
+    def testLargeNonContiguousMessage(self):
+        response = self._unary_unary(_non_contiguous_serializer)(_LARGE_MESSAGE)
+        self.assertEqual(_LARGE_MESSAGE, response)
+
+    def testMessageBufferPinnedUntilSent(self):
+        message = bytearray(_LARGE_MESSAGE)
+        # Nothing accepts connections on this port, so the send stays pending.
+        with bound_socket(listen=False) as (host, port):
+            with grpc.insecure_channel("%s:%d" % (host, port)) as channel:
+                response_future = channel.unary_unary(
+                    grpc._common.fully_qualified_method(
+                        _SERVICE_NAME, _UNARY_UNARY
+                    ),
+                    request_serializer=lambda unused_request: message,
+                    _registered_method=True,
+                ).future(None, wait_for_ready=True)
+                with self.assertRaises(BufferError):
+                    message.extend(b"\x00")
+                response_future.cancel()
+        # Once core drops the slice the buffer may be resized again.
+        deadline = time.time() + test_constants.SHORT_TIMEOUT
+        while True:
+            try:
+                message.extend(b"\x00")
+                break
+            except BufferError:
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.01)
+
+    def testStreamStreamLargeMessages(self):
+        requests = [_LARGE_MESSAGE, _SMALL_MESSAGE] * (
+            test_constants.STREAM_LENGTH // 32
+        )
+        response_iterator = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            request_serializer=_memoryview_serializer,
+            _registered_method=True,
+        )(iter(requests))
+        self.assertSequenceEqual(requests, list(response_iterator))
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
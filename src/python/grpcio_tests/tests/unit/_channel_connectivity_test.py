@@ -23,6 +23,9 @@ import grpc
 from tests.unit import thread_pool
 from tests.unit.framework.common import test_constants
 
+_NUM_CHANNELS = 16
+_NUM_CALLBACKS = 4
+
 
 def _ready_in_connectivities(connectivities):
     return grpc.ChannelConnectivity.READY in connectivities
@@ -56,6 +59,28 @@ class _Callback(object):
                     self._condition.wait()
 
 
+class _ConcurrencyRecorder(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running = 0
+        self.max_running = 0
+
+    def wrap(self, behavior):
+        def recorded(*args):
+            with self._lock:
+                self._running += 1
+                self.max_running = max(self.max_running, self._running)
+            try:
+                # Gives other deliveries of the channel time to overlap.
+                time.sleep(test_constants.SHORT_TIMEOUT / 100)
+                behavior(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        return recorded
+
+
 class ChannelConnectivityTest(unittest.TestCase):
     def test_lonely_channel_connectivity(self):
         callback = _Callback()
@@ -168,6 +193,51 @@ class ChannelConnectivityTest(unittest.TestCase):
         channel.close()
         self.assertFalse(recording_thread_pool.was_used())
 
+    def test_subscribed_channels_share_threads(self):
+        thread_count = threading.active_count()
+        callbacks = [_Callback() for _ in range(_NUM_CHANNELS)]
+        channels = [
+            grpc.insecure_channel("localhost:12345")
+            for _ in range(_NUM_CHANNELS)
+        ]
+        for channel, callback in zip(channels, callbacks):
+            channel.subscribe(callback.update, try_to_connect=True)
+        for callback in callbacks:
+            callback.block_until_connectivities_satisfy(
+                lambda connectivities: 2 <= len(connectivities)
+            )
+        # No thread is started per channel.
+        self.assertLess(threading.active_count() - thread_count, _NUM_CHANNELS)
+        for channel, callback in zip(channels, callbacks):
+            channel.unsubscribe(callback.update)
+            channel.close()
+
+    def test_channel_callbacks_delivered_in_order(self):
+        recorder = _ConcurrencyRecorder()
+        callbacks = [_Callback() for _ in range(_NUM_CALLBACKS)]
+        updates = [recorder.wrap(callback.update) for callback in callbacks]
+
+        channel = grpc.insecure_channel("localhost:12345")
+        for update, callback in zip(updates, callbacks):
+            channel.subscribe(update, try_to_connect=False)
+            callback.block_until_connectivities_satisfy(bool)
+        connecting_callback = _Callback()
+        channel.subscribe(connecting_callback.update, try_to_connect=True)
+        for callback in callbacks:
+            callback.block_until_connectivities_satisfy(
+                lambda connectivities: 2 <= len(connectivities)
+            )
+        for update in updates + [connecting_callback.update]:
+            channel.unsubscribe(update)
+        channel.close()
+
+        self.assertEqual(1, recorder.max_running)
+        for callback in callbacks:
+            connectivities = callback.connectivities()
+            self.assertIs(grpc.ChannelConnectivity.IDLE, connectivities[0])
+            for previous, current in zip(connectivities, connectivities[1:]):
+                self.assertIsNot(previous, current)
+
 
 if __name__ == "__main__":
     logging.basicConfig()
@@ -0,0 +1,178 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests adaptive limits on the number of RPCs a server handles at once."""
+
+from concurrent import futures
+import logging
+import threading
+import unittest
+
+import grpc
+from grpc import experimental
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_BLOCKING = "Blocking"
+_UNIMPLEMENTED = "Unimplemented"
+
+_REQUEST = b"\x07"
+
+
+class _BlockingHandler(object):
+    def __init__(self):
+        self.started = threading.Event()
+        self.proceed = threading.Event()
+
+    def __call__(self, request, servicer_context):
+        self.started.set()
+        self.proceed.wait(test_constants.LONG_TIMEOUT)
+        return request
+
+
+class ConcurrencyLimiterTest(unittest.TestCase):
+    def test_aimd_limit_grows_while_used(self):
+        limiter = experimental.AimdConcurrencyLimiter(
+            initial_limit=2, max_limit=10
+        )
+        for _ in range(3):
+            self.assertTrue(limiter.acquire())
+            self.assertTrue(limiter.acquire())
+            limiter.release(0.01, 0.0)
+            limiter.release(0.01, 0.0)
+        self.assertGreater(limiter.limit, 2)
+        self.assertEqual(0, limiter.rejected_count)
+
+    def test_aimd_limit_shrinks_with_queueing_delay(self):
+        limiter = experimental.AimdConcurrencyLimiter(
+            initial_limit=10, queueing_delay_threshold=0.1, backoff_ratio=0.5
+        )
+        self.assertTrue(limiter.acquire())
+        limiter.release(0.01, 0.5)
+        self.assertEqual(5, limiter.limit)
+
+    def test_gradient_limit_shrinks_with_latency(self):
+        limiter = experimental.GradientConcurrencyLimiter(
+            initial_limit=16, smoothing=1.0, tolerance=1.0
+        )
+        for latency in (0.01, 0.1):
+            in_flight = [limiter.acquire() for _ in range(limiter.limit)]
+            self.assertTrue(all(in_flight))
+            limiter.release(latency, 0.0)
+            for _ in in_flight[1:]:
+                limiter.release(0.0, 0.0)
+        self.assertLess(limiter.limit, 16)
+
+    def test_limit_within_bounds(self):
+        limiter = experimental.AimdConcurrencyLimiter(
+            initial_limit=2, min_limit=2, max_limit=3, backoff_ratio=0.1
+        )
+        for _ in range(5):
+            self.assertTrue(limiter.acquire())
+            limiter.release(0.0, 0.0)
+            self.assertTrue(limiter.acquire())
+            limiter.release(10.0, 0.0)
+        self.assertEqual(2, limiter.limit)
+
+    def test_rejections_counted(self):
+        limiter = experimental.GradientConcurrencyLimiter(
+            initial_limit=1, max_limit=1
+        )
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire())
+        self.assertFalse(limiter.acquire())
+        self.assertEqual(2, limiter.rejected_count)
+        limiter.release(0.01, 0.0)
+        self.assertTrue(limiter.acquire())
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            experimental.AimdConcurrencyLimiter(initial_limit=0)
+        with self.assertRaises(ValueError):
+            experimental.GradientConcurrencyLimiter(
+                initial_limit=5, max_limit=4
+            )
+
+
+class ServerConcurrencyLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self._limiter = experimental.AimdConcurrencyLimiter(
+            initial_limit=1, max_limit=10
+        )
+        self._handler = _BlockingHandler()
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=2),
+            options=(
+                (experimental.ServerOptions.ConcurrencyLimiter, self._limiter),
+            ),
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {_BLOCKING: grpc.unary_unary_rpc_method_handler(self._handler)},
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._blocking = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _BLOCKING),
+            _registered_method=True,
+        )
+        self._unimplemented = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNIMPLEMENTED),
+        )
+
+    def tearDown(self):
+        self._handler.proceed.set()
+        self._server.stop(None)
+        self._channel.close()
+
+    def test_rejects_beyond_limit(self):
+        first_call = self._blocking.future(_REQUEST)
+        self.assertTrue(
+            self._handler.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._blocking(_REQUEST)
+        self.assertIs(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            exception_context.exception.code(),
+        )
+        self.assertEqual(1, self._limiter.rejected_count)
+
+        self._handler.proceed.set()
+        self.assertEqual(_REQUEST, first_call.result())
+
+    def test_unhandled_rpcs_not_sampled(self):
+        for _ in range(3):
+            with self.assertRaises(grpc.RpcError) as exception_context:
+                self._unimplemented(_REQUEST)
+            self.assertIs(
+                grpc.StatusCode.UNIMPLEMENTED,
+                exception_context.exception.code(),
+            )
+        self.assertEqual(1, self._limiter.limit)
+        self.assertEqual(0, self._limiter.in_flight)
+        self.assertEqual(0, self._limiter.rejected_count)
+
+    def test_invalid_limiter(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=1),
+                options=((experimental.ServerOptions.ConcurrencyLimiter, 1),),
+            )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,108 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests that servers drop RPCs whose deadline expires before they run."""
+
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_BLOCKING = "Blocking"
+
+_REQUEST = b"\x07"
+_QUEUED_TIMEOUT = 0.2
+_BLOCKED_FOR = 3.0
+
+
+class _BlockingHandler(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.handled_count = 0
+        self.started = threading.Event()
+        self.proceed = threading.Event()
+
+    def __call__(self, request, servicer_context):
+        with self.lock:
+            self.handled_count += 1
+        self.started.set()
+        self.proceed.wait(test_constants.LONG_TIMEOUT)
+        return request
+
+
+class DeadlineSheddingTest(unittest.TestCase):
+    def setUp(self):
+        self._handler = _BlockingHandler()
+        self._server = test_common.test_server(max_workers=1)
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {_BLOCKING: grpc.unary_unary_rpc_method_handler(self._handler)},
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._blocking = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _BLOCKING),
+            _registered_method=True,
+        )
+
+    def tearDown(self):
+        self._handler.proceed.set()
+        self._server.stop(None)
+        self._channel.close()
+
+    def _expire_queued_call(self):
+        first_call = self._blocking.future(_REQUEST)
+        self.assertTrue(
+            self._handler.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+        queued_call = self._blocking.future(_REQUEST, timeout=_QUEUED_TIMEOUT)
+        self.assertIs(
+            grpc.StatusCode.DEADLINE_EXCEEDED, queued_call.exception().code()
+        )
+        time.sleep(_BLOCKED_FOR)
+        self._handler.proceed.set()
+        self.assertEqual(_REQUEST, first_call.result())
+        # Lets the worker take up and drop the queued call.
+        time.sleep(_QUEUED_TIMEOUT)
+
+    def test_expired_queued_call_not_handled(self):
+        self._expire_queued_call()
+        self.assertEqual(_REQUEST, self._blocking(_REQUEST))
+        self.assertEqual(2, self._handler.handled_count)
+
+    def test_doomed_call_rejected(self):
+        self._expire_queued_call()
+        # The queued call waited for seconds, which is far longer than the
+        # deadline of this one.
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._blocking(_REQUEST, timeout=_QUEUED_TIMEOUT / 2)
+        self.assertIs(
+            grpc.StatusCode.DEADLINE_EXCEEDED,
+            exception_context.exception.code(),
+        )
+        self.assertIn(
+            "Deadline would expire", exception_context.exception.details()
+        )
+        self.assertEqual(1, self._handler.handled_count)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
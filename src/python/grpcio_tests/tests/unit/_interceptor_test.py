@@ -23,6 +23,7 @@ import threading
 import unittest
 
 import grpc
+from grpc import experimental
 from grpc.framework.foundation import logging_pool
 
 from tests.unit import test_common
@@ -37,6 +38,7 @@ _DESERIALIZE_RESPONSE = lambda bytestring: bytestring[: len(bytestring) // 3]
 _EXCEPTION_REQUEST = b"\x09\x0a"
 
 _SERVICE_NAME = "test"
+_GENERIC_SERVICE_NAME = "generic_test"
 _UNARY_UNARY = "UnaryUnary"
 _UNARY_STREAM = "UnaryStream"
 _STREAM_UNARY = "StreamUnary"
@@ -457,6 +459,20 @@ def _filter_server_interceptor(condition, interceptor):
     return _GenericServerInterceptor(intercept_service)
 
 
+class _CacheableLoggingInterceptor(
+    _LoggingInterceptor, experimental.CacheableServerInterceptor
+):
+    pass
+
+
+class _DynamicGenericHandler(grpc.GenericRpcHandler):
+    def __init__(self, generic_handler):
+        self._generic_handler = generic_handler
+
+    def service(self, handler_call_details):
+        return self._generic_handler.service(handler_call_details)
+
+
 class InterceptorTest(unittest.TestCase):
     def setUp(self):
         self._control = test_control.PauseFailControl()
@@ -989,6 +1005,112 @@ class InterceptorTest(unittest.TestCase):
         )
 
 
+class CacheableInterceptorTest(unittest.TestCase):
+    def setUp(self):
+        self._control = test_control.PauseFailControl()
+        self._record = []
+        self._handler = _Handler(self._control, self._record)
+        self._server_pool = logging_pool.pool(test_constants.THREAD_CONCURRENCY)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._server_pool.shutdown(wait=True)
+        self._channel.close()
+
+    def _start_server(self, interceptors):
+        self._server = grpc.server(
+            self._server_pool,
+            options=(("grpc.so_reuseport", 0),),
+            interceptors=interceptors,
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, get_method_handlers(self._handler)
+        )
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def _call_unary_unary(self, times):
+        multi_callable = _unary_unary_multi_callable(self._channel)
+        for _ in range(times):
+            self.assertEqual(b"\x07", multi_callable(b"\x07"))
+
+    def testCacheableInterceptorsRunOncePerMethod(self):
+        self._start_server(
+            (
+                _CacheableLoggingInterceptor("s1", self._record),
+                _CacheableLoggingInterceptor("s2", self._record),
+            )
+        )
+        self._call_unary_unary(3)
+        self.assertSequenceEqual(
+            self._record,
+            [
+                "s1:intercept_service",
+                "s2:intercept_service",
+                "handler:handle_unary_unary",
+                "handler:handle_unary_unary",
+                "handler:handle_unary_unary",
+            ],
+        )
+
+    def testInterceptorsRunPerRpcUnlessAllCacheable(self):
+        self._start_server(
+            (
+                _CacheableLoggingInterceptor("s1", self._record),
+                _LoggingInterceptor("s2", self._record),
+            )
+        )
+        self._call_unary_unary(2)
+        self.assertSequenceEqual(
+            self._record,
+            [
+                "s1:intercept_service",
+                "s2:intercept_service",
+                "handler:handle_unary_unary",
+            ]
+            * 2,
+        )
+
+    def _call_generic_unary_unary(self, generic_handler, times):
+        self._server.add_generic_rpc_handlers((generic_handler,))
+        multi_callable = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(
+                _GENERIC_SERVICE_NAME, _UNARY_UNARY
+            )
+        )
+        for _ in range(times):
+            self.assertEqual(b"\x07", multi_callable(b"\x07"))
+
+    def testCacheableInterceptorsRunOncePerStaticGenericMethod(self):
+        self._start_server((_CacheableLoggingInterceptor("s1", self._record),))
+        self._call_generic_unary_unary(
+            grpc.method_handlers_generic_handler(
+                _GENERIC_SERVICE_NAME, get_method_handlers(self._handler)
+            ),
+            2,
+        )
+        self.assertSequenceEqual(
+            self._record,
+            ["s1:intercept_service"] + ["handler:handle_unary_unary"] * 2,
+        )
+
+    def testCacheableInterceptorsRunPerRpcOfDynamicGenericMethod(self):
+        self._start_server((_CacheableLoggingInterceptor("s1", self._record),))
+        self._call_generic_unary_unary(
+            _DynamicGenericHandler(
+                grpc.method_handlers_generic_handler(
+                    _GENERIC_SERVICE_NAME, get_method_handlers(self._handler)
+                )
+            ),
+            2,
+        )
+        self.assertSequenceEqual(
+            self._record,
+            ["s1:intercept_service", "handler:handle_unary_unary"] * 2,
+        )
+
+
 if __name__ == "__main__":
     logging.basicConfig()
     unittest.main(verbosity=2)
@@ -0,0 +1,274 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests non-blocking handlers of every RPC arity."""
+
+from concurrent import futures
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_UNARY_LATER = "UnaryUnaryLater"
+_UNARY_UNARY_NONE = "UnaryUnaryNone"
+_UNARY_UNARY_FAILED = "UnaryUnaryFailed"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_UNARY_ITERATING = "StreamUnaryIterating"
+_STREAM_STREAM = "StreamStream"
+_STREAM_STREAM_FAILING = "StreamStreamFailing"
+
+_CONCURRENT_STREAMS = 16
+_SERVER_WORKERS = 2
+_MAXIMUM_CONCURRENT_RPCS = 2
+
+
+def _non_blocking(behavior):
+    behavior.experimental_non_blocking = True
+    return behavior
+
+
+@_non_blocking
+def handle_unary_unary(request, servicer_context, send_response):
+    send_response(request)
+
+
+@_non_blocking
+def handle_unary_unary_later(request, servicer_context, send_response):
+    threading.Timer(
+        test_constants.SHORT_TIMEOUT / 10, send_response, (request,)
+    ).start()
+
+
+@_non_blocking
+def handle_unary_unary_none(request, servicer_context, send_response):
+    send_response(None)
+
+
+@_non_blocking
+def handle_unary_unary_failed(request, servicer_context, send_response):
+    servicer_context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+    send_response(None)
+
+
+@_non_blocking
+def handle_stream_unary(request_iterator, servicer_context, send_response):
+    requests = []
+
+    def on_request(request):
+        if request is None:
+            send_response(b",".join(requests))
+        else:
+            requests.append(request)
+
+    return on_request
+
+
+@_non_blocking
+def handle_stream_unary_iterating(
+    request_iterator, servicer_context, send_response
+):
+    send_response(b",".join(request_iterator))
+
+
+@_non_blocking
+def handle_stream_stream(request_iterator, servicer_context, send_response):
+    def on_request(request):
+        # Echoes each request and finishes once the client is done.
+        send_response(request)
+
+    return on_request
+
+
+@_non_blocking
+def handle_stream_stream_failing(
+    request_iterator, servicer_context, send_response
+):
+    def on_request(request):
+        raise ValueError("Cannot handle requests!")
+
+    return on_request
+
+
+def _requests():
+    return [b"%d" % index for index in range(test_constants.STREAM_LENGTH)]
+
+
+class NonBlockingHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server(max_workers=_SERVER_WORKERS)
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    handle_unary_unary
+                ),
+                _UNARY_UNARY_LATER: grpc.unary_unary_rpc_method_handler(
+                    handle_unary_unary_later
+                ),
+                _UNARY_UNARY_NONE: grpc.unary_unary_rpc_method_handler(
+                    handle_unary_unary_none
+                ),
+                _UNARY_UNARY_FAILED: grpc.unary_unary_rpc_method_handler(
+                    handle_unary_unary_failed
+                ),
+                _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                    handle_stream_unary
+                ),
+                _STREAM_UNARY_ITERATING: grpc.stream_unary_rpc_method_handler(
+                    handle_stream_unary_iterating
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    handle_stream_stream
+                ),
+                _STREAM_STREAM_FAILING: grpc.stream_stream_rpc_method_handler(
+                    handle_stream_stream_failing
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _multi_callable(self, method, arity):
+        return getattr(self._channel, arity)(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def test_unary_unary(self):
+        for method in (_UNARY_UNARY, _UNARY_UNARY_LATER):
+            response = self._multi_callable(method, "unary_unary")(b"\x07")
+            self.assertEqual(b"\x07", response)
+
+    def test_unary_unary_none_response(self):
+        for method, code in (
+            (_UNARY_UNARY_NONE, grpc.StatusCode.INTERNAL),
+            (_UNARY_UNARY_FAILED, grpc.StatusCode.FAILED_PRECONDITION),
+        ):
+            with self.assertRaises(grpc.RpcError) as exception_context:
+                self._multi_callable(method, "unary_unary")(b"\x07")
+            self.assertIs(code, exception_context.exception.code())
+
+    def test_stream_unary(self):
+        requests = _requests()
+        for method in (_STREAM_UNARY, _STREAM_UNARY_ITERATING):
+            response = self._multi_callable(method, "stream_unary")(
+                iter(requests)
+            )
+            self.assertEqual(b",".join(requests), response)
+
+    def test_stream_stream(self):
+        requests = _requests()
+        responses = self._multi_callable(_STREAM_STREAM, "stream_stream")(
+            iter(requests)
+        )
+        self.assertSequenceEqual(requests, list(responses))
+
+    def test_concurrent_streams_outnumbering_workers(self):
+        stream_stream = self._multi_callable(_STREAM_STREAM, "stream_stream")
+        calls = [stream_stream() for _ in range(_CONCURRENT_STREAMS)]
+        # Every stream stays open while the others are served by the same
+        # few server threads.
+        for index, call in enumerate(calls):
+            call.write(b"%d" % index)
+            self.assertEqual(b"%d" % index, next(call))
+        for call in calls:
+            call.done_writing()
+            self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def test_failing_request_callback(self):
+        responses = self._multi_callable(
+            _STREAM_STREAM_FAILING, "stream_stream"
+        )(iter(_requests()))
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            list(responses)
+        self.assertIs(
+            grpc.StatusCode.UNKNOWN, exception_context.exception.code()
+        )
+
+
+class MaximumConcurrentRpcsTest(unittest.TestCase):
+    def setUp(self):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=_SERVER_WORKERS),
+            maximum_concurrent_rpcs=_MAXIMUM_CONCURRENT_RPCS,
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    handle_stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._stream_stream = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _open_stream(self):
+        call = self._stream_stream()
+        call.write(b"\x07")
+        self.assertEqual(b"\x07", next(call))
+        return call
+
+    def test_open_streams_bounded(self):
+        calls = [self._open_stream() for _ in range(_MAXIMUM_CONCURRENT_RPCS)]
+        # The handlers of the open streams have long returned.
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._open_stream()
+        self.assertIs(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            exception_context.exception.code(),
+        )
+
+        calls[0].done_writing()
+        self.assertIs(grpc.StatusCode.OK, calls[0].code())
+        # The server counts the stream out once it also got the status out.
+        deadline = time.monotonic() + test_constants.SHORT_TIMEOUT
+        while True:
+            try:
+                calls[0] = self._open_stream()
+                break
+            except grpc.RpcError as rpc_error:
+                self.assertIs(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED, rpc_error.code()
+                )
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(test_constants.SHORT_TIMEOUT / 100)
+        for call in calls:
+            call.done_writing()
+            self.assertIs(grpc.StatusCode.OK, call.code())
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,113 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests metadata prepared once and attached to many RPCs."""
+
+import logging
+import unittest
+
+import grpc
+from grpc import experimental
+
+from tests.unit import test_common
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+
+_METADATA = (
+    ("authorization", "Bearer token"),
+    ("x-routing-key", "shard-7"),
+    ("x-trace-bin", b"\x00\x01\x02"),
+)
+_TRAILING_METADATA = experimental.PreparedMetadata(
+    (("x-server-name", "prepared"),)
+)
+
+
+def handle_unary_unary(request, servicer_context):
+    servicer_context.set_trailing_metadata(
+        tuple(servicer_context.invocation_metadata()) + _TRAILING_METADATA
+    )
+    return request
+
+
+class PreparedMetadataTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    handle_unary_unary
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._unary_unary = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            _registered_method=True,
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _assert_metadata_received(self, expected_metadata, metadata):
+        for metadatum in expected_metadata:
+            self.assertIn(metadatum, metadata)
+
+    def test_prepared_metadata_is_a_tuple(self):
+        prepared_metadata = experimental.PreparedMetadata(_METADATA)
+        self.assertEqual(_METADATA, prepared_metadata)
+        self.assertEqual(_METADATA, tuple(prepared_metadata))
+        self.assertEqual(len(_METADATA), len(prepared_metadata))
+
+    def test_prepared_metadata_reused_across_calls(self):
+        prepared_metadata = experimental.PreparedMetadata(_METADATA)
+        for _ in range(3):
+            response, call = self._unary_unary.with_call(
+                b"\x07", metadata=prepared_metadata
+            )
+            self.assertEqual(b"\x07", response)
+            self._assert_metadata_received(_METADATA, call.trailing_metadata())
+            self._assert_metadata_received(
+                _TRAILING_METADATA, call.trailing_metadata()
+            )
+
+    def test_prepared_metadata_concatenated(self):
+        metadata = experimental.PreparedMetadata(_METADATA) + (
+            ("x-request-id", "42"),
+        )
+        unused_response, call = self._unary_unary.with_call(
+            b"\x07", metadata=metadata, compression=grpc.Compression.Gzip
+        )
+        self._assert_metadata_received(metadata, call.trailing_metadata())
+
+    def test_invalid_key(self):
+        with self.assertRaises(ValueError):
+            experimental.PreparedMetadata((("Invalid Key", "value"),))
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            experimental.PreparedMetadata((("key", "value\n"),))
+
+    def test_binary_value_not_bytes(self):
+        with self.assertRaises(TypeError):
+            experimental.PreparedMetadata((("key-bin", "value"),))
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,124 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests client-streaming RPCs sending requests ahead of the network."""
+
+import logging
+import unittest
+
+import grpc
+from grpc import experimental
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+
+_SEND_WINDOW = 8
+
+
+def handle_stream_unary(request_iterator, servicer_context):
+    return b",".join(request_iterator)
+
+
+def handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+def _requests():
+    return [b"%d" % index for index in range(test_constants.STREAM_LENGTH)]
+
+
+def _failing_request_iterator(requests):
+    for request in requests:
+        yield request
+    raise ValueError("No more requests!")
+
+
+class RequestSendWindowTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                    handle_stream_unary
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    handle_stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            "localhost:%d" % port,
+            options=(
+                (experimental.ChannelOptions.RequestSendWindow, _SEND_WINDOW),
+            ),
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _stream_unary(self):
+        return self._channel.stream_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_UNARY),
+            _registered_method=True,
+        )
+
+    def _stream_stream(self):
+        return self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+
+    def test_stream_unary(self):
+        requests = _requests()
+        self.assertEqual(
+            b",".join(requests), self._stream_unary()(iter(requests))
+        )
+
+    def test_stream_unary_future(self):
+        requests = _requests()
+        response_future = self._stream_unary().future(iter(requests))
+        self.assertEqual(b",".join(requests), response_future.result())
+
+    def test_stream_stream(self):
+        requests = _requests()
+        self.assertSequenceEqual(
+            requests, list(self._stream_stream()(iter(requests)))
+        )
+
+    def test_failing_request_iterator(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._stream_unary()(_failing_request_iterator(_requests()))
+        self.assertIs(
+            grpc.StatusCode.UNKNOWN, exception_context.exception.code()
+        )
+
+    def test_invalid_send_window(self):
+        with self.assertRaises(ValueError):
+            grpc.insecure_channel(
+                "localhost:8080",
+                options=((experimental.ChannelOptions.RequestSendWindow, 0),),
+            )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,143 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests client-streaming RPCs whose requests are written by the caller."""
+
+import logging
+import unittest
+from unittest import mock
+
+import grpc
+from grpc import _channel
+from grpc import experimental
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+_STREAM_UNARY_ABORTING = "StreamUnaryAborting"
+
+
+def handle_stream_unary(request_iterator, servicer_context):
+    return b",".join(request_iterator)
+
+
+def handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+def handle_stream_unary_aborting(request_iterator, servicer_context):
+    next(request_iterator)
+    servicer_context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Aborted!")
+
+
+def _requests():
+    return [b"%d" % index for index in range(test_constants.STREAM_LENGTH)]
+
+
+class RequestWritingTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                    handle_stream_unary
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    handle_stream_stream
+                ),
+                _STREAM_UNARY_ABORTING: grpc.stream_unary_rpc_method_handler(
+                    handle_stream_unary_aborting
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            "localhost:%d" % port,
+            options=((experimental.ChannelOptions.RequestSendWindow, 4),),
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _stream_unary(self, method=_STREAM_UNARY):
+        return self._channel.stream_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def _stream_stream(self):
+        return self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+
+    def test_stream_unary(self):
+        requests = _requests()
+        with mock.patch.object(
+            _channel, "_consume_request_iterator"
+        ) as consume_request_iterator:
+            call = self._stream_unary().future()
+        # No thread is started to consume requests.
+        consume_request_iterator.assert_not_called()
+        for request in requests:
+            call.write(request)
+        call.done_writing()
+        self.assertEqual(b",".join(requests), call.result())
+
+    def test_stream_stream(self):
+        call = self._stream_stream()()
+        for request in _requests():
+            call.write(request)
+            self.assertEqual(request, next(call))
+        call.done_writing()
+        with self.assertRaises(StopIteration):
+            next(call)
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def test_write_after_done_writing(self):
+        call = self._stream_stream()()
+        call.done_writing()
+        with self.assertRaises(ValueError):
+            call.write(b"\x07")
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def test_write_after_failure(self):
+        call = self._stream_unary(_STREAM_UNARY_ABORTING).future()
+        call.write(b"\x07")
+        self.assertIs(grpc.StatusCode.FAILED_PRECONDITION, call.code())
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            call.write(b"\x08")
+        self.assertIs(
+            grpc.StatusCode.FAILED_PRECONDITION,
+            exception_context.exception.code(),
+        )
+
+    def test_cancel(self):
+        call = self._stream_stream()()
+        call.write(b"\x07")
+        call.cancel()
+        with self.assertRaises(grpc.RpcError):
+            call.write(b"\x08")
+        self.assertIs(grpc.StatusCode.CANCELLED, call.code())
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
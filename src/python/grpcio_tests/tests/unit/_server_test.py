@@ -14,9 +14,13 @@
 
 from concurrent import futures
 import logging
+import threading
+import time
 import unittest
+from unittest import mock
 
 import grpc
+from grpc import _server
 
 from tests.unit import resources
 from tests.unit import test_common
@@ -114,6 +118,19 @@ class _GenericHandlerWithRegisteredName(grpc.GenericRpcHandler):
             return None
 
 
+class _StaticGenericHandler(grpc.experimental.StaticGenericRpcHandler):
+    def __init__(self, method_handlers):
+        self._method_handlers = method_handlers
+        self.service_count = 0
+
+    def method_handlers(self):
+        return self._method_handlers
+
+    def service(self, handler_call_details):
+        self.service_count += 1
+        return super().service(handler_call_details)
+
+
 _REGISTERED_METHOD_HANDLERS = {
     _UNARY_UNARY_REGISTERED: _MethodHandler(False, False, True),
 }
@@ -160,6 +177,46 @@ class ServerTest(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             server.add_secure_port(bind_address, server_credentials)
 
+    def test_invalid_pending_call_slots(self):
+        for pending_call_slots in (0, True, 1.5):
+            with self.assertRaises(ValueError):
+                grpc.server(
+                    futures.ThreadPoolExecutor(max_workers=5),
+                    options=(
+                        (
+                            grpc.experimental.ServerOptions.PendingCallSlots,
+                            pending_call_slots,
+                        ),
+                    ),
+                )
+
+    def test_invalid_completion_queue_shards(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=5),
+                options=(
+                    (grpc.experimental.ServerOptions.CompletionQueueShards, 0),
+                ),
+            )
+
+    def test_invalid_response_write_window(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=5),
+                options=(
+                    (grpc.experimental.ServerOptions.ResponseWriteWindow, 0),
+                ),
+            )
+
+    def test_invalid_request_prefetch_depth(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=5),
+                options=(
+                    (grpc.experimental.ServerOptions.RequestPrefetchDepth, 0),
+                ),
+            )
+
 
 class ServerHandlerTest(unittest.TestCase):
     def tearDown(self):
@@ -300,6 +357,308 @@ class ServerHandlerTest(unittest.TestCase):
         )(_REQUEST)
         self.assertEqual(_REGISTERED_RESPONSE, registered_response)
 
+    def test_static_generic_handler_not_asked_per_rpc(self):
+        static_handler = _StaticGenericHandler(
+            {_UNARY_UNARY: _MethodHandler(False, False)}
+        )
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((static_handler,))
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+        multi_callable = self._channel.unary_unary(_UNARY_UNARY)
+        for _ in range(3):
+            self.assertEqual(_RESPONSE, multi_callable(_REQUEST))
+        self.assertEqual(0, static_handler.service_count)
+
+        # Follows a handler that is not static, so it is asked per RPC.
+        later_static_handler = _StaticGenericHandler(
+            {_UNARY_STREAM: _MethodHandler(False, True)}
+        )
+        self._server.add_generic_rpc_handlers(
+            (_ActualGenericRpcHandler(), later_static_handler)
+        )
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM)(_REQUEST)
+        self.assertSequenceEqual(
+            [_RESPONSE] * test_constants.STREAM_LENGTH, list(response_iterator)
+        )
+        self.assertEqual(_RESPONSE, multi_callable(_REQUEST))
+        self.assertEqual(0, static_handler.service_count)
+        self.assertEqual(1, later_static_handler.service_count)
+
+    def test_generic_handlers_asked_in_order(self):
+        registered_handler = _MethodHandler(False, False, True)
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers(
+            (
+                _StaticGenericHandler({_UNARY_UNARY: registered_handler}),
+                _GenericHandler(),
+                _StaticGenericHandler(
+                    {_UNARY_STREAM: _MethodHandler(False, False, True)}
+                ),
+            )
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+        self.assertEqual(
+            _REGISTERED_RESPONSE,
+            self._channel.unary_unary(_UNARY_UNARY)(_REQUEST),
+        )
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM)(_REQUEST)
+        self.assertSequenceEqual(
+            [_RESPONSE] * test_constants.STREAM_LENGTH, list(response_iterator)
+        )
+
+    def test_multiple_pending_call_slots(self):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(
+                max_workers=test_constants.THREAD_CONCURRENCY
+            ),
+            options=(
+                ("grpc.so_reuseport", 0),
+                (grpc.experimental.ServerOptions.PendingCallSlots, 4),
+            ),
+        )
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, _REGISTERED_METHOD_HANDLERS
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+        # Four slots for each registered method and four for generic calls.
+        self.assertEqual(
+            4 * (len(_REGISTERED_METHOD_HANDLERS) + 1),
+            len(self._server._state.shards[0].due),
+        )
+
+        generic_multi_callable = self._channel.unary_unary(
+            _UNARY_UNARY,
+            _registered_method=True,
+        )
+        registered_multi_callable = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(
+                _SERVICE_NAME, _UNARY_UNARY_REGISTERED
+            ),
+            _registered_method=True,
+        )
+        generic_futures = [
+            generic_multi_callable.future(_REQUEST)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+        registered_futures = [
+            registered_multi_callable.future(_REQUEST)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+        for response_future in generic_futures:
+            self.assertEqual(_RESPONSE, response_future.result())
+        for response_future in registered_futures:
+            self.assertEqual(_REGISTERED_RESPONSE, response_future.result())
+
+    def test_sharded_completion_queues(self):
+        serving_threads = []
+        shards_with_calls = set()
+        serve = _server._serve
+        process_request_call_event = _server._process_request_call_event
+
+        def recording_serve(state, shard):
+            serving_threads.append(threading.current_thread())
+            serve(state, shard)
+
+        def recording_process_request_call_event(state, shard, event):
+            shards_with_calls.add(shard)
+            return process_request_call_event(state, shard, event)
+
+        with mock.patch.object(
+            _server, "_serve", recording_serve
+        ), mock.patch.object(
+            _server,
+            "_process_request_call_event",
+            recording_process_request_call_event,
+        ):
+            self._server = grpc.server(
+                futures.ThreadPoolExecutor(
+                    max_workers=test_constants.THREAD_CONCURRENCY
+                ),
+                options=(
+                    ("grpc.so_reuseport", 0),
+                    (grpc.experimental.ServerOptions.CompletionQueueShards, 4),
+                    (grpc.experimental.ServerOptions.PendingCallSlots, 2),
+                ),
+            )
+            self._server.add_generic_rpc_handlers((_GenericHandler(),))
+            self._server.add_registered_method_handlers(
+                _SERVICE_NAME, _REGISTERED_METHOD_HANDLERS
+            )
+            port = self._server.add_insecure_port("[::]:0")
+            self._server.start()
+            self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+            unary_unary_futures = [
+                self._channel.unary_unary(
+                    _UNARY_UNARY,
+                    _registered_method=True,
+                ).future(_REQUEST)
+                for _ in range(test_constants.THREAD_CONCURRENCY)
+            ]
+            response_iterators = [
+                self._channel.stream_stream(
+                    _STREAM_STREAM,
+                    _registered_method=True,
+                )(iter([_REQUEST] * test_constants.STREAM_LENGTH))
+                for _ in range(test_constants.THREAD_CONCURRENCY)
+            ]
+            registered_response = self._channel.unary_unary(
+                grpc._common.fully_qualified_method(
+                    _SERVICE_NAME, _UNARY_UNARY_REGISTERED
+                ),
+                _registered_method=True,
+            )(_REQUEST)
+
+            self.assertEqual(_REGISTERED_RESPONSE, registered_response)
+            for response_future in unary_unary_futures:
+                self.assertEqual(_RESPONSE, response_future.result())
+            for response_iterator in response_iterators:
+                self.assertSequenceEqual(
+                    [_RESPONSE] * test_constants.STREAM_LENGTH,
+                    list(response_iterator),
+                )
+            self.assertEqual(4, len(serving_threads))
+            self.assertGreater(len(shards_with_calls), 1)
+
+            shutdown_event = self._server.stop(None)
+            self.assertTrue(shutdown_event.wait(test_constants.SHORT_TIMEOUT))
+        # Every serving thread is woken up by stop rather than by the timeout
+        # of its next poll.
+        for serving_thread in serving_threads:
+            serving_thread.join(_server._DEALLOCATED_SERVER_CHECK_PERIOD_S / 2)
+            self.assertFalse(serving_thread.is_alive())
+
+    def test_response_write_window(self):
+        responses = [
+            b"%d" % index for index in range(test_constants.STREAM_LENGTH)
+        ]
+        responses_written = threading.Event()
+
+        def handle_numbered_unary_stream(request, servicer_context):
+            for response in responses:
+                yield response
+            responses_written.set()
+
+        def handle_windowed_stream_stream(request_iterator, servicer_context):
+            for index, _ in enumerate(request_iterator):
+                yield responses[index]
+
+        handle_windowed_stream_stream.experimental_write_window = 2
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(
+                max_workers=test_constants.THREAD_CONCURRENCY
+            ),
+            options=(
+                ("grpc.so_reuseport", 0),
+                (grpc.experimental.ServerOptions.ResponseWriteWindow, 8),
+            ),
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                    handle_numbered_unary_stream
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    handle_windowed_stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+        unary_stream = self._channel.unary_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_STREAM),
+            _registered_method=True,
+        )
+        stream_stream = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+        response_iterator = unary_stream(_REQUEST)
+        self.assertSequenceEqual(responses, list(response_iterator))
+        self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+        self.assertSequenceEqual(
+            responses,
+            list(stream_stream(iter([_REQUEST] * len(responses)))),
+        )
+
+        # A cancelled RPC discards the responses left in its window.
+        responses_written.clear()
+        response_iterator = unary_stream(_REQUEST)
+        self.assertEqual(responses[0], next(response_iterator))
+        response_iterator.cancel()
+        self.assertIs(grpc.StatusCode.CANCELLED, response_iterator.code())
+        self.assertFalse(responses_written.wait(test_constants.SHORT_TIMEOUT))
+
+    def test_request_prefetch_depth(self):
+        requests = [
+            b"%d" % index for index in range(test_constants.STREAM_LENGTH)
+        ]
+        prefetched = threading.Event()
+
+        def handle_joining_stream_unary(request_iterator, servicer_context):
+            # The requests are received before the handler asks for them.
+            while len(request_iterator._prefetched_requests) < 3:
+                time.sleep(0.01)
+            prefetched.set()
+            return b",".join(request_iterator)
+
+        def handle_prefetching_stream_stream(
+            request_iterator, servicer_context
+        ):
+            for request in request_iterator:
+                yield request
+
+        handle_prefetching_stream_stream.experimental_prefetch_depth = 2
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(
+                max_workers=test_constants.THREAD_CONCURRENCY
+            ),
+            options=(
+                ("grpc.so_reuseport", 0),
+                (grpc.experimental.ServerOptions.RequestPrefetchDepth, 4),
+            ),
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                    handle_joining_stream_unary
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    handle_prefetching_stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+        stream_unary = self._channel.stream_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_UNARY),
+            _registered_method=True,
+        )
+        stream_stream = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+        self.assertEqual(b"0,1,2", stream_unary(iter(requests[:3])))
+        self.assertTrue(prefetched.is_set())
+        self.assertEqual(b",".join(requests), stream_unary(iter(requests)))
+        self.assertSequenceEqual(requests, list(stream_stream(iter(requests))))
+
 
 if __name__ == "__main__":
     logging.basicConfig()
@@ -0,0 +1,148 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests channels sharing a pool of spin threads."""
+
+import logging
+import threading
+import unittest
+
+import grpc
+from grpc import experimental
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_STREAM_STREAM = "StreamStream"
+
+_NUM_CHANNELS = 8
+_NUM_SPIN_THREADS = 2
+_REQUEST = b"\x07\x08"
+
+
+def handle_unary_unary(request, servicer_context):
+    return request
+
+
+def handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class SharedSpinThreadsTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    handle_unary_unary
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    handle_stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._target = "localhost:%d" % port
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def _channel(self, spin_threads=_NUM_SPIN_THREADS):
+        return grpc.insecure_channel(
+            self._target,
+            options=(
+                (experimental.ChannelOptions.SharedSpinThreads, spin_threads),
+            ),
+        )
+
+    def _unary_unary(self, channel):
+        return channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            _registered_method=True,
+        )
+
+    def _stream_stream(self, channel):
+        return channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+
+    def test_calls_across_channels(self):
+        channels = [self._channel() for _ in range(_NUM_CHANNELS)]
+        # Warms up the pool so that all of its threads are running.
+        for channel in channels:
+            self.assertEqual(
+                _REQUEST, self._unary_unary(channel).future(_REQUEST).result()
+            )
+        thread_count = threading.active_count()
+
+        futures = [
+            self._unary_unary(channel).future(_REQUEST)
+            for channel in channels
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+        response_iterators = [
+            self._stream_stream(channel)(iter([_REQUEST] * 4))
+            for channel in channels
+        ]
+
+        for future in futures:
+            self.assertEqual(_REQUEST, future.result())
+        for response_iterator in response_iterators:
+            self.assertSequenceEqual([_REQUEST] * 4, list(response_iterator))
+        # No thread is started per channel.
+        self.assertLessEqual(threading.active_count(), thread_count)
+        for channel in channels:
+            channel.close()
+
+    def test_close_with_call_in_flight(self):
+        channel = self._channel()
+        other_channel = self._channel()
+        requests_released = threading.Event()
+
+        def request_iterator():
+            yield _REQUEST
+            requests_released.wait()
+
+        response_iterator = self._stream_stream(channel)(request_iterator())
+        self.assertEqual(_REQUEST, next(response_iterator))
+
+        channel.close()
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            next(response_iterator)
+        self.assertIs(
+            grpc.StatusCode.CANCELLED, exception_context.exception.code()
+        )
+        # The other channels of the pool are not affected.
+        self.assertEqual(
+            _REQUEST,
+            self._unary_unary(other_channel).future(_REQUEST).result(),
+        )
+        other_channel.close()
+        requests_released.set()
+
+    def test_invalid_spin_threads(self):
+        for spin_threads in (0, True, 1.5):
+            with self.assertRaises(ValueError):
+                self._channel(spin_threads)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,161 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests deserializers that receive messages as memoryviews."""
+
+import logging
+import threading
+import unittest
+
+import grpc
+from grpc import experimental
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SMALL_MESSAGE = b"\x07" * 16
+# Large enough to be received in several slices.
+_LARGE_MESSAGE = bytes(range(256)) * 4096
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_STREAM_STREAM = "StreamStream"
+
+
+class _RecordingDeserializer(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.message_types = []
+
+    def __call__(self, message):
+        with self._lock:
+            self.message_types.append(type(message))
+        if isinstance(message, memoryview):
+            if not message.readonly:
+                raise ValueError("Received a writable memoryview!")
+            return message.tobytes()
+        return message
+
+
+def handle_unary_unary(request, servicer_context):
+    return request
+
+
+def handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class ZeroCopyDeserializerTest(unittest.TestCase):
+    def setUp(self):
+        self._request_deserializer = _RecordingDeserializer()
+        zero_copy_request_deserializer = experimental.zero_copy_deserializer(
+            self._request_deserializer
+        )
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    handle_unary_unary,
+                    request_deserializer=zero_copy_request_deserializer,
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    handle_stream_stream,
+                    request_deserializer=zero_copy_request_deserializer,
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(0)
+        self._channel.close()
+
+    def _unary_unary(self, response_deserializer):
+        return self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            response_deserializer=response_deserializer,
+            _registered_method=True,
+        )
+
+    def _assert_received_memoryviews(self, deserializer, count):
+        self.assertSequenceEqual(
+            [memoryview] * count, deserializer.message_types
+        )
+
+    def testSmallMessage(self):
+        response_deserializer = _RecordingDeserializer()
+        response = self._unary_unary(
+            experimental.zero_copy_deserializer(response_deserializer)
+        )(_SMALL_MESSAGE)
+        self.assertEqual(_SMALL_MESSAGE, response)
+        self._assert_received_memoryviews(self._request_deserializer, 1)
+        self._assert_received_memoryviews(response_deserializer, 1)
+
+    def testLargeMessage(self):
+        response_deserializer = _RecordingDeserializer()
+        response = self._unary_unary(
+            experimental.zero_copy_deserializer(response_deserializer)
+        )(_LARGE_MESSAGE)
+        self.assertEqual(_LARGE_MESSAGE, response)
+        self._assert_received_memoryviews(self._request_deserializer, 1)
+        self._assert_received_memoryviews(response_deserializer, 1)
+
+    def testCompressedLargeMessage(self):
+        response_deserializer = _RecordingDeserializer()
+        response = self._unary_unary(
+            experimental.zero_copy_deserializer(response_deserializer)
+        )(_LARGE_MESSAGE, compression=grpc.Compression.Gzip)
+        self.assertEqual(_LARGE_MESSAGE, response)
+        self._assert_received_memoryviews(self._request_deserializer, 1)
+        self._assert_received_memoryviews(response_deserializer, 1)
+
+    def testEmptyMessage(self):
+        response_deserializer = _RecordingDeserializer()
+        response = self._unary_unary(
+            experimental.zero_copy_deserializer(response_deserializer)
+        )(b"")
+        self.assertEqual(b"", response)
+        self._assert_received_memoryviews(response_deserializer, 1)
+
+    def testUnmarkedDeserializerReceivesBytes(self):
+        response_deserializer = _RecordingDeserializer()
+        response = self._unary_unary(response_deserializer)(_LARGE_MESSAGE)
+        self.assertEqual(_LARGE_MESSAGE, response)
+        self.assertSequenceEqual([bytes], response_deserializer.message_types)
+
+    def testStreamStream(self):
+        requests = [_LARGE_MESSAGE, _SMALL_MESSAGE] * (
+            test_constants.STREAM_LENGTH // 32
+        )
+        response_deserializer = _RecordingDeserializer()
+        response_iterator = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            response_deserializer=experimental.zero_copy_deserializer(
+                response_deserializer
+            ),
+            _registered_method=True,
+        )(iter(requests))
+        self.assertSequenceEqual(requests, list(response_iterator))
+        self._assert_received_memoryviews(
+            self._request_deserializer, len(requests)
+        )
+        self._assert_received_memoryviews(response_deserializer, len(requests))
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the metadata abstraction that's used in the asynchronous driver."""
+
 import logging
 import unittest
 
@@ -149,6 +150,16 @@ class TestTypeMetadata(unittest.TestCase):
 
         self.assertEqual(metadata, metadata2)
         self.assertNotEqual(metadata, "foo")
+        self.assertNotEqual(
+            Metadata(("a", "1"), ("b", "2")), Metadata(("b", "2"), ("a", "1"))
+        )
+        self.assertNotEqual(
+            Metadata(("a", "1"), ("a", "2")), Metadata(("a", "2"), ("a", "1"))
+        )
+        self.assertEqual(
+            Metadata(("a", "1"), ("b", "2"), ("a", "3")),
+            Metadata(("a", "1"), ("a", "3"), ("b", "2")),
+        )
 
     def test_repr(self):
         metadata = Metadata(*self._DEFAULT_DATA)
@@ -194,6 +205,11 @@ class TestTypeMetadata(unittest.TestCase):
         with self.assertRaises(KeyError):
             del metadata["other key"]
 
+        metadata = Metadata(*self._DEFAULT_DATA)
+        del metadata["key1"]
+        self.assertNotIn("key1", metadata)
+        self.assertEqual(Metadata(("key2", "value2")), metadata)
+
     def test_metadata_from_tuple(self):
         scenarios = (
             (None, Metadata()),
@@ -206,6 +222,27 @@ class TestTypeMetadata(unittest.TestCase):
             with self.subTest(raw_metadata=source, expected=expected):
                 self.assertEqual(expected, Metadata.from_tuple(source))
 
+    def test_copy_is_independent_of_original(self):
+        metadata = Metadata(*self._MULTI_ENTRY_DATA)
+        copied_metadata = Metadata.from_tuple(metadata)
+        self.assertEqual(metadata, copied_metadata)
+
+        copied_metadata.add("key3", "value3")
+        copied_metadata["key1"] = "override value"
+        self.assertEqual(Metadata(*self._MULTI_ENTRY_DATA), metadata)
+        self.assertEqual(
+            copied_metadata.get_all("key1"),
+            ["override value", "other value 1"],
+        )
+        self.assertEqual(copied_metadata["key3"], "value3")
+        self.assertNotIn("key3", metadata)
+
+    def test_entries_kept_in_order(self):
+        metadata = Metadata(*self._MULTI_ENTRY_DATA)
+        self.assertEqual(self._MULTI_ENTRY_DATA, tuple(metadata))
+        for entry, original_entry in zip(metadata, self._MULTI_ENTRY_DATA):
+            self.assertIs(original_entry, entry)
+
 
 class TestMetadataWithServer(AioTestBase):
     async def setUp(self):
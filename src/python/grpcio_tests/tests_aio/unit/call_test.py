@@ -210,6 +210,56 @@ class TestUnaryUnaryCall(_MulticallableTestMixin, AioTestBase):
         with self.assertRaises(asyncio.CancelledError):
             await task
 
+    async def test_awaited_call_runs_without_task(self):
+        call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+
+        response = await call
+
+        self.assertIsInstance(response, messages_pb2.SimpleResponse)
+        self.assertIsNone(call._call_response)
+        await asyncio.sleep(0)
+        self.assertIsNone(call._call_response)
+
+    async def test_call_not_awaited_completes(self):
+        call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+        done = asyncio.Event()
+        call.add_done_callback(lambda unused_call: done.set())
+
+        await done.wait()
+
+        self.assertTrue(call.done())
+        self.assertIsInstance(await call, messages_pb2.SimpleResponse)
+
+    async def test_call_multiple_awaiters(self):
+        call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+
+        async def coro():
+            return await call
+
+        responses = await asyncio.gather(coro(), coro(), coro())
+
+        self.assertIsInstance(responses[0], messages_pb2.SimpleResponse)
+        self.assertIs(responses[0], responses[1])
+        self.assertIs(responses[0], responses[2])
+
+    async def test_cancel_call_with_multiple_awaiters(self):
+        call = self._stub.EmptyCall(messages_pb2.SimpleRequest())
+
+        async def coro():
+            await call
+
+        task1 = self.loop.create_task(coro())
+        task2 = self.loop.create_task(coro())
+        await asyncio.sleep(0)
+
+        self.assertTrue(call.cancel())
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task1
+        with self.assertRaises(asyncio.CancelledError):
+            await task2
+        self.assertEqual(grpc.StatusCode.CANCELLED, await call.code())
+
     async def test_passing_credentials_fails_over_insecure_channel(self):
         call_credentials = grpc.composite_call_credentials(
             grpc.access_token_call_credentials("abc"),
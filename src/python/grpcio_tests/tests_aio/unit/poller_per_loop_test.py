@@ -0,0 +1,163 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the AsyncIO stack with a completion queue per event loop."""
+
+import logging
+import os
+import subprocess
+import sys
+import unittest
+
+_INTERPRETER = sys.executable
+
+# The engine is picked when cygrpc is imported, so the scenario runs in a
+# separate interpreter.
+_MULTIPLE_LOOPS_SCRIPT = """if True:
+    import asyncio
+
+    import grpc
+    from grpc.experimental import aio
+
+    _NUM_LOOPS = 4
+    _NUM_RPCS = 16
+
+    async def _echo(request, unused_context):
+        return request
+
+    class _GenericHandler(grpc.GenericRpcHandler):
+        def service(self, unused_handler_call_details):
+            return grpc.unary_unary_rpc_method_handler(_echo)
+
+    async def _call(address, index):
+        async with aio.insecure_channel(address) as channel:
+            echo = channel.unary_unary("/test/Echo")
+            for rpc in range(_NUM_RPCS):
+                request = b"%d:%d" % (index, rpc)
+                response = await echo(request)
+                if response != request:
+                    raise Exception("unexpected response %r" % response)
+
+    async def main():
+        server = aio.server()
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = server.add_insecure_port("[::]:0")
+        await server.start()
+        address = "localhost:%d" % port
+
+        # Every other client runs in a thread with an event loop of its own.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            _call(address, 0),
+            *(
+                loop.run_in_executor(None, asyncio.run, _call(address, index))
+                for index in range(1, _NUM_LOOPS)
+            )
+        )
+        await server.stop(None)
+
+    asyncio.run(main())
+    # Loops can come and go while the module stays initialized.
+    asyncio.run(main())
+"""
+
+_SHORT_LIVED_LOOPS_SCRIPT = """if True:
+    import asyncio
+    from concurrent import futures
+    import gc
+    import threading
+    import weakref
+
+    import grpc
+    from grpc.experimental import aio
+
+    _NUM_LOOPS = 8
+    _REQUEST = b"\\x07"
+
+    async def _echo(request, unused_context):
+        return request
+
+    class _GenericHandler(grpc.GenericRpcHandler):
+        def service(self, unused_handler_call_details):
+            return grpc.unary_unary_rpc_method_handler(_echo)
+
+    async def _call(address, loops):
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+        async with aio.insecure_channel(address) as channel:
+            echo = channel.unary_unary("/test/Echo")
+            if await echo(_REQUEST) != _REQUEST:
+                raise Exception("unexpected response")
+
+    async def main():
+        # The server keeps the module initialized while loops of other
+        # threads come and go.
+        server = aio.server()
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = server.add_insecure_port("[::]:0")
+        await server.start()
+        address = "localhost:%d" % port
+
+        loop = asyncio.get_running_loop()
+        loops = []
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            await loop.run_in_executor(
+                executor, asyncio.run, _call(address, loops)
+            )
+            gc.collect()
+            thread_count = threading.active_count()
+            for _ in range(_NUM_LOOPS):
+                await loop.run_in_executor(
+                    executor, asyncio.run, _call(address, loops)
+                )
+            gc.collect()
+            if threading.active_count() > thread_count:
+                raise Exception("poller threads of closed loops leaked")
+        if any(closed_loop() is not None for closed_loop in loops):
+            raise Exception("closed loops were kept alive")
+        await server.stop(None)
+
+    asyncio.run(main())
+"""
+
+
+class TestPollerPerLoop(unittest.TestCase):
+    def _verify_script_succeeds(self, script, engine):
+        process = subprocess.Popen(
+            [_INTERPRETER, "-c", script],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=dict(os.environ, GRPC_ASYNCIO_ENGINE=engine),
+        )
+        out, err = process.communicate()
+        self.assertEqual(
+            0,
+            process.returncode,
+            "process failed with exit code %d (stdout: %s, stderr: %s)"
+            % (process.returncode, out, err),
+        )
+
+    def test_multiple_loops(self):
+        self._verify_script_succeeds(_MULTIPLE_LOOPS_SCRIPT, "poller_per_loop")
+
+    def test_short_lived_loops(self):
+        self._verify_script_succeeds(
+            _SHORT_LIVED_LOOPS_SCRIPT, "poller_per_loop"
+        )
+
+    def test_multiple_loops_shared_poller(self):
+        self._verify_script_succeeds(_MULTIPLE_LOOPS_SCRIPT, "poller")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
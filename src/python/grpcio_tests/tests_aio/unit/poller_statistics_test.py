@@ -0,0 +1,77 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the counters of the AsyncIO poller."""
+
+import asyncio
+import logging
+import time
+import unittest
+
+import grpc
+from grpc._cython import cygrpc
+from grpc.experimental import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_NUM_CONCURRENT_RPCS = 64
+_BURST_DURATION_S = 0.5
+
+
+async def _echo(request, unused_context):
+    return request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+    def service(self, unused_handler_call_details):
+        return grpc.unary_unary_rpc_method_handler(_echo)
+
+
+class TestPollerStatistics(AioTestBase):
+    async def setUp(self):
+        self._server = aio.server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port("[::]:0")
+        await self._server.start()
+        self._channel = aio.insecure_channel("localhost:%d" % port)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_counters(self):
+        echo = self._channel.unary_unary("/test/Echo")
+        before = cygrpc.aio_poller_statistics()
+
+        rpcs = asyncio.gather(
+            *(echo(b"%d" % index) for index in range(_NUM_CONCURRENT_RPCS))
+        )
+        # Blocks the loop once the RPCs started, so that their events pile up
+        # behind a single wakeup.
+        asyncio.get_running_loop().call_soon(time.sleep, _BURST_DURATION_S)
+        await rpcs
+
+        after = cygrpc.aio_poller_statistics()
+        events = after["events"] - before["events"]
+        wakeups = after["wakeups"] - before["wakeups"]
+        drains = after["drains"] - before["drains"]
+        # Each RPC completes at least one batch on each side.
+        self.assertGreaterEqual(events, 2 * _NUM_CONCURRENT_RPCS)
+        self.assertGreater(wakeups, 0)
+        self.assertLess(wakeups, events)
+        self.assertGreater(drains, 0)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -52,6 +52,12 @@ class _LoggingInterceptor(aio.ServerInterceptor):
         return await continuation(handler_call_details)
 
 
+class _CacheableLoggingInterceptor(
+    _LoggingInterceptor, grpc.experimental.CacheableServerInterceptor
+):
+    pass
+
+
 class _ContextVarSettingInterceptor(aio.ServerInterceptor):
     def __init__(self, value: str) -> None:
         self.value = value
@@ -215,6 +221,38 @@ class TestServerInterceptor(AioTestBase):
             )
             self.assertIsInstance(response, messages_pb2.SimpleResponse)
 
+    async def test_cacheable_interceptors_run_once_per_method(self):
+        record = []
+        server_target, _ = await start_test_server(
+            record=record,
+            interceptors=(
+                _CacheableLoggingInterceptor("log1", record),
+                _CacheableLoggingInterceptor("log2", record),
+            ),
+        )
+
+        async with aio.insecure_channel(server_target) as channel:
+            multicallable = channel.unary_unary(
+                "/grpc.testing.TestService/UnaryCall",
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString,
+                _registered_method=True,
+            )
+            for _ in range(3):
+                response = await multicallable(messages_pb2.SimpleRequest())
+                self.assertIsInstance(response, messages_pb2.SimpleResponse)
+
+        self.assertSequenceEqual(
+            [
+                "log1:intercept_service",
+                "log2:intercept_service",
+                "servicer:service",
+                "servicer:service",
+                "servicer:service",
+            ],
+            record,
+        )
+
     async def test_unique_context_per_call(self):
         record = []
         server, stub = await _create_server_stub_pair(
@@ -14,6 +14,7 @@
 
 import asyncio
 import logging
+import threading
 import time
 import unittest
 
@@ -43,8 +44,13 @@ _ERROR_WITHOUT_RAISE_IN_UNARY_UNARY = "/test/ErrorWithoutRaiseInUnaryUnary"
 _ERROR_WITHOUT_RAISE_IN_STREAM_STREAM = "/test/ErrorWithoutRaiseInStreamStream"
 _INVALID_TRAILING_METADATA = "/test/InvalidTrailingMetadata"
 
+_REGISTERED_SERVICE = "test.RegisteredService"
+_REGISTERED_UNARY_UNARY = "UnaryUnary"
+_REGISTERED_STREAM_STREAM = "StreamStream"
+
 _REQUEST = b"\x00\x00\x00"
 _RESPONSE = b"\x01\x01\x01"
+_REGISTERED_RESPONSE = b"\x02\x02\x02"
 _NUM_STREAM_REQUESTS = 3
 _NUM_STREAM_RESPONSES = 5
 _MAXIMUM_CONCURRENT_RPCS = 5
@@ -615,6 +621,281 @@ class TestServer(AioTestBase):
         await channel.close()
         await server.stop(0)
 
+    async def test_pending_call_slots(self):
+        server = aio.server(
+            options=((grpc.experimental.ServerOptions.PendingCallSlots, 4),)
+        )
+        port = server.add_insecure_port("[::]:0")
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        server.add_registered_method_handlers(
+            _REGISTERED_SERVICE, _REGISTERED_METHOD_HANDLERS
+        )
+        await server.start()
+        # Four accept tasks for each registered method and four for the rest.
+        accept_tasks = [
+            task
+            for task in asyncio.all_tasks()
+            if task.get_name() == "accept_calls"
+        ]
+        self.assertEqual(
+            4 * (len(_REGISTERED_METHOD_HANDLERS) + 1), len(accept_tasks)
+        )
+
+        async with aio.insecure_channel("localhost:%d" % port) as channel:
+            responses = await asyncio.gather(
+                *(
+                    channel.unary_unary(_SIMPLE_UNARY_UNARY)(_REQUEST)
+                    for _ in range(3 * 4)
+                )
+            )
+            self.assertEqual([_RESPONSE] * 3 * 4, responses)
+        await server.stop(None)
+        for accept_task in accept_tasks:
+            self.assertTrue(accept_task.done())
+
+    async def test_invalid_pending_call_slots(self):
+        for pending_call_slots in (0, True, "4"):
+            with self.assertRaises(ValueError):
+                aio.server(
+                    options=(
+                        (
+                            grpc.experimental.ServerOptions.PendingCallSlots,
+                            pending_call_slots,
+                        ),
+                    )
+                )
+
+    async def test_request_prefetch_depth(self):
+        requests = [b"%d" % index for index in range(_NUM_STREAM_RESPONSES)]
+
+        async def async_stream_unary(request_iterator, unused_context):
+            return b",".join([request async for request in request_iterator])
+
+        def sync_stream_unary(request_iterator, unused_context):
+            return b",".join(request_iterator)
+
+        async def stream_stream(request_iterator, unused_context):
+            async for request in request_iterator:
+                yield request
+
+        stream_stream.experimental_prefetch_depth = 2
+        server = aio.server(
+            options=((grpc.experimental.ServerOptions.RequestPrefetchDepth, 4),)
+        )
+        port = server.add_insecure_port("[::]:0")
+        server.add_registered_method_handlers(
+            _REGISTERED_SERVICE,
+            {
+                "AsyncStreamUnary": grpc.stream_unary_rpc_method_handler(
+                    async_stream_unary
+                ),
+                "SyncStreamUnary": grpc.stream_unary_rpc_method_handler(
+                    sync_stream_unary
+                ),
+                "StreamStream": grpc.stream_stream_rpc_method_handler(
+                    stream_stream
+                ),
+            },
+        )
+        await server.start()
+
+        async with aio.insecure_channel("localhost:%d" % port) as channel:
+            for method in ("AsyncStreamUnary", "SyncStreamUnary"):
+                response = await channel.stream_unary(
+                    f"/{_REGISTERED_SERVICE}/{method}"
+                )(iter(requests))
+                self.assertEqual(b",".join(requests), response)
+            call = channel.stream_stream(
+                f"/{_REGISTERED_SERVICE}/StreamStream"
+            )(iter(requests))
+            self.assertEqual(requests, [response async for response in call])
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+        await server.stop(None)
+
+    async def test_invalid_request_prefetch_depth(self):
+        with self.assertRaises(ValueError):
+            aio.server(
+                options=(
+                    (grpc.experimental.ServerOptions.RequestPrefetchDepth, 0),
+                )
+            )
+
+    async def test_response_write_window(self):
+        responses = [b"%d" % index for index in range(_NUM_STREAM_RESPONSES)]
+
+        def unary_stream(unused_request, unused_context):
+            for response in responses:
+                yield response
+
+        def windowed_unary_stream(unused_request, unused_context):
+            for response in responses:
+                yield response
+
+        def failing_unary_stream(unused_request, unused_context):
+            for response in responses:
+                yield response
+            raise ValueError("No more responses!")
+
+        windowed_unary_stream.experimental_write_window = 3
+        server = aio.server(
+            options=((grpc.experimental.ServerOptions.ResponseWriteWindow, 16),)
+        )
+        port = server.add_insecure_port("[::]:0")
+        server.add_registered_method_handlers(
+            _REGISTERED_SERVICE,
+            {
+                "UnaryStream": grpc.unary_stream_rpc_method_handler(
+                    unary_stream
+                ),
+                "WindowedUnaryStream": grpc.unary_stream_rpc_method_handler(
+                    windowed_unary_stream
+                ),
+                "FailingUnaryStream": grpc.unary_stream_rpc_method_handler(
+                    failing_unary_stream
+                ),
+            },
+        )
+        await server.start()
+
+        async with aio.insecure_channel("localhost:%d" % port) as channel:
+            for method in ("UnaryStream", "WindowedUnaryStream"):
+                call = channel.unary_stream(f"/{_REGISTERED_SERVICE}/{method}")(
+                    _REQUEST
+                )
+                self.assertEqual(
+                    responses, [response async for response in call]
+                )
+                self.assertEqual(grpc.StatusCode.OK, await call.code())
+            call = channel.unary_stream(
+                f"/{_REGISTERED_SERVICE}/FailingUnaryStream"
+            )(_REQUEST)
+            with self.assertRaises(aio.AioRpcError) as exception_context:
+                async for _ in call:
+                    pass
+            self.assertEqual(
+                grpc.StatusCode.UNKNOWN, exception_context.exception.code()
+            )
+        await server.stop(None)
+
+    async def test_invalid_response_write_window(self):
+        with self.assertRaises(ValueError):
+            aio.server(
+                options=(
+                    (grpc.experimental.ServerOptions.ResponseWriteWindow, 0),
+                )
+            )
+
+    async def test_concurrency_limiter(self):
+        limiter = grpc.experimental.AimdConcurrencyLimiter(
+            initial_limit=_MAXIMUM_CONCURRENT_RPCS,
+            max_limit=_MAXIMUM_CONCURRENT_RPCS,
+        )
+        server = aio.server(
+            options=(
+                (grpc.experimental.ServerOptions.ConcurrencyLimiter, limiter),
+            )
+        )
+        port = server.add_insecure_port("localhost:0")
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+
+        async with aio.insecure_channel("localhost:%d" % port) as channel:
+            multicallable = channel.unary_unary(_BLOCK_BRIEFLY)
+            results = await asyncio.gather(
+                *(
+                    multicallable(_REQUEST)
+                    for _ in range(3 * _MAXIMUM_CONCURRENT_RPCS)
+                ),
+                return_exceptions=True,
+            )
+        exceptions = [
+            result for result in results if isinstance(result, Exception)
+        ]
+        self.assertTrue(exceptions)
+        for exception in exceptions:
+            self.assertIsInstance(exception, aio.AioRpcError)
+            self.assertEqual(
+                grpc.StatusCode.RESOURCE_EXHAUSTED, exception.code()
+            )
+        self.assertEqual(len(exceptions), limiter.rejected_count)
+        await server.stop(None)
+
+    async def test_concurrency_limiter_skips_unhandled_rpcs(self):
+        limiter = grpc.experimental.AimdConcurrencyLimiter(
+            initial_limit=1, max_limit=_MAXIMUM_CONCURRENT_RPCS
+        )
+        server = aio.server(
+            options=(
+                (grpc.experimental.ServerOptions.ConcurrencyLimiter, limiter),
+            )
+        )
+        port = server.add_insecure_port("localhost:0")
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+
+        async with aio.insecure_channel("localhost:%d" % port) as channel:
+            multicallable = channel.unary_unary(_UNIMPLEMENTED_METHOD)
+            for _ in range(3):
+                with self.assertRaises(aio.AioRpcError) as exception_context:
+                    await multicallable(_REQUEST)
+                self.assertEqual(
+                    grpc.StatusCode.UNIMPLEMENTED,
+                    exception_context.exception.code(),
+                )
+        self.assertEqual(1, limiter.limit)
+        self.assertEqual(0, limiter.in_flight)
+        await server.stop(None)
+
+    async def test_invalid_concurrency_limiter(self):
+        with self.assertRaises(ValueError):
+            aio.server(
+                options=(
+                    (grpc.experimental.ServerOptions.ConcurrencyLimiter, 1),
+                )
+            )
+
+    async def test_expired_rpc_not_handled(self):
+        handler_started = threading.Event()
+        handled_requests = []
+
+        async def block_loop(request, unused_context):
+            handled_requests.append(request)
+            handler_started.set()
+            # Keeps the server from scheduling any other RPC meanwhile.
+            time.sleep(test_constants.SHORT_TIMEOUT / 4)
+            return request
+
+        server = aio.server()
+        port = server.add_insecure_port("[::]:0")
+        server.add_registered_method_handlers(
+            _REGISTERED_SERVICE,
+            {"BlockLoop": grpc.unary_unary_rpc_method_handler(block_loop)},
+        )
+        await server.start()
+
+        def call_while_blocked():
+            with grpc.insecure_channel("localhost:%d" % port) as channel:
+                multicallable = channel.unary_unary(
+                    f"/{_REGISTERED_SERVICE}/BlockLoop"
+                )
+                blocking_call = multicallable.future(b"\x01")
+                handler_started.wait(test_constants.SHORT_TIMEOUT)
+                with self.assertRaises(grpc.RpcError) as exception_context:
+                    multicallable(
+                        b"\x02", timeout=test_constants.SHORT_TIMEOUT / 20
+                    )
+                self.assertIs(
+                    grpc.StatusCode.DEADLINE_EXCEEDED,
+                    exception_context.exception.code(),
+                )
+                self.assertEqual(b"\x01", blocking_call.result())
+
+        await asyncio.get_running_loop().run_in_executor(
+            None, call_while_blocked
+        )
+        self.assertEqual([b"\x01"], handled_requests)
+        await server.stop(None)
+
     async def test_invalid_trailing_metadata(self):
         call = self._channel.unary_unary(_INVALID_TRAILING_METADATA)(_REQUEST)
 
@@ -626,6 +907,104 @@ class TestServer(AioTestBase):
         self.assertIn("trailing", rpc_error.details())
 
 
+async def _registered_unary_unary(unused_request, unused_context):
+    return _REGISTERED_RESPONSE
+
+
+async def _registered_stream_stream(request_iterator, unused_context):
+    async for unused_request in request_iterator:
+        yield _REGISTERED_RESPONSE
+
+
+_REGISTERED_METHOD_HANDLERS = {
+    _REGISTERED_UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+        _registered_unary_unary
+    ),
+    _REGISTERED_STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+        _registered_stream_stream
+    ),
+}
+
+
+class _RecordingInterceptor(aio.ServerInterceptor):
+    def __init__(self):
+        self.methods = []
+
+    async def intercept_service(self, continuation, handler_call_details):
+        self.methods.append(handler_call_details.method)
+        return await continuation(handler_call_details)
+
+
+class TestServerRegisteredMethods(AioTestBase):
+    async def _start_server(self, interceptors=None):
+        self._server = aio.server(interceptors=interceptors)
+        port = self._server.add_insecure_port("[::]:0")
+        self._generic_handler = _GenericHandler()
+        self._server.add_generic_rpc_handlers((self._generic_handler,))
+        self._server.add_registered_method_handlers(
+            _REGISTERED_SERVICE, _REGISTERED_METHOD_HANDLERS
+        )
+        await self._server.start()
+        self._channel = aio.insecure_channel("localhost:%d" % port)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    def _registered_method(self, method):
+        return grpc._common.fully_qualified_method(_REGISTERED_SERVICE, method)
+
+    async def test_registered_unary_unary(self):
+        await self._start_server()
+        response = await self._channel.unary_unary(
+            self._registered_method(_REGISTERED_UNARY_UNARY)
+        )(_REQUEST)
+        self.assertEqual(_REGISTERED_RESPONSE, response)
+        # The generic handlers were not consulted.
+        self.assertFalse(self._generic_handler._called.done())
+
+    async def test_registered_stream_stream(self):
+        await self._start_server()
+        call = self._channel.stream_stream(
+            self._registered_method(_REGISTERED_STREAM_STREAM)
+        )()
+        for _ in range(_NUM_STREAM_REQUESTS):
+            await call.write(_REQUEST)
+            self.assertEqual(_REGISTERED_RESPONSE, await call.read())
+        await call.done_writing()
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_generic_method_alongside_registered_methods(self):
+        await self._start_server()
+        response = await self._channel.unary_unary(_SIMPLE_UNARY_UNARY)(
+            _REQUEST
+        )
+        self.assertEqual(_RESPONSE, response)
+
+    async def test_interceptors_see_registered_methods(self):
+        interceptor = _RecordingInterceptor()
+        await self._start_server(interceptors=(interceptor,))
+        method = self._registered_method(_REGISTERED_UNARY_UNARY)
+        response = await self._channel.unary_unary(method)(_REQUEST)
+        self.assertEqual(_REGISTERED_RESPONSE, response)
+        self.assertEqual([method], interceptor.methods)
+
+    async def test_registering_after_start_is_ignored(self):
+        await self._start_server()
+        self._server.add_registered_method_handlers(
+            "test.LateService", _REGISTERED_METHOD_HANDLERS
+        )
+        with self.assertRaises(aio.AioRpcError) as exception_context:
+            await self._channel.unary_unary(
+                grpc._common.fully_qualified_method(
+                    "test.LateService", _REGISTERED_UNARY_UNARY
+                )
+            )(_REQUEST)
+        self.assertEqual(
+            grpc.StatusCode.UNIMPLEMENTED, exception_context.exception.code()
+        )
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
     unittest.main(verbosity=2)
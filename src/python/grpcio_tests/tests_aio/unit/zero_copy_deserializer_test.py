@@ -0,0 +1,128 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests AioRpc deserializers that receive messages as memoryviews."""
+
+import logging
+import unittest
+
+import grpc
+from grpc import experimental
+from grpc.experimental import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_UNARY_UNARY = "/test/UnaryUnary"
+_STREAM_UNARY = "/test/StreamUnary"
+_STREAM_STREAM = "/test/StreamStream"
+
+_SMALL_MESSAGE = b"\x07" * 16
+_LARGE_MESSAGE = bytes(range(256)) * 4096
+
+
+def _readonly_memoryview_to_bytes(message):
+    if not isinstance(message, memoryview) or not message.readonly:
+        raise ValueError("Expected a read-only memoryview!")
+    return message.tobytes()
+
+
+_DESERIALIZER = experimental.zero_copy_deserializer(
+    _readonly_memoryview_to_bytes
+)
+
+
+async def _unary_unary(request, unused_context):
+    return request
+
+
+async def _stream_unary(request_iterator, unused_context):
+    return b"".join([request async for request in request_iterator])
+
+
+async def _stream_stream(unused_request_iterator, context):
+    while True:
+        request = await context.read()
+        if request is aio.EOF:
+            break
+        await context.write(request)
+
+
+_ROUTING_TABLE = {
+    _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+        _unary_unary, request_deserializer=_DESERIALIZER
+    ),
+    _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+        _stream_unary, request_deserializer=_DESERIALIZER
+    ),
+    _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+        _stream_stream, request_deserializer=_DESERIALIZER
+    ),
+}
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+    def service(self, handler_call_details):
+        return _ROUTING_TABLE.get(handler_call_details.method)
+
+
+class TestZeroCopyDeserializer(AioTestBase):
+    async def setUp(self):
+        self._server = aio.server()
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        await self._server.start()
+        self._channel = aio.insecure_channel(f"localhost:{port}")
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_unary_unary(self):
+        multicallable = self._channel.unary_unary(
+            _UNARY_UNARY, response_deserializer=_DESERIALIZER
+        )
+        for message in (b"", _SMALL_MESSAGE, _LARGE_MESSAGE):
+            self.assertEqual(message, await multicallable(message))
+
+    async def test_unary_unary_compressed(self):
+        multicallable = self._channel.unary_unary(
+            _UNARY_UNARY, response_deserializer=_DESERIALIZER
+        )
+        response = await multicallable(
+            _LARGE_MESSAGE, compression=grpc.Compression.Deflate
+        )
+        self.assertEqual(_LARGE_MESSAGE, response)
+
+    async def test_stream_unary(self):
+        call = self._channel.stream_unary(
+            _STREAM_UNARY, response_deserializer=_DESERIALIZER
+        )()
+        await call.write(_LARGE_MESSAGE)
+        await call.write(_SMALL_MESSAGE)
+        await call.done_writing()
+        self.assertEqual(_LARGE_MESSAGE + _SMALL_MESSAGE, await call)
+
+    async def test_stream_stream(self):
+        call = self._channel.stream_stream(
+            _STREAM_STREAM, response_deserializer=_DESERIALIZER
+        )()
+        for message in (_LARGE_MESSAGE, _SMALL_MESSAGE):
+            await call.write(message)
+            self.assertEqual(message, await call.read())
+        await call.done_writing()
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)